@@ -0,0 +1,151 @@
+import json
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+from fred.settings import logger_manager
+from fred.dao.settings import (
+    FRD_KEYVAL_CACHE_SIZE,
+    FRD_KEYVAL_CACHE_TTL,
+)
+
+logger = logger_manager.get_logger(name=__name__)
+
+
+class FredKeyValCache:
+    """Thread-safe client-side cache for key-value reads with bounded size, per-entry TTL, and LRU eviction.
+    The values are either plain values (e.g., 'get') or records (i.e., dictionaries of hash fields); records
+    are merged as more fields are read. Entries are only stored when the 'cacheable' predicate accepts them
+    (e.g., immutable records), and can be invalidated locally or through a pub/sub channel (see 'listen').
+    Args:
+        maxsize (int): Maximum number of entries; the least recently used entries are evicted first.
+        ttl (Optional[float]): Default time-to-live (in seconds) of the entries; None means no expiration.
+        cacheable (Optional[Callable[[str, Any], bool]]): Predicate on (key, value) deciding whether to store a value.
+    """
+
+    def __init__(
+            self,
+            maxsize: int = FRD_KEYVAL_CACHE_SIZE,
+            ttl: Optional[float] = FRD_KEYVAL_CACHE_TTL,
+            cacheable: Optional[Callable[[str, Any], bool]] = None,
+    ):
+        self.maxsize = max(1, maxsize)
+        self.ttl = ttl
+        self.cacheable = cacheable
+        self.channel: Optional[str] = None
+        self.hits = self.misses = self.evictions = self.expirations = self.invalidations = 0
+        self._entries: OrderedDict[str, tuple[Optional[float], Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._subscription = None
+        self._dropped = 0
+
+    def lookup(self, key: str, fields: Optional[tuple[str, ...]] = None) -> tuple[bool, Any]:
+        """Returns whether the key was found (i.e., a hit) and its value; when fields are provided, the
+        cached value must be a record holding every field (partially cached records count as a miss)."""
+        self._drain()
+        with self._lock:
+            match self._entries.get(key):
+                case None:
+                    self.misses += 1
+                    return False, None
+                case (expires_at, _) if expires_at is not None and expires_at <= time.monotonic():
+                    # Lazy expiration
+                    del self._entries[key]
+                    self.expirations += 1
+                    self.misses += 1
+                    return False, None
+                case (_, value) if fields is not None and not (isinstance(value, dict) and value.keys() >= set(fields)):
+                    self.misses += 1
+                    return False, None
+                case (_, value):
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, value
+
+    def peek(self, key: str) -> Any:
+        """Returns the (non-expired) cached value without updating the metrics or the recency; None if missing."""
+        with self._lock:
+            match self._entries.get(key):
+                case (expires_at, value) if expires_at is None or expires_at > time.monotonic():
+                    return value
+                case _:
+                    return None
+
+    def store(self, key: str, value: Any, ttl: Optional[float] = None) -> bool:
+        """Stores the value (if not None and accepted by the 'cacheable' predicate); returns True if stored."""
+        if value is None or (self.cacheable is not None and not self.cacheable(key, value)):
+            return False
+        ttl = self.ttl if ttl is None else ttl
+        with self._lock:
+            self._entries[key] = (None if ttl is None else time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return True
+
+    def merge(self, key: str, fields: dict[str, Optional[str]], ttl: Optional[float] = None) -> bool:
+        """Merges the read fields (ignoring missing ones) into the cached record of the key."""
+        record = {**(self.peek(key) or {}), **{field: value for field, value in fields.items() if value is not None}}
+        return self.store(key=key, value=record, ttl=ttl) if record else False
+
+    def invalidate(self, *keys: str) -> None:
+        with self._lock:
+            for key in keys:
+                if self._entries.pop(key, None) is not None:
+                    self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def listen(self, subscription: Any, channel: str) -> None:
+        """Invalidates the keys announced on the pub/sub channel (i.e., writes of other processes).
+        The messages (JSON lists of keys) are drained from the subscription on every lookup; thus,
+        no additional thread is required. If the (bounded) subscription buffer overflows, the dropped
+        invalidations are unknown and the whole cache is cleared.
+        """
+        self._subscription, self.channel = subscription, channel
+        self._dropped = getattr(subscription, "dropped", 0)
+
+    def close(self) -> None:
+        """Stops listening to the invalidation channel (i.e., closes the subscription) and clears the cache."""
+        if (subscription := self._subscription) is not None:
+            self._subscription, self.channel = None, None
+            subscription.close()
+        self.clear()
+
+    def announcement(self, *keys: str) -> dict[str, str]:
+        """Returns the publish mapping (channel-message) announcing the invalidation of the keys (if listening)."""
+        return {self.channel: json.dumps(list(keys))} if self.channel and keys else {}
+
+    def _drain(self) -> None:
+        if (subscription := self._subscription) is None:
+            return
+        while (message := subscription.get(timeout=0)) is not None:
+            if message.get("type") != "message":
+                continue
+            try:
+                self.invalidate(*json.loads(message.get("data") or "[]"))
+            except (TypeError, ValueError) as e:
+                logger.warning(f"Ignoring malformed cache invalidation message on '{self.channel}': {e}")
+        if (dropped := getattr(subscription, "dropped", 0)) != self._dropped:
+            # Some invalidations were lost (i.e., any entry could be stale)
+            logger.warning(f"Cache invalidations dropped on '{self.channel}'; clearing the cache.")
+            self._dropped = dropped
+            self.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
@@ -1,9 +1,10 @@
 from dataclasses import dataclass
-from typing import Iterator, Optional
+from typing import Any, ClassVar, Iterator, Optional
 
 from fred.settings import logger_manager, get_environ_variable
 from fred.dao.service.catalog import ServiceCatalog
 from fred.dao.comp.interface import ComponentInterface
+from fred.dao.comp._cache import FredKeyValCache
 
 logger = logger_manager.get_logger(name=__name__)
 
@@ -39,8 +40,49 @@ class FredKeyVal(ComponentInterface):
     This class provides methods to interact with a key-value store, such as setting,
     getting, and deleting key-value pairs. The actual implementation of these methods
     depends on the underlying service being used (e.g., Redis).
+    Reads can be served from an optional client-side cache (see 'with_cache').
     """
     key: str
+    _cache: ClassVar[Optional[FredKeyValCache]] = None
+
+    @classmethod
+    def with_cache(
+            cls,
+            cache: Optional[FredKeyValCache] = None,
+            invalidation_channel: Optional[str] = None,
+            **kwargs,
+        ) -> type["FredKeyVal"]:
+        """Returns a derived (mounted) component class whose reads go through a client-side cache.
+        The 'get', 'hmget', 'mget' and 'hmget_many' reads (and their async counterparts) are served
+        from the cache when possible; the writes of the component invalidate the written keys. Other
+        writers are covered by the entries TTL or, optionally, by an invalidation channel: the writes
+        announce the written keys on the channel (within the same pipeline when possible) and every
+        cache listening to it drops them.
+        Args:
+            cache (Optional[FredKeyValCache]): The cache to use; a new one is created from the kwargs otherwise.
+            invalidation_channel (Optional[str]): Pub/sub channel used to announce and receive invalidations;
+                the subscription is closed along with the cache (see 'FredKeyValCache.close').
+            **kwargs: Arguments of the new cache (e.g., 'maxsize', 'ttl', or a 'cacheable' predicate).
+        Returns:
+            type[FredKeyVal]: The derived component class.
+        """
+        cache = cache or FredKeyValCache(**kwargs)
+        if invalidation_channel:
+            from fred.dao.comp.catalog import CompCatalog
+            subscription = CompCatalog.PUBSUB.mount(srv_ref=cls._srv)(name=invalidation_channel).subscription()
+            subscription.wait_ready(timeout=5)
+            cache.listen(subscription=subscription, channel=invalidation_channel)
+        return type(f"{cls.__name__}Cached", (cls,), {"_cache": cache})
+
+    @classmethod
+    def _announce(cls, *keys: str) -> dict[str, str]:
+        # Publish mapping announcing the written keys to the caches of other processes (if any)
+        return cls._cache.announcement(*keys) if cls._cache is not None else {}
+
+    @classmethod
+    def _invalidate(cls, *keys: str) -> None:
+        if cls._cache is not None:
+            cls._cache.invalidate(*keys)
     
     @classmethod
     def keys(cls, pattern: Optional[str] = None, **kwargs) -> Iterator[str]:
@@ -109,15 +151,13 @@ class FredKeyVal(ComponentInterface):
         key = key or self.key
         match self._cat:
             case ServiceCatalog.REDIS:
-                self._srv.client.set(key, value)
-                expire = kwargs.get("expire")
-                if expire and isinstance(expire, int):
-                    self._srv.client.expire(key, expire)
+                # The EX option applies the expiration atomically (i.e., no additional EXPIRE round-trip)
+                expire = kwargs.pop("expire", None)
+                self._srv.client.set(key, value, ex=expire if isinstance(expire, int) and expire else None)
             case ServiceCatalog.STDLIB:
-                self._srv.client._memstore_keyval[key] = value
-                # TODO: Implement expiration logic
-                if "expire" in kwargs:
-                    logger.warning("Expiration not implemented for STDLIB service.")
+                expire = kwargs.pop("expire", None)
+                memstore = self._srv.client._memstore_keyval
+                memstore.set(key, value, expire=expire if isinstance(expire, int) and expire else None)
             case ServiceCatalog.MINIO:
                 # MinIO is not a key-value store, but we can simulate it:
                 # the key will be the object name, and the value will be the object content.
@@ -147,6 +187,9 @@ class FredKeyVal(ComponentInterface):
                 )
             case _:
                 raise NotImplementedError(f"Set method not implemented for service {self._nme}")
+        self._invalidate(key)
+        if (announcement := self._announce(key)):
+            self._publish_many(publish=announcement)
         if kwargs:
             logger.warning(f"Additional kwargs ignored: {kwargs}")
 
@@ -166,6 +209,8 @@ class FredKeyVal(ComponentInterface):
             NotImplementedError: If the method is not implemented for the current service.
         """
         key = key or self.key
+        if self._cache is not None and (cached := self._cache.lookup(key))[0]:
+            return cached[1]
         result = None
         match self._cat:
             case ServiceCatalog.REDIS:
@@ -213,6 +258,8 @@ class FredKeyVal(ComponentInterface):
             raise KeyError(f"Key {key} not found.")
         if kwargs:
             logger.warning(f"Additional kwargs ignored: {kwargs}")
+        if self._cache is not None:
+            self._cache.store(key, result)
         return result
 
     def delete(self, key: Optional[str] = None) -> None:
@@ -247,3 +294,355 @@ class FredKeyVal(ComponentInterface):
                     logger.error(f"Error deleting object {object_name} from bucket {bucket_name}: {e}")
             case _:
                 raise NotImplementedError(f"Delete method not implemented for service {self._nme}")
+        self._invalidate(key)
+        if (announcement := self._announce(key)):
+            self._publish_many(publish=announcement)
+
+    @classmethod
+    def set_many(
+            cls,
+            mapping: dict[str, str],
+            expire: Optional[int] = None,
+            publish: Optional[dict[str, str]] = None,
+        ) -> None:
+        """Sets multiple key-value pairs in the store as a single batch.
+        The implementation of this method depends on the underlying service.
+        For example, if the service is Redis, it uses a MULTI/EXEC pipeline with one
+        'SET ... EX' command per key (plus the optional PUBLISH commands) so that the
+        whole batch is applied atomically in a single round-trip.
+        Args:
+            mapping (dict[str, str]): The key-value pairs to set.
+            expire (Optional[int]): Expiration time (in seconds) applied to every key.
+            publish (Optional[dict[str, str]]): Optional channel-message pairs to publish
+                after the keys have been set (e.g., to notify subscribers about the new values).
+        Raises:
+            NotImplementedError: If the method is not implemented for the current service.
+        """
+        publish = {**(publish or {}), **cls._announce(*mapping)}
+        match cls._cat:
+            case ServiceCatalog.REDIS:
+                pipe = cls._srv.client.pipeline(transaction=True)
+                for key, value in mapping.items():
+                    pipe.set(key, value, ex=expire if isinstance(expire, int) and expire else None)
+                for channel, item in publish.items():
+                    pipe.publish(channel, item)
+                pipe.execute()
+                cls._invalidate(*mapping)
+                return
+            case ServiceCatalog.STDLIB:
+                memstore = cls._srv.client._memstore_keyval
+                for key, value in mapping.items():
+                    memstore.set(key, value, expire=expire if isinstance(expire, int) and expire else None)
+            case _:
+                options: dict[str, Any] = {"expire": expire} if expire else {}
+                for key, value in mapping.items():
+                    cls(key=key).set(value=value, **options)
+        cls._invalidate(*mapping)
+        if publish:
+            cls._publish_many(publish=publish)
+
+    @classmethod
+    def _publish_many(cls, publish: dict[str, str]) -> None:
+        # Services without pipelined publishing use the pub/sub component mounted on the same service instance
+        from fred.dao.comp.catalog import CompCatalog
+        pubsub = CompCatalog.PUBSUB.mount(srv_ref=cls._srv)
+        for channel, item in publish.items():
+            pubsub(name=channel).publish(item=item)
+
+    def hset(
+            self,
+            mapping: dict[str, str],
+            key: Optional[str] = None,
+            expire: Optional[int] = None,
+            publish: Optional[dict[str, str]] = None,
+        ) -> None:
+        """Sets multiple fields of a hash (i.e., a record stored under a single key).
+        The implementation of this method depends on the underlying service.
+        For example, if the service is Redis, it uses a MULTI/EXEC pipeline with the HSET
+        and EXPIRE commands (plus the optional PUBLISH commands) in a single round-trip.
+        Args:
+            mapping (dict[str, str]): The field-value pairs to set.
+            key (str): The key of the hash.
+            expire (Optional[int]): Expiration time (in seconds) applied to the whole hash.
+            publish (Optional[dict[str, str]]): Optional channel-message pairs to publish
+                after the fields have been set.
+        Raises:
+            NotImplementedError: If the method is not implemented for the current service.
+        """
+        key = key or self.key
+        publish = {**(publish or {}), **self._announce(key)}
+        match self._cat:
+            case ServiceCatalog.REDIS:
+                pipe = self._srv.client.pipeline(transaction=True)
+                pipe.hset(key, mapping=mapping)
+                if isinstance(expire, int) and expire:
+                    pipe.expire(key, expire)
+                for channel, item in publish.items():
+                    pipe.publish(channel, item)
+                pipe.execute()
+                self._invalidate(key)
+                return
+            case ServiceCatalog.STDLIB:
+                # Records are stored as (copy-on-write) dictionaries to keep the reads consistent
+                memstore = self._srv.client._memstore_keyval
+                # As HSET, the previous expiration is kept unless a new one is provided
+                memstore.set(
+                    key,
+                    {**memstore.get(key, {}), **mapping},
+                    expire=expire if isinstance(expire, int) and expire else None,
+                    keepttl=True,
+                )
+            case _:
+                raise NotImplementedError(f"Hset method not implemented for service {self._nme}")
+        self._invalidate(key)
+        if publish:
+            self._publish_many(publish=publish)
+
+    def hmget(self, *fields: str, key: Optional[str] = None) -> list[Optional[str]]:
+        """Gets the values of multiple fields of a hash in a single (atomic) read.
+        Args:
+            *fields (str): The fields to retrieve.
+            key (str): The key of the hash.
+        Returns:
+            list[Optional[str]]: The values of the fields (None for missing fields) in the same order.
+        Raises:
+            NotImplementedError: If the method is not implemented for the current service.
+        """
+        key = key or self.key
+        if self._cache is not None and (cached := self._cache.lookup(key, fields=fields))[0]:
+            return [cached[1][field] for field in fields]
+        match self._cat:
+            case ServiceCatalog.REDIS:
+                values = self._srv.client.hmget(key, list(fields))
+            case ServiceCatalog.STDLIB:
+                record = self._srv.client._memstore_keyval.get(key) or {}
+                values = [record.get(field) for field in fields]
+            case _:
+                raise NotImplementedError(f"Hmget method not implemented for service {self._nme}")
+        if self._cache is not None:
+            self._cache.merge(key, dict(zip(fields, values)))
+        return values
+
+    @classmethod
+    def mget(cls, keys: list[str]) -> list[Optional[str]]:
+        """Gets the values of multiple keys in a single round-trip.
+        The implementation of this method depends on the underlying service.
+        For example, if the service is Redis, it uses the MGET command.
+        Args:
+            keys (list[str]): The keys to retrieve.
+        Returns:
+            list[Optional[str]]: The values (None for missing keys) in the same order.
+        """
+        if not keys:
+            return []
+        if cls._cache is not None:
+            # Only the missing keys are read from the backend (still in a single round-trip)
+            cached = {}
+            for key in keys:
+                hit, value = cls._cache.lookup(key)
+                if hit:
+                    cached[key] = value
+            if (missing := [key for key in dict.fromkeys(keys) if key not in cached]):
+                for key, value in zip(missing, cls._mget(missing)):
+                    cls._cache.store(key, value)
+                    cached[key] = value
+            return [cached[key] for key in keys]
+        return cls._mget(keys)
+
+    @classmethod
+    def _mget(cls, keys: list[str]) -> list[Optional[str]]:
+        match cls._cat:
+            case ServiceCatalog.REDIS:
+                return cls._srv.client.mget(keys)
+            case ServiceCatalog.STDLIB:
+                memstore = cls._srv.client._memstore_keyval
+                return [memstore.get(key) for key in keys]
+            case _:
+                return [cls(key=key).get() for key in keys]
+
+    @classmethod
+    def hmget_many(cls, keys: list[str], *fields: str) -> list[list[Optional[str]]]:
+        """Gets the same fields of multiple hashes in a single round-trip (i.e., a pipeline of HMGET commands on Redis).
+        Args:
+            keys (list[str]): The keys of the hashes.
+            *fields (str): The fields to retrieve from every hash.
+        Returns:
+            list[list[Optional[str]]]: The field values of each hash (None for missing fields) in the same order.
+        Raises:
+            NotImplementedError: If the method is not implemented for the current service.
+        """
+        if not keys:
+            return []
+        if cls._cache is not None:
+            cached = {}
+            for key in keys:
+                hit, record = cls._cache.lookup(key, fields=fields)
+                if hit:
+                    cached[key] = [record[field] for field in fields]
+            if (missing := [key for key in dict.fromkeys(keys) if key not in cached]):
+                for key, values in zip(missing, cls._hmget_many(missing, *fields)):
+                    cls._cache.merge(key, dict(zip(fields, values)))
+                    cached[key] = values
+            return [cached[key] for key in keys]
+        return cls._hmget_many(keys, *fields)
+
+    @classmethod
+    def _hmget_many(cls, keys: list[str], *fields: str) -> list[list[Optional[str]]]:
+        match cls._cat:
+            case ServiceCatalog.REDIS:
+                with cls._srv.client.pipeline(transaction=False) as pipe:
+                    for key in keys:
+                        pipe.hmget(key, list(fields))
+                    return pipe.execute()
+            case ServiceCatalog.STDLIB:
+                memstore = cls._srv.client._memstore_keyval
+                return [[(memstore.get(key) or {}).get(field) for field in fields] for key in keys]
+            case _:
+                raise NotImplementedError(f"Hmget-many method not implemented for service {cls._cat.name}")
+
+    def hget(self, field: str, key: Optional[str] = None) -> Optional[str]:
+        """Gets the value of a single field of a hash (e.g., status-only reads of a larger record).
+        Args:
+            field (str): The field to retrieve.
+            key (str): The key of the hash.
+        Returns:
+            Optional[str]: The value of the field or None if either the hash or the field does not exist.
+        """
+        value, = self.hmget(field, key=key)
+        return value
+
+    def hgetall(self, key: Optional[str] = None) -> dict[str, str]:
+        """Gets all the fields of a hash.
+        Args:
+            key (str): The key of the hash.
+        Returns:
+            dict[str, str]: The field-value pairs of the hash; empty if the hash does not exist.
+        Raises:
+            NotImplementedError: If the method is not implemented for the current service.
+        """
+        key = key or self.key
+        match self._cat:
+            case ServiceCatalog.REDIS:
+                return self._srv.client.hgetall(key)
+            case ServiceCatalog.STDLIB:
+                return dict(self._srv.client._memstore_keyval.get(key) or {})
+            case _:
+                raise NotImplementedError(f"Hgetall method not implemented for service {self._nme}")
+
+    def ttl(self, key: Optional[str] = None) -> Optional[float]:
+        """Gets the remaining time-to-live (in seconds) of a key.
+        Args:
+            key (str): The key to inspect.
+        Returns:
+            Optional[float]: The remaining seconds, or None if the key does not exist or has no expiration.
+        Raises:
+            NotImplementedError: If the method is not implemented for the current service.
+        """
+        key = key or self.key
+        match self._cat:
+            case ServiceCatalog.REDIS:
+                # Negative values flag either a missing key (-2) or a key without expiration (-1)
+                result = self._srv.client.ttl(key)
+                return None if result < 0 else float(result)
+            case ServiceCatalog.STDLIB:
+                return self._srv.client._memstore_keyval.ttl(key)
+            case _:
+                raise NotImplementedError(f"TTL method not implemented for service {self._nme}")
+
+    @classmethod
+    def stats(cls) -> dict:
+        """Gets the size and memory usage of the underlying store.
+        Returns:
+            dict: The number of keys and the used memory (in bytes); the STDLIB service also reports the
+                  number of keys with expiration and the expired/evicted counters.
+        Raises:
+            NotImplementedError: If the method is not implemented for the current service.
+        """
+        match cls._cat:
+            case ServiceCatalog.REDIS:
+                return {
+                    "keys": cls._srv.client.dbsize(),
+                    "memory_bytes": cls._srv.client.info("memory").get("used_memory"),
+                }
+            case ServiceCatalog.STDLIB:
+                return cls._srv.client._memstore_keyval.stats()
+            case _:
+                raise NotImplementedError(f"Stats method not implemented for service {cls._srv.__class__.__name__}")
+
+    async def aset(self, value: str, key: Optional[str] = None, **kwargs) -> None:
+        """Asyncio counterpart of the 'set' method.
+        Uses the native async client when the service provides one (e.g., Redis) and
+        offloads the blocking implementation into a worker thread otherwise.
+        Args:
+            key (str): The key to set.
+            value (str): The value to associate with the key.
+            **kwargs: Additional keyword arguments for setting the key-value pair,
+                      such as expiration time.
+        """
+        key = key or self.key
+        match self._cat:
+            case ServiceCatalog.REDIS:
+                expire = kwargs.pop("expire", None)
+                await self._srv.aclient.set(key, value, ex=expire if isinstance(expire, int) and expire else None)
+                if kwargs:
+                    logger.warning(f"Additional kwargs ignored: {kwargs}")
+            case ServiceCatalog.STDLIB:
+                self.set(value=value, key=key, **kwargs)
+            case _:
+                import asyncio
+                await asyncio.to_thread(self.set, value, key, **kwargs)
+
+    async def aget(self, key: Optional[str] = None, fail: bool = False, **kwargs) -> Optional[str]:
+        """Asyncio counterpart of the 'get' method.
+        Uses the native async client when the service provides one (e.g., Redis) and
+        offloads the blocking implementation into a worker thread otherwise.
+        Args:
+            key (str): The key to retrieve.
+            fail (bool): If True, raises a KeyError if the key is not found. Defaults to False.
+        Returns:
+            Optional[str]: The value associated with the key, or None if the key is not found
+                           and fail is False.
+        Raises:
+            KeyError: If the key is not found and fail is True.
+        """
+        key = key or self.key
+        if self._cache is not None and (cached := self._cache.lookup(key))[0]:
+            return cached[1]
+        match self._cat:
+            case ServiceCatalog.REDIS:
+                result = await self._srv.aclient.get(key)
+            case ServiceCatalog.STDLIB:
+                return self.get(key=key, fail=fail, **kwargs)
+            case _:
+                import asyncio
+                return await asyncio.to_thread(self.get, key, fail, **kwargs)
+        if fail and result is None:
+            raise KeyError(f"Key {key} not found.")
+        if kwargs:
+            logger.warning(f"Additional kwargs ignored: {kwargs}")
+        if self._cache is not None:
+            self._cache.store(key, result)
+        return result
+
+    async def ahmget(self, *fields: str, key: Optional[str] = None) -> list[Optional[str]]:
+        """Asyncio counterpart of the 'hmget' method.
+        Args:
+            *fields (str): The fields to retrieve.
+            key (str): The key of the hash.
+        Returns:
+            list[Optional[str]]: The values of the fields (None for missing fields) in the same order.
+        """
+        key = key or self.key
+        match self._cat:
+            case ServiceCatalog.REDIS:
+                if self._cache is not None and (cached := self._cache.lookup(key, fields=fields))[0]:
+                    return [cached[1][field] for field in fields]
+                values = await self._srv.aclient.hmget(key, list(fields))
+                if self._cache is not None:
+                    self._cache.merge(key, dict(zip(fields, values)))
+                return values
+            case ServiceCatalog.STDLIB:
+                return self.hmget(*fields, key=key)
+            case _:
+                import asyncio
+                return await asyncio.to_thread(self.hmget, *fields, key=key)
@@ -1,18 +1,271 @@
 import uuid
+import asyncio
+import threading
+import time
+from collections import deque
+from queue import Queue, SimpleQueue, Empty, Full
 from dataclasses import dataclass
-from typing import Optional
+from functools import partial
+from typing import Any, Callable, Iterator, AsyncIterator, Optional
 
 from fred.settings import logger_manager
+from fred.dao.settings import FRD_PUBSUB_BUFFER_SIZE, FRD_PUBSUB_LISTEN_INTERVAL
 from fred.dao.service.catalog import ServiceCatalog
 from fred.dao.comp.interface import ComponentInterface
 
 logger = logger_manager.get_logger(name=__name__)
 
 
+class FredSubscription:
+    """A waiter registered into the subscription multiplexer for one or more channels.
+    The messages are delivered by the multiplexer listener into a bounded buffer; synchronous
+    waiters use a thread-safe queue while asyncio waiters (i.e., created with a running loop)
+    get the messages scheduled into an asyncio queue of their own event loop.
+    """
+
+    def __init__(
+            self,
+            multiplexer: "FredSubscriptionMultiplexer",
+            channels: list[str],
+            subscription_id: str,
+            loop: Optional[asyncio.AbstractEventLoop] = None,
+    ):
+        self.multiplexer = multiplexer
+        self.channels = set(channels)
+        self.subscription_id = subscription_id
+        self.loop = loop
+        self.closed = False
+        self.dropped = 0  # Messages dropped because of a full buffer (e.g., the waiter does not keep up)
+        # Either buffer is used depending on the waiter kind (i.e., synchronous or asyncio)
+        self._queue: Queue = Queue(maxsize=FRD_PUBSUB_BUFFER_SIZE)
+        self._aqueue: asyncio.Queue = asyncio.Queue()
+        # Messages received by asyncio waiters while awaiting the subscription confirmation
+        self._early: list[dict] = []
+
+    def _deliver(self, message: Optional[dict]) -> None:
+        # A 'None' message signals the waiter that the subscription was closed
+        if self.loop:
+            try:
+                self.loop.call_soon_threadsafe(self._aqueue.put_nowait, message)
+            except RuntimeError:
+                # The event loop of the waiter is closed; nobody is listening anymore
+                self.multiplexer._unregister(subscription=self)
+            return
+        try:
+            self._queue.put_nowait(message)
+        except Full:
+            self.dropped += 1
+            logger.warning(f"Subscription '{self.subscription_id}' buffer is full; dropping message.")
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """Waits until the backend confirmed the channel subscriptions (i.e., the messages published from now on
+        are delivered)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for channel in list(self.channels):
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+            if not self.multiplexer._ready_event(channel=channel).wait(timeout=remaining):
+                return False
+        return True
+
+    async def await_ready(self, timeout: Optional[float] = None) -> bool:
+        """Asyncio counterpart of the 'wait_ready' method (for waiters created with an event loop)."""
+        pending = {channel for channel in self.channels if not self.multiplexer._ready_event(channel=channel).is_set()}
+        try:
+            async with asyncio.timeout(timeout):
+                # The multiplexer forwards the subscription confirmations to the asyncio waiters
+                while pending and (message := await self._aqueue.get()) is not None:
+                    if message.get("type") == "subscribe":
+                        pending.discard(message.get("channel"))
+                    else:
+                        self._early.append(message)
+        except TimeoutError:
+            pass
+        return not pending
+
+    def get(self, timeout: Optional[float] = None) -> Optional[dict]:
+        """Returns the next message; waits up to 'timeout' seconds (forever if None)."""
+        try:
+            return self._queue.get(timeout=timeout)
+        except Empty:
+            return None
+
+    def listen(self, timeout: Optional[float] = None) -> Iterator[dict]:
+        """Yields the messages until the subscription is closed (or no message arrives within 'timeout' seconds)."""
+        while not self.closed and (message := self.get(timeout=timeout)) is not None:
+            yield message
+
+    async def alisten(self, timeout: Optional[float] = None) -> AsyncIterator[dict]:
+        """Asyncio counterpart of the 'listen' method."""
+        while self._early:
+            yield self._early.pop(0)
+        while not self.closed:
+            try:
+                message = await asyncio.wait_for(self._aqueue.get(), timeout=timeout)
+            except asyncio.TimeoutError:
+                return
+            if message is None:
+                return
+            if message.get("type") == "message":
+                yield message
+
+    def remove(self, *channels: str) -> None:
+        """Stops receiving the messages of the given channels (e.g., the awaited message was received)."""
+        self.multiplexer._unregister(subscription=self, channels=list(self.channels.intersection(channels)))
+        self.channels.difference_update(channels)
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        self.multiplexer._unregister(subscription=self)
+        self._deliver(None)
+
+
+class FredSubscriptionMultiplexer:
+    """Shares a single pub/sub connection among every subscription of the process.
+    Channels are subscribed when their first waiter registers and unsubscribed when the
+    last one leaves; a daemon listener thread reads the connection and dispatches the
+    messages to the waiters of each channel. The connection (e.g., a redis-py PubSub, which
+    is not thread-safe) is only used by the listener thread: the SUBSCRIBE and UNSUBSCRIBE
+    commands are queued and sent by the listener between reads; thus, registering a waiter
+    never blocks on the network (e.g., when called from an event loop).
+    Args:
+        connect (Callable): Factory of the underlying pub/sub connection (e.g., 'client.pubsub').
+    """
+
+    def __init__(self, connect: Callable):
+        self._connect = connect
+        self._lock = threading.Lock()
+        self._listener: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+        self._commands: SimpleQueue[tuple[str, list[str]]] = SimpleQueue()
+        self._waiters: dict[str, set[FredSubscription]] = {}
+        self._ready: dict[str, threading.Event] = {}
+
+    def _ready_event(self, channel: str) -> threading.Event:
+        with self._lock:
+            return self._ready.setdefault(channel, threading.Event())
+
+    def subscribe(
+            self,
+            channels: list[str],
+            subscription_id: Optional[str] = None,
+            loop: Optional[asyncio.AbstractEventLoop] = None,
+    ) -> FredSubscription:
+        subscription = FredSubscription(
+            multiplexer=self,
+            channels=channels,
+            subscription_id=subscription_id or str(uuid.uuid4()),
+            loop=loop,
+        )
+        with self._lock:
+            new_channels = []
+            for channel in subscription.channels:
+                waiters = self._waiters.setdefault(channel, set())
+                waiters.add(subscription)
+                if len(waiters) == 1:
+                    self._ready.setdefault(channel, threading.Event())
+                    new_channels.append(channel)
+            if self._listener is None or not self._listener.is_alive():
+                # A new connection (and listener) subscribes to every channel with waiters
+                self._stopped, self._commands = threading.Event(), SimpleQueue()
+                self._commands.put(("subscribe", list(self._waiters)))
+                self._listener = threading.Thread(
+                    target=self._listen,
+                    args=(self._connect(), self._commands, self._stopped),
+                    name="frd-pubsub-multiplexer",
+                    daemon=True,
+                )
+                self._listener.start()
+            elif new_channels:
+                # A single SUBSCRIBE command for every new channel
+                self._commands.put(("subscribe", new_channels))
+        return subscription
+
+    def _unregister(self, subscription: FredSubscription, channels: Optional[list[str]] = None) -> None:
+        released = []
+        with self._lock:
+            for channel in (subscription.channels if channels is None else channels):
+                if (waiters := self._waiters.get(channel)) is None or subscription not in waiters:
+                    continue
+                waiters.discard(subscription)
+                if waiters:
+                    continue
+                self._waiters.pop(channel, None)
+                self._ready.pop(channel, None)
+                released.append(channel)
+            if released:
+                self._commands.put(("unsubscribe", released))
+
+    def channels(self) -> list[str]:
+        with self._lock:
+            return list(self._waiters)
+
+    def subscriptions(self) -> list[FredSubscription]:
+        with self._lock:
+            return [subscription for waiters in self._waiters.values() for subscription in waiters]
+
+    def _dispatch(self, message: dict) -> None:
+        channel = message.get("channel", "")
+        match message.get("type"):
+            case "subscribe":
+                with self._lock:
+                    if (event := self._ready.get(channel)):
+                        event.set()
+                    waiters = [subscription for subscription in self._waiters.get(channel, ()) if subscription.loop]
+                # Asyncio waiters cannot block on the threading event; they get the confirmation instead
+                for subscription in waiters:
+                    subscription._deliver(message)
+            case "message":
+                with self._lock:
+                    waiters = list(self._waiters.get(channel, ()))
+                for subscription in waiters:
+                    subscription._deliver(message)
+            case _:
+                pass
+
+    def _listen(self, pubsub: Any, commands: SimpleQueue, stopped: threading.Event) -> None:
+        # The only thread using the connection; the commands are kept until sent (e.g., retried after errors)
+        backlog: deque[tuple[str, list[str]]] = deque()
+        try:
+            while not stopped.is_set():
+                try:
+                    while True:
+                        backlog.append(commands.get_nowait())
+                except Empty:
+                    pass
+                try:
+                    while backlog:
+                        command, channels = backlog[0]
+                        if channels:
+                            getattr(pubsub, command)(*channels)
+                        backlog.popleft()
+                    message = pubsub.get_message(timeout=FRD_PUBSUB_LISTEN_INTERVAL)
+                except Exception as e:
+                    # The connection is re-established (and the channels re-subscribed) on the next read
+                    logger.error(f"Error reading from the pub/sub connection: {e}")
+                    time.sleep(1.0)
+                    continue
+                if message:
+                    self._dispatch(message)
+        finally:
+            pubsub.close()
+
+    def close(self) -> None:
+        """Closes every subscription along with the shared connection (closed by the listener thread)."""
+        for subscription in self.subscriptions():
+            subscription.close()
+        with self._lock:
+            self._stopped.set()
+            self._listener = None
+
+
 class FredSubscriptionMixin:
-    # TODO: Improve typing... and better underlying subscriptions management!
-    # This only works within the same python process.
-    subs: dict = {}
+    # Active subscriptions by ID and the multiplexer of each service instance (i.e., one
+    # pub/sub connection per service); this only works within the same python process.
+    subs: dict[str, FredSubscription] = {}
+    multiplexers: dict[object, FredSubscriptionMultiplexer] = {}
+    _multiplexers_lock = threading.Lock()
 
 
 @dataclass(frozen=True, slots=True)
@@ -21,6 +274,8 @@ class FredPubSub(ComponentInterface, FredSubscriptionMixin):
     This class provides methods to interact with pub-sub channels, such as publishing
     messages, subscribing to channels, and managing subscriptions. The actual implementation
     of these methods depends on the underlying service being used (e.g., Redis).
+    The subscriptions share a single pub/sub connection per service instance (see the
+    FredSubscriptionMultiplexer) instead of opening a connection per subscriber.
     Attributes:
         name: str: The name of the pub-sub channel.
     """
@@ -31,16 +286,61 @@ class FredPubSub(ComponentInterface, FredSubscriptionMixin):
             case ServiceCatalog.REDIS:
                 return self._srv.client.publish(self.name, item)
             case ServiceCatalog.STDLIB:
-                raise NotImplementedError("Publish method not implemented for STDLIB service")
+                return self._srv.client._memstore_pubsub.publish(self.name, item)
             case _:
                 raise NotImplementedError(f"Publish method not implemented for service {self._nme}")
 
+    def multiplexer(self) -> FredSubscriptionMultiplexer:
+        """Returns the subscription multiplexer of the service instance (created on first use).
+        Raises:
+            NotImplementedError: If the method is not implemented for the current service.
+        """
+        with self._multiplexers_lock:
+            if (multiplexer := self.multiplexers.get(self._srv)) is not None:
+                return multiplexer
+            match self._cat:
+                case ServiceCatalog.REDIS:
+                    connect = partial(self._srv.client.pubsub, ignore_subscribe_messages=False)
+                case ServiceCatalog.STDLIB:
+                    connect = self._srv.client._memstore_pubsub.pubsub
+                case _:
+                    raise NotImplementedError(f"Subscribe method not implemented for service {self._nme}")
+            multiplexer = self.multiplexers[self._srv] = FredSubscriptionMultiplexer(connect=connect)
+            return multiplexer
+
+    def subscription(
+            self,
+            subscription_id: Optional[str] = None,
+            loop: Optional[asyncio.AbstractEventLoop] = None,
+            channels: Optional[list[str]] = None,
+    ) -> FredSubscription:
+        """Registers a new subscription to the channel; the caller is responsible for closing it
+        (e.g., via the 'unsubscribe' method or the 'close' method of the subscription).
+        Args:
+            subscription_id (Optional[str]): An optional identifier for the subscription (a new UUID by default).
+            loop (Optional[asyncio.AbstractEventLoop]): The event loop of asyncio waiters.
+            channels (Optional[list[str]]): Subscribe to these channels (e.g., a batch of futures) instead of this one.
+        Returns:
+            FredSubscription: The subscription (i.e., a waiter of the channel messages).
+        """
+        if subscription_id in self.subs:
+            raise ValueError(f"Subscription ID already in use: {subscription_id}")
+        subscription = self.multiplexer().subscribe(
+            channels=channels or [self.name],
+            subscription_id=subscription_id,
+            loop=loop,
+        )
+        self.subs[subscription.subscription_id] = subscription
+        logger.debug(f"Using subscription ID '{subscription.subscription_id}' for channel: {self.name}")
+        return subscription
+
     def subscribe(self, subscription_id: Optional[str] = None):
         """Subscribe to the pub/sub channel and yield messages as they arrive.
 
-        This method creates (or reuses) a subscription to the channel specified by `self.name`.
-        It returns a generator that yields messages received on the channel.
-        The implementation depends on the underlying service (e.g., Redis).
+        This method registers a subscription into the process-wide multiplexer (i.e., no new connection
+        is created per subscriber) and returns a generator that yields the messages received on the
+        channel. The subscription is released as soon as the consumer stops iterating (e.g., the awaited
+        message was received) or it's closed via the 'unsubscribe' method.
 
         Args:
             subscription_id (Optional[str]): An optional identifier for the subscription. If not provided, a new UUID is generated.
@@ -50,29 +350,54 @@ class FredPubSub(ComponentInterface, FredSubscriptionMixin):
         Raises:
             NotImplementedError: If the method is not implemented for the current service.
         """
-        subscription_id = subscription_id or (
-            logger.info(f"Creating new subscriber for channel: {self.name}")
-            or str(uuid.uuid4())
-        )
-        logger.info(f"Using subscription ID: {subscription_id}")
-        match self._cat:
-            case ServiceCatalog.REDIS:
-                subscriber = self.subs[subscription_id] = self.subs.get(subscription_id, None) or self._srv.client.pubsub()
-                subscriber.subscribe(self.name)
-                yield from subscriber.listen()
-            case ServiceCatalog.STDLIB:
-                raise NotImplementedError("Subscribe method not implemented for STDLIB service")
-            case _:
-                raise NotImplementedError(f"Subscribe method not implemented for service {self._nme}")
+        subscription = self.subscription(subscription_id=subscription_id)
+        try:
+            yield from subscription.listen()
+        finally:
+            self.unsubscribe(subscription_id=subscription.subscription_id)
 
     @classmethod
     def unsubscribe(cls, subscription_id: str, close: bool = False) -> None:
-        # TODO: Implement the 'unsubscribe' and optially close the subscriber.
-        logger.error("The unsubscribe method not implemented yet.")
-        raise NotImplementedError("Unsubscribe method not implemented yet.")
+        """Closes a subscription (i.e., its waiter stops receiving messages).
+        Args:
+            subscription_id (str): The subscription identifier.
+            close (bool): If True, also closes the shared connections left without subscriptions.
+        """
+        if (subscription := cls.subs.pop(subscription_id, None)) is None:
+            logger.debug(f"Subscription '{subscription_id}' not found (already closed).")
+        else:
+            subscription.close()
+        if not close:
+            return
+        with cls._multiplexers_lock:
+            for key, multiplexer in list(cls.multiplexers.items()):
+                if not multiplexer.channels():
+                    multiplexer.close()
+                    cls.multiplexers.pop(key, None)
 
     @classmethod
     def subscribers(cls) -> list[str]:
-        # TODO: Implement the 'subscribers' method to list active subscriptions.
-        logger.error("The subscribers method not implemented yet.")
-        raise NotImplementedError("Subscribers method not implemented yet.")
+        """Returns the IDs of the active subscriptions."""
+        return list(cls.subs)
+
+    async def apublish(self, item: str) -> int:
+        """Asyncio counterpart of the 'publish' method."""
+        match self._cat:
+            case ServiceCatalog.REDIS:
+                return await self._srv.aclient.publish(self.name, item)
+            case _:
+                return self.publish(item=item)
+
+    async def asubscribe(self, subscription_id: Optional[str] = None):
+        """Asyncio counterpart of the 'subscribe' method.
+        Yields the messages received on the channel; the subscription is closed as soon
+        as the consumer stops iterating (e.g., break or cancellation).
+        Raises:
+            NotImplementedError: If the method is not implemented for the current service.
+        """
+        subscription = self.subscription(subscription_id=subscription_id, loop=asyncio.get_running_loop())
+        try:
+            async for message in subscription.alisten():
+                yield message
+        finally:
+            self.unsubscribe(subscription_id=subscription.subscription_id)
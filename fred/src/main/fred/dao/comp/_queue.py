@@ -1,5 +1,7 @@
+import itertools
+from queue import PriorityQueue
 from dataclasses import dataclass
-from typing import Optional
+from typing import ClassVar, Iterable, Optional
 
 from fred.settings import logger_manager
 from fred.dao.service.catalog import ServiceCatalog
@@ -7,6 +9,9 @@ from fred.dao.comp.interface import ComponentInterface
 
 logger = logger_manager.get_logger(name=__name__)
 
+# Insertion counter used as the tie-breaker of the in-memory priority queues (i.e., FIFO within the same priority)
+_sequence = itertools.count()
+
 
 @dataclass(frozen=True, slots=True)
 class FredQueue(ComponentInterface):
@@ -14,10 +19,37 @@ class FredQueue(ComponentInterface):
     This class provides methods to interact with a queue, such as adding,
     removing, and checking the size of the queue. The actual implementation
     of these methods depends on the underlying service being used (e.g., Redis).
+    Items can be added with a priority (higher values are consumed first; FIFO within the
+    same priority). On Redis, each priority level is kept in its own list (the level 0 uses
+    the queue name itself; thus, plain producers and consumers remain compatible) and the
+    consumers check the lists from the highest to the lowest level; on STDLIB, the items
+    are kept in a single PriorityQueue.
     Attributes:
         name: str: The name of the queue.
+        levels: int: Number of priority levels of this instance (i.e., priorities from 0 to
+            'levels - 1'); producers and consumers must agree on it. Items added with a priority
+            out of this range are clamped into it (on both Redis and STDLIB).
     """
     name: str
+    levels: int = 1
+    # Maximum time (in seconds) a blocking claim waits on the highest-priority list before
+    # checking the other levels again (Redis has no blocking LMOVE across several lists).
+    _priority_poll_interval: ClassVar[float] = 0.1
+
+    def _priority_level(self, priority: int = 0) -> int:
+        # Priorities above the highest level would be pushed into a list never read by the consumers
+        level = min(max(priority, 0), max(self.levels, 1) - 1)
+        if level != priority:
+            logger.warning(f"Priority {priority} is out of the levels of queue '{self.name}'; using {level}.")
+        return level
+
+    def _priority_name(self, priority: int = 0) -> str:
+        return self.name if priority <= 0 else ":".join([self.name, "prio", str(priority)])
+
+    @property
+    def _priority_names(self) -> list[str]:
+        # Lists ordered from the highest to the lowest priority level (i.e., consumption order)
+        return [self._priority_name(priority=level) for level in reversed(range(max(self.levels, 1)))]
 
     def size(self) -> int:
         """Returns the number of items in the queue.
@@ -31,7 +63,12 @@ class FredQueue(ComponentInterface):
         """
         match self._cat:
             case ServiceCatalog.REDIS:
-                return self._srv.client.llen(self.name)
+                if self.levels <= 1:
+                    return self._srv.client.llen(self.name)
+                with self._srv.client.pipeline(transaction=False) as pipe:
+                    for name in self._priority_names:
+                        pipe.llen(name)
+                    return sum(pipe.execute())
             case ServiceCatalog.STDLIB:
                 q = self._srv.client._memstore_queue.get(self.name, None)
                 return q.qsize() if q else 0
@@ -48,39 +85,79 @@ class FredQueue(ComponentInterface):
         """
         match self._cat:
             case ServiceCatalog.REDIS:
-                self._srv.client.delete(self.name)
+                self._srv.client.delete(*self._priority_names)
             case ServiceCatalog.STDLIB:
                 if (q := self._srv.client._memstore_queue.pop(self.name, None)):
                     del q
             case _:
                 raise NotImplementedError(f"Clear method not implemented for service {self._nme}")
 
-    def add(self, item: str) -> None:
+    def add(self, item: str, priority: int = 0) -> None:
         """Adds an item to the queue.
         The implementation of this method depends on the underlying service.
         For example, if the service is Redis, it uses the LPUSH command to add the
-        item to the front of the list representing the queue.
+        item to the front of the list representing the queue (or its priority level).
         Args:
             item (str): The item to add to the queue.
+            priority (int): The priority of the item; higher values are consumed first.
         Raises:
             NotImplementedError: If the method is not implemented for the current service.
         """
+        priority = self._priority_level(priority=priority)
         match self._cat:
             case ServiceCatalog.REDIS:
-                self._srv.client.lpush(self.name, item)
+                self._srv.client.lpush(self._priority_name(priority=priority), item)
             case ServiceCatalog.STDLIB:
-                from queue import Queue
-                qs = self._srv.client._memstore_queue
-                q = qs[self.name] = qs.get(self.name, None) or Queue()
-                q.put(item)
+                self._stdlib_queue().put((-priority, next(_sequence), item))
             case _:
                 raise NotImplementedError(f"Add method not implemented for service {self._srv._nme}")
 
-    def pop(self) -> Optional[str]:
+    def add_many(self, items: Iterable[str], priority: int = 0, chunk_size: int = 1000) -> int:
+        """Adds multiple items to the queue (preserving their order).
+        On Redis, the items are pushed with variadic LPUSH commands of up to 'chunk_size' items
+        each, and every command is sent in a single (non-transactional) pipeline; thus, the whole
+        batch costs a single round-trip instead of one per item.
+        Args:
+            items (Iterable[str]): The items to add to the queue.
+            priority (int): The priority of the items; higher values are consumed first.
+            chunk_size (int): Maximum number of items per LPUSH command.
+        Returns:
+            int: The number of items added.
+        Raises:
+            NotImplementedError: If the method is not implemented for the current service.
+        """
+        count = 0
+        priority = self._priority_level(priority=priority)
+        match self._cat:
+            case ServiceCatalog.REDIS:
+                name = self._priority_name(priority=priority)
+                with self._srv.client.pipeline(transaction=False) as pipe:
+                    for chunk in itertools.batched(items, max(chunk_size, 1)):
+                        pipe.lpush(name, *chunk)
+                        count += len(chunk)
+                    pipe.execute()
+            case ServiceCatalog.STDLIB:
+                q = self._stdlib_queue()
+                for item in items:
+                    q.put((-priority, next(_sequence), item))
+                    count += 1
+            case _:
+                raise NotImplementedError(f"Add-many method not implemented for service {self._nme}")
+        return count
+
+    def _stdlib_queue(self) -> PriorityQueue:
+        # The 'setdefault' call is atomic; thus, producers and (blocked) consumers always share the same queue
+        return self._srv.client._memstore_queue.setdefault(self.name, PriorityQueue())
+
+    def pop(self, timeout: Optional[float] = None) -> Optional[str]:
         """Removes and returns an item from the queue.
         The implementation of this method depends on the underlying service.
         For example, if the service is Redis, it uses the RPOP command to remove and
-        return the last item from the list representing the queue.
+        return the last item from the list representing the queue (or BRPOP when a
+        timeout is provided).
+        Args:
+            timeout (Optional[float]): If provided, blocks up to 'timeout' seconds waiting for
+                an item to be available; otherwise, returns immediately.
         Returns:
             Optional[str]: The item removed from the queue, or None if the queue is empty.
         Raises:
@@ -88,15 +165,323 @@ class FredQueue(ComponentInterface):
         """
         match self._cat:
             case ServiceCatalog.REDIS:
-                return self._srv.client.rpop(self.name)
+                if not timeout:
+                    for name in self._priority_names:
+                        if (item := self._srv.client.rpop(name)) is not None:
+                            return item
+                    return None
+                # BRPOP checks the lists in the given order (i.e., highest priority first) and
+                # returns a (queue-name, item) tuple or None when the timeout is reached
+                _, item = self._srv.client.brpop(self._priority_names, timeout=timeout) or (None, None)
+                return item
             case ServiceCatalog.STDLIB:
                 from queue import Empty
-                if not (q := self._srv.client._memstore_queue.get(self.name, None)):
-                    return None
+                if not timeout:
+                    if not (q := self._srv.client._memstore_queue.get(self.name, None)):
+                        return None
+                    try:
+                        *_, item = q.get_nowait()
+                        return item
+                    except Empty:
+                        logger.debug(f"Queue '{self.name}' is empty.")
+                        return None
                 try:
-                    return q.get_nowait()
+                    *_, item = self._stdlib_queue().get(timeout=timeout)
+                    return item
                 except Empty:
-                    logger.info(f"Queue '{self.name}' is empty.")
                     return None
             case _:
                 raise NotImplementedError(f"Pop method not implemented for service {self._srv._nme}")
+
+    def pop_many(self, n: int, timeout: Optional[float] = None) -> list[str]:
+        """Removes and returns up to 'n' items from the queue.
+        If a timeout is provided, blocks up to 'timeout' seconds waiting for the first item;
+        the remaining items are then fetched without blocking (i.e., the batch contains
+        whatever is available at that moment).
+        The implementation of this method depends on the underlying service.
+        For example, if the service is Redis, it uses the 'RPOP <name> <count>' command.
+        Args:
+            n (int): The maximum number of items to return.
+            timeout (Optional[float]): Maximum time (in seconds) to wait for the first item.
+        Returns:
+            list[str]: The items removed from the queue in priority and FIFO order; empty if no items are available.
+        Raises:
+            NotImplementedError: If the method is not implemented for the current service.
+        """
+        if n <= 0:
+            return []
+        match self._cat:
+            case ServiceCatalog.REDIS:
+                items: list[str] = []
+                if timeout:
+                    if (first := self.pop(timeout=timeout)) is None:
+                        return items
+                    items.append(first)
+                for name in self._priority_names:
+                    if len(items) >= n:
+                        break
+                    items.extend(self._srv.client.rpop(name, n - len(items)) or [])
+                return items
+            case ServiceCatalog.STDLIB:
+                from queue import Empty
+                if (first := self.pop(timeout=timeout)) is None:
+                    return []
+                items = [first]
+                q = self._stdlib_queue()
+                while len(items) < n:
+                    try:
+                        *_, item = q.get_nowait()
+                    except Empty:
+                        break
+                    items.append(item)
+                return items
+            case _:
+                raise NotImplementedError(f"Pop-many method not implemented for service {self._nme}")
+
+    def requeue(self, items: list[str]) -> None:
+        """Returns previously popped items into the consuming end of the queue (i.e., they are popped next
+        and in the same order, regardless of the priority levels); useful to hand back the unprocessed items of a batch.
+        Args:
+            items (list[str]): The items to return to the queue, in the order they were popped.
+        Raises:
+            NotImplementedError: If the method is not implemented for the current service.
+        """
+        if not items:
+            return
+        match self._cat:
+            case ServiceCatalog.REDIS:
+                # Items are consumed from the right of the highest-priority list; the first item must be pushed last.
+                self._srv.client.rpush(self._priority_names[0], *reversed(items))
+            case ServiceCatalog.STDLIB:
+                # Requeued items precede every priority level while keeping their relative order
+                q = self._stdlib_queue()
+                for item in items:
+                    q.put((float("-inf"), next(_sequence), item))
+            case _:
+                raise NotImplementedError(f"Requeue method not implemented for service {self._nme}")
+
+    # Reliable (acknowledged) consumption
+    # The claimed items are moved into a per-consumer processing list and remain there until
+    # acknowledged; each consumer holds a lease (i.e., a visibility timeout) that is renewed
+    # on every claim/ack/touch. The 'reap' method hands back the items of expired leases
+    # (e.g., consumers that crashed mid-item) into the queue.
+
+    def _processing_name(self, consumer: str) -> str:
+        return ":".join([self.name, "processing", consumer])
+
+    @property
+    def _leases_name(self) -> str:
+        return ":".join([self.name, "leases"])
+
+    def _stdlib_processing(self, consumer: str) -> list[str]:
+        return self._srv.client._memstore_keyval.setdefault(self._processing_name(consumer=consumer), [])
+
+    def _stdlib_leases(self) -> dict[str, float]:
+        return self._srv.client._memstore_keyval.setdefault(self._leases_name, {})
+
+    def touch(self, consumer: str, visibility: float = 300) -> None:
+        """Renews the lease of a consumer (i.e., a heartbeat); the claimed items of the consumer
+        are not handed back to the queue while the lease is valid.
+        Args:
+            consumer (str): The consumer identifier (e.g., the runner ID).
+            visibility (float): The lease duration (in seconds) starting now.
+        Raises:
+            NotImplementedError: If the method is not implemented for the current service.
+        """
+        import time
+
+        deadline = time.time() + visibility
+        match self._cat:
+            case ServiceCatalog.REDIS:
+                self._srv.client.hset(self._leases_name, consumer, deadline)
+            case ServiceCatalog.STDLIB:
+                self._stdlib_leases()[consumer] = deadline
+            case _:
+                raise NotImplementedError(f"Touch method not implemented for service {self._nme}")
+
+    def claim(self, consumer: str, timeout: Optional[float] = None, visibility: float = 300) -> Optional[str]:
+        """Removes an item from the queue and keeps it in the processing list of the consumer until acknowledged.
+        The implementation of this method depends on the underlying service.
+        For example, if the service is Redis, it uses the LMOVE command (or BLMOVE when a timeout
+        is provided) to atomically move the item into the processing list.
+        Args:
+            consumer (str): The consumer identifier (e.g., the runner ID).
+            timeout (Optional[float]): If provided, blocks up to 'timeout' seconds waiting for an item.
+            visibility (float): The lease duration (in seconds) of the consumer.
+        Returns:
+            Optional[str]: The claimed item, or None if the queue is empty.
+        Raises:
+            NotImplementedError: If the method is not implemented for the current service.
+        """
+        self.touch(consumer=consumer, visibility=visibility)
+        match self._cat:
+            case ServiceCatalog.REDIS:
+                processing = self._processing_name(consumer=consumer)
+                if self.levels <= 1:
+                    if not timeout:
+                        return self._srv.client.lmove(self.name, processing, src="RIGHT", dest="LEFT")
+                    return self._srv.client.blmove(self.name, processing, timeout, src="RIGHT", dest="LEFT")
+                import time
+
+                deadline = time.monotonic() + (timeout or 0)
+                while True:
+                    for name in self._priority_names:
+                        if (item := self._srv.client.lmove(name, processing, src="RIGHT", dest="LEFT")) is not None:
+                            return item
+                    if (remaining := deadline - time.monotonic()) <= 0:
+                        return None
+                    # Block on the highest-priority list; the lower levels are checked again after the interval
+                    wait = min(remaining, self._priority_poll_interval)
+                    item = self._srv.client.blmove(self._priority_names[0], processing, wait, src="RIGHT", dest="LEFT")
+                    if item is not None:
+                        return item
+            case ServiceCatalog.STDLIB:
+                if (item := self.pop(timeout=timeout)) is not None:
+                    self._stdlib_processing(consumer=consumer).append(item)
+                return item
+            case _:
+                raise NotImplementedError(f"Claim method not implemented for service {self._nme}")
+
+    def claim_many(self, consumer: str, n: int, timeout: Optional[float] = None, visibility: float = 300) -> list[str]:
+        """Claims up to 'n' items; blocks up to 'timeout' seconds for the first one only (see 'pop_many').
+        Args:
+            consumer (str): The consumer identifier (e.g., the runner ID).
+            n (int): The maximum number of items to claim.
+            timeout (Optional[float]): Maximum time (in seconds) to wait for the first item.
+            visibility (float): The lease duration (in seconds) of the consumer.
+        Returns:
+            list[str]: The claimed items in priority and FIFO order.
+        Raises:
+            NotImplementedError: If the method is not implemented for the current service.
+        """
+        if n <= 0:
+            return []
+        match self._cat:
+            case ServiceCatalog.REDIS:
+                if (items := self._claim_available(consumer=consumer, n=n, visibility=visibility)) or not timeout:
+                    return items
+                # Nothing was available; blocks for the first item and then claims whatever arrived meanwhile
+                if (first := self.claim(consumer=consumer, timeout=timeout, visibility=visibility)) is None:
+                    return []
+                return [first, *self._claim_available(consumer=consumer, n=n - 1, visibility=visibility)]
+            case ServiceCatalog.STDLIB:
+                items = []
+                while len(items) < n:
+                    # Only the first claim blocks (i.e., the remaining items are claimed if already available)
+                    item = self.claim(consumer=consumer, timeout=None if items else timeout, visibility=visibility)
+                    if item is None:
+                        break
+                    items.append(item)
+                return items
+            case _:
+                raise NotImplementedError(f"Claim-many method not implemented for service {self._nme}")
+
+    def _claim_available(self, consumer: str, n: int, visibility: float) -> list[str]:
+        # Claims up to 'n' already-available items without blocking (Redis only); the lease write and the
+        # LMOVE commands of each priority level are sent in a single (non-transactional) pipeline.
+        import time
+
+        processing = self._processing_name(consumer=consumer)
+        items: list[str] = []
+        for level, name in enumerate(self._priority_names):
+            if len(items) >= n:
+                break
+            with self._srv.client.pipeline(transaction=False) as pipe:
+                if not level:
+                    pipe.hset(self._leases_name, consumer, time.time() + visibility)
+                for _ in range(n - len(items)):
+                    pipe.lmove(name, processing, src="RIGHT", dest="LEFT")
+                replies = pipe.execute()[0 if level else 1:]
+            # The level is drained at the first None; an item pushed concurrently may still follow it
+            # and it is already in the processing list (i.e., kept instead of being dropped).
+            items.extend(item for item in replies if item is not None)
+        return items
+
+    def ack(self, consumer: str, item: str) -> bool:
+        """Acknowledges a claimed item (i.e., removes it from the processing list of the consumer).
+        Args:
+            consumer (str): The consumer identifier (e.g., the runner ID).
+            item (str): The claimed item.
+        Returns:
+            bool: True if the item was found in the processing list; False otherwise
+                (e.g., the lease expired and the item was already handed back to the queue).
+        Raises:
+            NotImplementedError: If the method is not implemented for the current service.
+        """
+        match self._cat:
+            case ServiceCatalog.REDIS:
+                return bool(self._srv.client.lrem(self._processing_name(consumer=consumer), 1, item))
+            case ServiceCatalog.STDLIB:
+                try:
+                    self._stdlib_processing(consumer=consumer).remove(item)
+                    return True
+                except ValueError:
+                    return False
+            case _:
+                raise NotImplementedError(f"Ack method not implemented for service {self._nme}")
+
+    def nack(self, consumer: str, item: str, front: bool = False) -> bool:
+        """Rejects a claimed item and hands it back to the queue.
+        Args:
+            consumer (str): The consumer identifier (e.g., the runner ID).
+            item (str): The claimed item.
+            front (bool): If True, the item is popped next; otherwise, it's placed at the end of the queue.
+        Returns:
+            bool: True if the item was found in the processing list (and handed back); False otherwise.
+        """
+        if not self.ack(consumer=consumer, item=item):
+            return False
+        if front:
+            self.requeue(items=[item])
+        else:
+            self.add(item)
+        return True
+
+    def processing(self, consumer: str) -> list[str]:
+        """Returns the items claimed by the consumer that have not been acknowledged yet (oldest first)."""
+        match self._cat:
+            case ServiceCatalog.REDIS:
+                return self._srv.client.lrange(self._processing_name(consumer=consumer), 0, -1)[::-1]
+            case ServiceCatalog.STDLIB:
+                return list(self._stdlib_processing(consumer=consumer))
+            case _:
+                raise NotImplementedError(f"Processing method not implemented for service {self._nme}")
+
+    def reap(self) -> int:
+        """Hands back the unacknowledged items of every consumer with an expired lease into the queue.
+        The items are placed at the consuming end of the queue (i.e., they are popped next and in order).
+        Returns:
+            int: The number of items handed back to the queue.
+        Raises:
+            NotImplementedError: If the method is not implemented for the current service.
+        """
+        import time
+
+        now = time.time()
+        reaped = 0
+        match self._cat:
+            case ServiceCatalog.REDIS:
+                for consumer, deadline in self._srv.client.hgetall(self._leases_name).items():
+                    if float(deadline) > now:
+                        continue
+                    processing = self._processing_name(consumer=consumer)
+                    # LMOVE keeps the handover atomic per item (i.e., no item is lost if the reaper crashes);
+                    # moving the newest items first leaves the oldest ones at the consuming end of the queue.
+                    head = self._priority_names[0]
+                    while self._srv.client.lmove(processing, head, src="LEFT", dest="RIGHT") is not None:
+                        reaped += 1
+                    self._srv.client.hdel(self._leases_name, consumer)
+            case ServiceCatalog.STDLIB:
+                leases = self._stdlib_leases()
+                for consumer, deadline in list(leases.items()):
+                    if deadline > now:
+                        continue
+                    items = self._srv.client._memstore_keyval.pop(self._processing_name(consumer=consumer), [])
+                    self.requeue(items=items)
+                    reaped += len(items)
+                    leases.pop(consumer, None)
+            case _:
+                raise NotImplementedError(f"Reap method not implemented for service {self._nme}")
+        if reaped:
+            logger.warning(f"Handed back {reaped} unacknowledged items into queue '{self.name}'.")
+        return reaped
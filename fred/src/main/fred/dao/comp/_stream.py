@@ -0,0 +1,352 @@
+import itertools
+import threading
+from dataclasses import dataclass
+from typing import ClassVar, Iterable, Optional
+
+from fred.settings import logger_manager
+from fred.dao.service.catalog import ServiceCatalog
+from fred.dao.comp._queue import FredQueue
+
+logger = logger_manager.get_logger(name=__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class FredStreamQueue(FredQueue):
+    """A queue implementation backed by Redis Streams and consumer groups.
+    This class exposes the same interface as the FredQueue (i.e., it can be used as a
+    drop-in replacement) while providing per-consumer accounting (pending entries),
+    replay, approximate MAXLEN trimming, and consumer lag metrics. Stuck entries (i.e.,
+    entries claimed by consumers that stopped processing them) are handed over to other
+    consumers via XAUTOCLAIM. The claimed items are acknowledged by value: the entry IDs
+    claimed in the current process are kept by consumer and item, and the consumer's pending
+    entries in the stream itself are only looked up for the items claimed elsewhere (e.g.,
+    by another process). Entries taken over by a consumer of another process are not
+    detected by the former; its acknowledgement (if any) still acknowledges the entry.
+    Services without streams support (e.g., STDLIB) fall back to the FredQueue implementation.
+    Attributes:
+        name: str: The name of the stream.
+        group: str: The consumer group name.
+        maxlen: Optional[int]: Approximate maximum length of the stream (trimmed on every add).
+    """
+    group: str = "frd"
+    maxlen: Optional[int] = 100_000
+    _groups: ClassVar[set[tuple[str, str]]] = set()
+    _field: ClassVar[str] = "item"
+    _default_consumer: ClassVar[str] = "frd-consumer"
+    # Maximum number of pending entries looked up per consumer
+    _pending_count: ClassVar[int] = 10_000
+    # The entry IDs claimed in this process by (stream, group, consumer) and item in delivery order
+    _claimed: ClassVar[dict[tuple[str, str, str], dict[str, list[str]]]] = {}
+    _claimed_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def _ensure_group(self) -> None:
+        if (self.name, self.group) in self._groups:
+            return
+        from redis.exceptions import ResponseError
+        try:
+            # Starting at '0' makes the entries added before the group creation available
+            self._srv.client.xgroup_create(self.name, self.group, id="0", mkstream=True)
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+        self._groups.add((self.name, self.group))
+
+    def _register(self, entries: list) -> list[tuple[str, str]]:
+        claimed, deleted = [], []
+        for entry_id, fields in entries:
+            if not fields:
+                # Entries deleted (e.g., trimmed) while pending; nothing to process
+                deleted.append(entry_id)
+                continue
+            claimed.append((entry_id, fields[self._field]))
+        if deleted:
+            self._srv.client.xack(self.name, self.group, *deleted)
+        return claimed
+
+    def _claim_entries(
+            self,
+            consumer: str,
+            n: int,
+            timeout: Optional[float],
+            visibility: float,
+    ) -> list[tuple[str, str]]:
+        # The (entry ID, item) pairs claimed by the consumer; stuck entries are taken over first
+        self._ensure_group()
+        _, entries, *_ = self._srv.client.xautoclaim(
+            self.name,
+            self.group,
+            consumer,
+            min_idle_time=int(visibility * 1000),
+            start_id="0-0",
+            count=n,
+        )
+        if (claimed := self._register(entries=entries)):
+            self._forget(entry_ids={entry_id for entry_id, _ in claimed})
+            return claimed
+        response = self._srv.client.xreadgroup(
+            self.group,
+            consumer,
+            streams={self.name: ">"},
+            count=n,
+            block=int(timeout * 1000) if timeout else None,
+        )
+        return [pair for _, stream_entries in response or [] for pair in self._register(entries=stream_entries)]
+
+    def _remember(self, consumer: str, claimed: list[tuple[str, str]]) -> None:
+        with self._claimed_lock:
+            ids = self._claimed.setdefault((self.name, self.group, consumer), {})
+            for entry_id, item in claimed:
+                ids.setdefault(item, []).append(entry_id)
+
+    def _forget(self, entry_ids: set[str]) -> None:
+        # Entries taken over (via XAUTOCLAIM) no longer belong to the consumers that claimed them before
+        with self._claimed_lock:
+            for (name, group, _), ids in self._claimed.items():
+                if (name, group) != (self.name, self.group):
+                    continue
+                for item, item_ids in list(ids.items()):
+                    if (kept := [entry_id for entry_id in item_ids if entry_id not in entry_ids]):
+                        ids[item] = kept
+                    else:
+                        del ids[item]
+
+    def _pending_ids(self, consumer: str) -> list[str]:
+        self._ensure_group()
+        pending = self._srv.client.xpending_range(
+            self.name,
+            self.group,
+            min="-",
+            max="+",
+            count=self._pending_count,
+            consumername=consumer,
+        )
+        return [entry["message_id"] for entry in pending]
+
+    def _pending_items(self, consumer: str) -> list[tuple[str, Optional[str]]]:
+        # The (entry ID, item) pairs claimed by the consumer in delivery order; the items of the entries
+        # deleted (e.g., trimmed) while pending are None. The XRANGE lookups are sent in a single pipeline.
+        if not (ids := self._pending_ids(consumer=consumer)):
+            return []
+        with self._srv.client.pipeline(transaction=False) as pipe:
+            for entry_id in ids:
+                pipe.xrange(self.name, entry_id, entry_id)
+            responses = pipe.execute()
+        return [
+            (entry_id, entries[0][1].get(self._field) if entries else None)
+            for entry_id, entries in zip(ids, responses)
+        ]
+
+    def _undelivered(self, last_delivered_id: str, page: int = 10_000) -> int:
+        # Entries added after the last one delivered to the group (i.e., the lag on Redis < 7)
+        count, start = 0, f"({last_delivered_id}"
+        while (entries := self._srv.client.xrange(self.name, min=start, max="+", count=page)):
+            count += len(entries)
+            start = f"({entries[-1][0]}"
+        return count
+
+    def size(self) -> int:
+        """Returns the number of entries not yet delivered to the consumer group (i.e., the lag)."""
+        match self._cat:
+            case ServiceCatalog.REDIS:
+                return self.lag()
+            case _:
+                return FredQueue.size(self)
+
+    def lag(self) -> int:
+        """Returns the consumer group lag (i.e., entries in the stream not yet delivered to any consumer).
+        This metric reflects the real backlog (unlike a length snapshot) and can be used to autoscale the runners.
+        Raises:
+            NotImplementedError: If the method is not implemented for the current service.
+        """
+        match self._cat:
+            case ServiceCatalog.REDIS:
+                self._ensure_group()
+                for group in self._srv.client.xinfo_groups(self.name):
+                    if group["name"] != self.group:
+                        continue
+                    # The 'lag' field is only available on Redis 7+ (and can be null after deletions)
+                    if (lag := group.get("lag")) is not None:
+                        return int(lag)
+                    return self._undelivered(last_delivered_id=group["last-delivered-id"])
+                return 0
+            case _:
+                raise NotImplementedError(f"Lag method not implemented for service {self._nme}")
+
+    def pending(self) -> int:
+        """Returns the number of entries delivered to the consumers but not acknowledged yet."""
+        match self._cat:
+            case ServiceCatalog.REDIS:
+                self._ensure_group()
+                return int(self._srv.client.xpending(self.name, self.group)["pending"])
+            case _:
+                raise NotImplementedError(f"Pending method not implemented for service {self._nme}")
+
+    def consumers(self) -> list[dict]:
+        """Returns the per-consumer accounting (name, pending entries, and idle time in milliseconds)."""
+        match self._cat:
+            case ServiceCatalog.REDIS:
+                self._ensure_group()
+                return [
+                    {"name": info["name"], "pending": info["pending"], "idle": info["idle"]}
+                    for info in self._srv.client.xinfo_consumers(self.name, self.group)
+                ]
+            case _:
+                raise NotImplementedError(f"Consumers method not implemented for service {self._nme}")
+
+    def clear(self) -> None:
+        match self._cat:
+            case ServiceCatalog.REDIS:
+                self._srv.client.delete(self.name)
+                self._groups.discard((self.name, self.group))
+                with self._claimed_lock:
+                    for key in [key for key in self._claimed if key[:2] == (self.name, self.group)]:
+                        del self._claimed[key]
+            case _:
+                FredQueue.clear(self)
+
+    def add(self, item: str, priority: int = 0) -> None:
+        """Adds an entry into the stream; streams are consumed in insertion order, thus the
+        priority is ignored on Redis (use the list-based FredQueue for prioritized consumption)."""
+        match self._cat:
+            case ServiceCatalog.REDIS:
+                if priority:
+                    logger.debug(f"Priorities are not supported on stream '{self.name}'; ignoring priority {priority}.")
+                self._srv.client.xadd(self.name, {self._field: item}, maxlen=self.maxlen, approximate=True)
+            case _:
+                FredQueue.add(self, item, priority=priority)
+
+    def add_many(self, items: Iterable[str], priority: int = 0, chunk_size: int = 1000) -> int:
+        """Adds multiple entries into the stream; on Redis, the XADD commands are sent in pipelined chunks."""
+        match self._cat:
+            case ServiceCatalog.REDIS:
+                if priority:
+                    logger.debug(f"Priorities are not supported on stream '{self.name}'; ignoring priority {priority}.")
+                count = 0
+                with self._srv.client.pipeline(transaction=False) as pipe:
+                    for chunk in itertools.batched(items, max(chunk_size, 1)):
+                        for item in chunk:
+                            pipe.xadd(self.name, {self._field: item}, maxlen=self.maxlen, approximate=True)
+                        pipe.execute()
+                        count += len(chunk)
+                return count
+            case _:
+                return FredQueue.add_many(self, items, priority=priority, chunk_size=chunk_size)
+
+    def pop(self, timeout: Optional[float] = None) -> Optional[str]:
+        match self._cat:
+            case ServiceCatalog.REDIS:
+                # Plain consumption; the item is acknowledged right away
+                items = self.pop_many(n=1, timeout=timeout)
+                return items[0] if items else None
+            case _:
+                return FredQueue.pop(self, timeout=timeout)
+
+    def pop_many(self, n: int, timeout: Optional[float] = None) -> list[str]:
+        match self._cat:
+            case ServiceCatalog.REDIS:
+                if n <= 0:
+                    return []
+                claimed = self._claim_entries(consumer=self._default_consumer, n=n, timeout=timeout, visibility=300)
+                if claimed:
+                    # Plain consumption; the claimed entries are acknowledged right away (in a single XACK)
+                    self._srv.client.xack(self.name, self.group, *(entry_id for entry_id, _ in claimed))
+                return [item for _, item in claimed]
+            case _:
+                return FredQueue.pop_many(self, n=n, timeout=timeout)
+
+    def requeue(self, items: list[str]) -> None:
+        """Adds the items back into the stream; note that streams are append-only, so (unlike the
+        list-based queue) the items are delivered after the entries already in the stream."""
+        match self._cat:
+            case ServiceCatalog.REDIS:
+                for item in items:
+                    self.add(item)
+            case _:
+                FredQueue.requeue(self, items=items)
+
+    def touch(self, consumer: str, visibility: float = 300) -> None:
+        """Resets the idle time of the entries claimed by the consumer (i.e., a heartbeat), preventing
+        other consumers from taking them over. Only the entries claimed in the current process are
+        claimed again; the pending entries are looked up if the consumer claimed nothing here."""
+        match self._cat:
+            case ServiceCatalog.REDIS:
+                with self._claimed_lock:
+                    claimed = self._claimed.get((self.name, self.group, consumer))
+                    ids = [entry_id for item_ids in claimed.values() for entry_id in item_ids] if claimed else []
+                if claimed is None:
+                    ids = self._pending_ids(consumer=consumer)
+                if not ids:
+                    return
+                self._srv.client.xclaim(self.name, self.group, consumer, 0, ids, justid=True)
+            case _:
+                FredQueue.touch(self, consumer=consumer, visibility=visibility)
+
+    def claim(self, consumer: str, timeout: Optional[float] = None, visibility: float = 300) -> Optional[str]:
+        match self._cat:
+            case ServiceCatalog.REDIS:
+                items = self.claim_many(consumer=consumer, n=1, timeout=timeout, visibility=visibility)
+                return items[0] if items else None
+            case _:
+                return FredQueue.claim(self, consumer=consumer, timeout=timeout, visibility=visibility)
+
+    def claim_many(self, consumer: str, n: int, timeout: Optional[float] = None, visibility: float = 300) -> list[str]:
+        """Claims up to 'n' entries for the consumer. Entries that have been pending for longer than
+        the visibility timeout (e.g., claimed by crashed consumers) are taken over first (XAUTOCLAIM);
+        then, new entries are read via XREADGROUP (blocking up to 'timeout' seconds if provided).
+        """
+        match self._cat:
+            case ServiceCatalog.REDIS:
+                if n <= 0:
+                    return []
+                claimed = self._claim_entries(consumer=consumer, n=n, timeout=timeout, visibility=visibility)
+                self._remember(consumer=consumer, claimed=claimed)
+                return [item for _, item in claimed]
+            case _:
+                return FredQueue.claim_many(self, consumer=consumer, n=n, timeout=timeout, visibility=visibility)
+
+    def ack(self, consumer: str, item: str) -> bool:
+        match self._cat:
+            case ServiceCatalog.REDIS:
+                # The oldest entry claimed by the consumer with the given item (as LREM on the processing list)
+                with self._claimed_lock:
+                    claimed = self._claimed.get((self.name, self.group, consumer), {})
+                    ids = claimed.get(item, [])
+                    entry_id = ids.pop(0) if ids else None
+                    if not ids:
+                        claimed.pop(item, None)
+                if entry_id is not None:
+                    return bool(self._srv.client.xack(self.name, self.group, entry_id))
+                # Not claimed in this process (e.g., by another process); looked up in the stream itself
+                for entry_id, pending in self._pending_items(consumer=consumer):
+                    if pending == item:
+                        return bool(self._srv.client.xack(self.name, self.group, entry_id))
+                return False
+            case _:
+                return FredQueue.ack(self, consumer=consumer, item=item)
+
+    def nack(self, consumer: str, item: str, front: bool = False) -> bool:
+        """Rejects a claimed entry and adds it back into the stream ('front' is not supported on streams)."""
+        match self._cat:
+            case ServiceCatalog.REDIS:
+                if not self.ack(consumer=consumer, item=item):
+                    return False
+                self.add(item)
+                return True
+            case _:
+                return FredQueue.nack(self, consumer=consumer, item=item, front=front)
+
+    def processing(self, consumer: str) -> list[str]:
+        match self._cat:
+            case ServiceCatalog.REDIS:
+                return [item for _, item in self._pending_items(consumer=consumer) if item is not None]
+            case _:
+                return FredQueue.processing(self, consumer=consumer)
+
+    def reap(self) -> int:
+        """Stuck entries are taken over by the consumers themselves (see 'claim_many'); thus,
+        reaping is a no-op for Redis Streams and only applies to the fallback implementation."""
+        match self._cat:
+            case ServiceCatalog.REDIS:
+                return 0
+            case _:
+                return FredQueue.reap(self)
@@ -4,6 +4,7 @@ from typing import Optional
 
 from fred.dao.comp.interface import ComponentInterface, SRV_REF_TYPE
 from fred.dao.comp._queue import FredQueue
+from fred.dao.comp._stream import FredStreamQueue
 from fred.dao.comp._keyval import FredKeyVal
 from fred.dao.comp._pubsub import FredPubSub
 
@@ -36,6 +37,7 @@ class CompCatalog(enum.Enum):
     QUEUE = FredQueue
     KEYVAL = FredKeyVal
     PUBSUB = FredPubSub
+    STREAM = FredStreamQueue
 
     @classmethod
     def from_classname(cls, classname: str) -> "CompCatalog":
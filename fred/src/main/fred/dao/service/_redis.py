@@ -1,5 +1,11 @@
+import asyncio
+import threading
+from weakref import WeakKeyDictionary
+
 from redis import Redis, ConnectionPool
+from redis.asyncio import Redis as AsyncRedis, ConnectionPool as AsyncConnectionPool
 
+from fred.dao.settings import FRD_REDIS_CLIENT_CACHE_SIZE
 from fred.dao.service.utils import get_redis_configs_from_payload
 from fred.dao.service.interface import ServiceConnectionPoolInterface, ServiceInterface
 
@@ -9,9 +15,37 @@ class RedisConnectionPool(ServiceConnectionPoolInterface[ConnectionPool]):
     @classmethod
     def _create_pool(cls, **kwargs) -> ConnectionPool:
         configs = get_redis_configs_from_payload(payload=kwargs, keep=False)
+        if FRD_REDIS_CLIENT_CACHE_SIZE > 0 and "cache_config" not in configs:
+            # Server-assisted client-side caching (the server invalidates the cached reads via RESP3 tracking)
+            from redis.cache import CacheConfig
+            configs.update(protocol=3, cache_config=CacheConfig(max_size=FRD_REDIS_CLIENT_CACHE_SIZE))
         return ConnectionPool(**configs)
 
 
+class AsyncRedisConnectionPool(ServiceConnectionPoolInterface[AsyncConnectionPool]):
+    # Async connections are bound to the event loop that created them; thus, the pools are registered
+    # per event loop object (i.e., not by its 'id', which is reused once the loop is garbage-collected).
+    # The pools of a closed loop are dropped, since their connections cannot be used anymore.
+    loop_registry: WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, AsyncConnectionPool]] = WeakKeyDictionary()
+    _registry_lock = threading.Lock()
+
+    @classmethod
+    def _create_pool(cls, **kwargs) -> AsyncConnectionPool:
+        configs = get_redis_configs_from_payload(payload=kwargs, keep=False)
+        return AsyncConnectionPool(**configs)
+
+    @classmethod
+    def get_loop_pool(cls, loop: asyncio.AbstractEventLoop, **kwargs) -> AsyncConnectionPool:
+        pool_id = cls.get_pool_id(**kwargs)
+        with cls._registry_lock:
+            for closed in [other for other in cls.loop_registry if other.is_closed()]:
+                cls.loop_registry.pop(closed, None)
+            pools = cls.loop_registry.setdefault(loop, {})
+            if (pool := pools.get(pool_id)) is None:
+                pool = pools[pool_id] = cls._create_pool(**kwargs)
+            return pool
+
+
 class RedisService(ServiceInterface[Redis]):
     instance: Redis
 
@@ -23,3 +57,11 @@ class RedisService(ServiceInterface[Redis]):
     def auto(cls, **kwargs) -> "RedisService":
         cls.instance = Redis(connection_pool=RedisConnectionPool.get_or_create_pool(**kwargs))
         return cls(**kwargs)
+
+    @property
+    def aclient(self) -> AsyncRedis:
+        pool = AsyncRedisConnectionPool.get_loop_pool(
+            loop=asyncio.get_running_loop(),
+            **getattr(self, "config", {})
+        )
+        return AsyncRedis(connection_pool=pool)
@@ -3,6 +3,8 @@ from dataclasses import dataclass
 from typing import Optional
 
 from fred.utils.runtime import RuntimeInfo
+from fred.dao.service._stdlib_broker import StdLibBroker
+from fred.dao.service._stdlib_store import StdLibKeyValStore
 from fred.dao.service.interface import ServiceConnectionPoolInterface, ServiceInterface
 
 
@@ -19,17 +21,20 @@ class StdLibSingleton:
 @dataclass(frozen=True, slots=True)
 class StdLib:
     runtime_info: RuntimeInfo
-    _memstore_keyval: dict[str, str]
+    _memstore_keyval: StdLibKeyValStore
     _memstore_queue: dict[str, Queue]
+    _memstore_pubsub: StdLibBroker
 
     @classmethod
     def auto(cls, **kwargs) -> "StdLib":
-        _memstore_keyval = kwargs.pop("memstore_keyval", {})
+        _memstore_keyval = kwargs.pop("memstore_keyval", None) or StdLibKeyValStore()
         _memstore_queue = kwargs.pop("memstore_queue", {})
+        _memstore_pubsub = kwargs.pop("memstore_pubsub", None) or StdLibBroker()
         return cls(
             runtime_info=RuntimeInfo.auto(**kwargs),
             _memstore_keyval=_memstore_keyval,
             _memstore_queue=_memstore_queue,
+            _memstore_pubsub=_memstore_pubsub,
         )
 
 
@@ -0,0 +1,154 @@
+import enum
+import threading
+from collections import deque
+from typing import Iterator, Optional
+
+from fred.settings import logger_manager
+from fred.dao.settings import (
+    FRD_PUBSUB_BUFFER_SIZE,
+    FRD_PUBSUB_OVERFLOW_POLICY,
+    FRD_PUBSUB_BLOCK_TIMEOUT,
+)
+
+logger = logger_manager.get_logger(name=__name__)
+
+
+class StdLibOverflowPolicy(enum.Enum):
+    """What to do with a new message when the buffer of a subscriber is full."""
+    DROP_OLDEST = "DROP_OLDEST"  # Discard the oldest buffered message (i.e., slow subscribers see the latest state)
+    DROP_NEWEST = "DROP_NEWEST"  # Discard the new message
+    BLOCK = "BLOCK"  # Wait (bounded) for the subscriber to catch up; the message is dropped on timeout
+
+
+class StdLibSubscription:
+    """A subscriber of the in-process broker with a bounded message buffer.
+    The interface mirrors the (subset used from the) Redis PubSub object: 'subscribe',
+    'unsubscribe', 'get_message', 'listen', and 'close'; the messages are dictionaries
+    with the same shape as the Redis ones (i.e., 'type', 'pattern', 'channel', 'data').
+    """
+
+    def __init__(
+            self,
+            broker: "StdLibBroker",
+            maxsize: int = FRD_PUBSUB_BUFFER_SIZE,
+            policy: StdLibOverflowPolicy = StdLibOverflowPolicy[FRD_PUBSUB_OVERFLOW_POLICY],
+            block_timeout: float = FRD_PUBSUB_BLOCK_TIMEOUT,
+    ):
+        self.broker = broker
+        self.maxsize = max(1, maxsize)
+        self.policy = policy
+        self.block_timeout = block_timeout
+        self.channels: set[str] = set()
+        self.dropped = 0
+        self.closed = False
+        self._buffer: deque[dict] = deque()
+        self._cond = threading.Condition()
+
+    def _push(self, message: dict) -> bool:
+        with self._cond:
+            if len(self._buffer) >= self.maxsize:
+                match self.policy:
+                    case StdLibOverflowPolicy.DROP_OLDEST:
+                        self._buffer.popleft()
+                        self.dropped += 1
+                    case StdLibOverflowPolicy.DROP_NEWEST:
+                        self.dropped += 1
+                        return False
+                    case StdLibOverflowPolicy.BLOCK:
+                        if not self._cond.wait_for(
+                            lambda: self.closed or len(self._buffer) < self.maxsize,
+                            timeout=self.block_timeout,
+                        ) or self.closed:
+                            self.dropped += 1
+                            logger.warning(f"Subscriber buffer full after {self.block_timeout}s; dropping message.")
+                            return False
+            self._buffer.append(message)
+            self._cond.notify_all()
+            return True
+
+    def subscribe(self, *channels: str) -> None:
+        for channel in channels:
+            if channel in self.channels:
+                continue
+            self.channels.add(channel)
+            # The confirmation is buffered before registering; thus, it precedes every message of the channel
+            self._push({"type": "subscribe", "pattern": None, "channel": channel, "data": len(self.channels)})
+            self.broker._register(subscription=self, channel=channel)
+
+    def unsubscribe(self, *channels: str) -> None:
+        for channel in channels or list(self.channels):
+            if channel not in self.channels:
+                continue
+            self.broker._unregister(subscription=self, channel=channel)
+            self.channels.discard(channel)
+            self._push({"type": "unsubscribe", "pattern": None, "channel": channel, "data": len(self.channels)})
+
+    def get_message(self, timeout: Optional[float] = 0.0) -> Optional[dict]:
+        """Returns the next buffered message; waits up to 'timeout' seconds (forever if None)."""
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._buffer or self.closed, timeout=timeout) or not self._buffer:
+                return None
+            message = self._buffer.popleft()
+            # Wakes up the publishers blocked on a full buffer
+            self._cond.notify_all()
+            return message
+
+    def listen(self) -> Iterator[dict]:
+        while not self.closed:
+            if (message := self.get_message(timeout=None)) is not None:
+                yield message
+
+    def close(self) -> None:
+        self.unsubscribe()
+        with self._cond:
+            self.closed = True
+            self._buffer.clear()
+            self._cond.notify_all()
+
+
+class StdLibBroker:
+    """Thread-safe in-process publish-subscribe broker (fan-out to every subscriber of a channel)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._channels: dict[str, set[StdLibSubscription]] = {}
+
+    def _register(self, subscription: StdLibSubscription, channel: str) -> None:
+        with self._lock:
+            self._channels.setdefault(channel, set()).add(subscription)
+
+    def _unregister(self, subscription: StdLibSubscription, channel: str) -> None:
+        with self._lock:
+            if (subscriptions := self._channels.get(channel)) is None:
+                return
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                self._channels.pop(channel, None)
+
+    def pubsub(self, **kwargs) -> StdLibSubscription:
+        return StdLibSubscription(broker=self, **kwargs)
+
+    def publish(self, channel: str, item: str) -> int:
+        """Delivers the item to every subscriber of the channel.
+        Returns:
+            int: The number of subscribers that received the message (as the Redis PUBLISH command).
+        """
+        with self._lock:
+            subscriptions = list(self._channels.get(channel, ()))
+        # The buffers are filled outside the broker lock; a blocking subscriber only delays this publisher
+        message = {"type": "message", "pattern": None, "channel": channel, "data": item}
+        return sum(subscription._push(message) for subscription in subscriptions)
+
+    def numsub(self, channel: str) -> int:
+        with self._lock:
+            return len(self._channels.get(channel, ()))
+
+    def stats(self) -> dict:
+        with self._lock:
+            subscriptions = {subscription for channel in self._channels.values() for subscription in channel}
+            return {
+                "channels": len(self._channels),
+                "subscribers": len(subscriptions),
+                "buffered": sum(len(subscription._buffer) for subscription in subscriptions),
+                "dropped": sum(subscription.dropped for subscription in subscriptions),
+            }
@@ -0,0 +1,246 @@
+import sys
+import enum
+import heapq
+import time
+import threading
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from typing import Any, Iterator, Optional
+
+from fred.settings import logger_manager
+from fred.dao.settings import (
+    FRD_STDLIB_KEYVAL_MAXSIZE,
+    FRD_STDLIB_KEYVAL_EVICTION_POLICY,
+)
+
+logger = logger_manager.get_logger(name=__name__)
+
+_MISSING = object()
+
+
+class StdLibEvictionPolicy(enum.Enum):
+    """Which keys can be evicted when the store is full (mirrors the Redis 'maxmemory-policy' options)."""
+    VOLATILE_LRU = "VOLATILE_LRU"  # Least recently used keys among the ones with an expiration (e.g., future records)
+    ALLKEYS_LRU = "ALLKEYS_LRU"  # Least recently used keys (including the ones without expiration)
+
+
+class StdLibKeyValStore(MutableMapping):
+    """Thread-safe in-process key-value store with per-key expiration and optional LRU eviction.
+    Expired keys are removed lazily (i.e., on access) and by a background sweeper thread that sleeps
+    until the next deadline (a min-heap of expiration times). When a maximum size is set, the least
+    recently used keys are evicted on insertion according to the eviction policy; with the default
+    'VOLATILE_LRU' policy, the keys without expiration (e.g., the processing lists of the reliable
+    queues) are never evicted. The store exposes the dictionary interface used by the components.
+    Args:
+        maxsize (int): Maximum number of keys; 0 means unbounded.
+        policy (StdLibEvictionPolicy): Which keys can be evicted once the store is full.
+    """
+
+    def __init__(
+            self,
+            maxsize: int = FRD_STDLIB_KEYVAL_MAXSIZE,
+            policy: StdLibEvictionPolicy = StdLibEvictionPolicy[FRD_STDLIB_KEYVAL_EVICTION_POLICY],
+    ):
+        self.maxsize = max(0, maxsize)
+        self.policy = policy
+        self.expired = 0
+        self.evicted = 0
+        self._data: OrderedDict[str, Any] = OrderedDict()
+        # The expiration deadlines; also the LRU order of the volatile keys (i.e., the eviction candidates)
+        self._expires: OrderedDict[str, float] = OrderedDict()
+        self._deadlines: list[tuple[float, str]] = []
+        self._lock = threading.RLock()
+        self._wakeup = threading.Condition(self._lock)
+        self._sweeper: Optional[threading.Thread] = None
+        self._overflowing = False
+
+    # Internal helpers (the lock must be held)
+
+    def _alive(self, key: str) -> bool:
+        if (deadline := self._expires.get(key)) is not None and deadline <= time.monotonic():
+            self._remove(key)
+            self.expired += 1
+            return False
+        return key in self._data
+
+    def _touch(self, key: str) -> None:
+        self._data.move_to_end(key)
+        if key in self._expires:
+            self._expires.move_to_end(key)
+
+    def _remove(self, key: str) -> Any:
+        self._expires.pop(key, None)
+        return self._data.pop(key, _MISSING)
+
+    def _evict(self) -> None:
+        if not self.maxsize:
+            return
+        candidates = self._data if self.policy == StdLibEvictionPolicy.ALLKEYS_LRU else self._expires
+        while len(self._data) > self.maxsize:
+            if not candidates:
+                # Warned once per overflow (i.e., not on every insertion until a key can be evicted again)
+                if not self._overflowing:
+                    logger.warning(f"In-memory store is over its maximum size ({self.maxsize}); no key can be evicted.")
+                self._overflowing = True
+                return
+            self._remove(next(iter(candidates)))
+            self.evicted += 1
+        self._overflowing = False
+
+    def _schedule(self, key: str, deadline: float) -> None:
+        self._expires[key] = deadline
+        self._expires.move_to_end(key)
+        if self._deadlines and len(self._deadlines) > 2 * len(self._expires) + 1024:
+            # Drops the stale heap entries (i.e., renewed or removed expirations)
+            self._deadlines = [(when, name) for name, when in self._expires.items()]
+            heapq.heapify(self._deadlines)
+        else:
+            heapq.heappush(self._deadlines, (deadline, key))
+        if self._sweeper is None:
+            self._sweeper = threading.Thread(target=self._sweep_forever, name="frd-stdlib-sweeper", daemon=True)
+            self._sweeper.start()
+        elif self._deadlines[0][0] == deadline:
+            # The new deadline is the earliest one; the sweeper must wake up earlier
+            self._wakeup.notify()
+
+    def _sweep_forever(self) -> None:
+        with self._wakeup:
+            while True:
+                self.sweep()
+                timeout = self._deadlines[0][0] - time.monotonic() if self._deadlines else None
+                self._wakeup.wait(timeout=timeout)
+
+    # Expiration
+
+    def sweep(self) -> int:
+        """Removes the expired keys; returns the number of removed keys."""
+        removed = 0
+        with self._lock:
+            now = time.monotonic()
+            while self._deadlines and self._deadlines[0][0] <= now:
+                deadline, key = heapq.heappop(self._deadlines)
+                # Stale entries (i.e., the expiration was renewed or removed) are skipped
+                if self._expires.get(key) == deadline:
+                    self._remove(key)
+                    removed += 1
+            self.expired += removed
+        return removed
+
+    def expire(self, key: str, seconds: float) -> bool:
+        """Sets the time-to-live (in seconds) of an existing key; returns False if the key does not exist."""
+        with self._lock:
+            if not self._alive(key):
+                return False
+            self._schedule(key, time.monotonic() + seconds)
+            return True
+
+    def persist(self, key: str) -> bool:
+        """Removes the expiration of the key; returns True if the key had one."""
+        with self._lock:
+            return self._expires.pop(key, None) is not None
+
+    def ttl(self, key: str) -> Optional[float]:
+        """Returns the remaining time-to-live (in seconds) of the key; None if missing or without expiration."""
+        with self._lock:
+            if not self._alive(key) or (deadline := self._expires.get(key)) is None:
+                return None
+            return deadline - time.monotonic()
+
+    def set(self, key: str, value: Any, expire: Optional[float] = None, keepttl: bool = False) -> None:
+        """Sets the value (as the Redis SET command, the previous expiration is cleared unless 'keepttl')."""
+        with self._lock:
+            alive = self._alive(key)
+            self._data[key] = value
+            self._touch(key)
+            if expire:
+                self._schedule(key, time.monotonic() + expire)
+            elif not (keepttl and alive):
+                self._expires.pop(key, None)
+            self._evict()
+
+    # Dictionary interface
+
+    def __getitem__(self, key: str) -> Any:
+        with self._lock:
+            if not self._alive(key):
+                raise KeyError(key)
+            self._touch(key)
+            return self._data[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.set(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock:
+            if not self._alive(key):
+                raise KeyError(key)
+            self._remove(key)
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            return isinstance(key, str) and self._alive(key)
+
+    def __iter__(self) -> Iterator[str]:
+        # Iterates over a snapshot of the (non-expired) keys; safe under concurrent writes
+        with self._lock:
+            now = time.monotonic()
+            return iter([key for key in self._data if self._expires.get(key, now + 1) > now])
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            if not self._alive(key):
+                return default
+            self._touch(key)
+            return self._data[key]
+
+    def pop(self, key: str, default: Any = _MISSING) -> Any:
+        with self._lock:
+            value = self._remove(key) if self._alive(key) else _MISSING
+        if value is _MISSING:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        return value
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        # Atomic (i.e., concurrent callers always share the same value)
+        with self._lock:
+            if not self._alive(key):
+                self.set(key, default)
+            return self._data[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._expires.clear()
+            self._deadlines.clear()
+
+    def stats(self) -> dict:
+        """Returns the store metrics, including an estimate of the memory used by the keys and values (in bytes)."""
+        with self._lock:
+            items = list(self._data.items())
+            stats = {
+                "keys": len(items),
+                "volatile": len(self._expires),
+                "maxsize": self.maxsize,
+                "policy": self.policy.value,
+                "expired": self.expired,
+                "evicted": self.evicted,
+            }
+        # The (shallow) sizes of the containers and their direct items; computed outside of the lock
+        stats["memory_bytes"] = sum(sys.getsizeof(key) + _sizeof(value) for key, value in items)
+        return stats
+
+
+def _sizeof(value: Any) -> int:
+    match value:
+        case dict():
+            return sys.getsizeof(value) + sum(sys.getsizeof(key) + sys.getsizeof(item) for key, item in value.items())
+        case list() | tuple() | set():
+            return sys.getsizeof(value) + sum(sys.getsizeof(item) for item in value)
+        case _:
+            return sys.getsizeof(value)
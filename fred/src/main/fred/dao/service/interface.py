@@ -47,6 +47,14 @@ class ServiceInterface(Generic[T]):
         if not getattr(self, "instance", None):
             self.instance = self._create_instance(**getattr(self, "config", {}))
         return self.instance
+
+    @property
+    def aclient(self):
+        """Returns an asyncio-compatible client for the service (bound to the running event loop).
+        Services without a native async client do not override this property; their components
+        should offload the blocking calls into a worker thread instead.
+        """
+        raise NotImplementedError(f"Async client not available for service {self.__class__.__name__}")
     
     def close(self):
         # Close the instance if it has a close method.
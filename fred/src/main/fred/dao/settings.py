@@ -0,0 +1,59 @@
+from fred.settings import get_environ_variable
+
+
+# Maximum number of messages buffered per subscriber by the in-process (STDLIB) pub/sub broker
+FRD_PUBSUB_BUFFER_SIZE = int(get_environ_variable(
+    name="FRD_PUBSUB_BUFFER_SIZE",
+    default="1000",
+))
+
+# Maximum time (in seconds) the subscription multiplexer listener blocks on the shared pub/sub connection before
+# sending the pending SUBSCRIBE/UNSUBSCRIBE commands (i.e., the connection is only used by the listener thread)
+FRD_PUBSUB_LISTEN_INTERVAL = float(get_environ_variable(
+    name="FRD_PUBSUB_LISTEN_INTERVAL",
+    default="0.05",
+))
+
+# What to do when a subscriber buffer is full: 'DROP_OLDEST', 'DROP_NEWEST', or 'BLOCK' (the publisher
+# waits up to 'FRD_PUBSUB_BLOCK_TIMEOUT' seconds for the subscriber to catch up and then drops the message)
+FRD_PUBSUB_OVERFLOW_POLICY = get_environ_variable(
+    name="FRD_PUBSUB_OVERFLOW_POLICY",
+    default="DROP_OLDEST",
+).upper()
+
+FRD_PUBSUB_BLOCK_TIMEOUT = float(get_environ_variable(
+    name="FRD_PUBSUB_BLOCK_TIMEOUT",
+    default="1.0",
+))
+
+# Default bounds of the client-side key-value caches (see 'FredKeyVal.with_cache'): maximum number of
+# entries (least recently used entries are evicted first) and time-to-live (in seconds) of each entry
+FRD_KEYVAL_CACHE_SIZE = int(get_environ_variable(
+    name="FRD_KEYVAL_CACHE_SIZE",
+    default="10000",
+))
+
+FRD_KEYVAL_CACHE_TTL = float(get_environ_variable(
+    name="FRD_KEYVAL_CACHE_TTL",
+    default="60.0",
+))
+
+# Enables the Redis server-assisted client-side caching (RESP3 tracking; i.e., the cached reads are invalidated
+# by the server) on the synchronous connection pools with the given maximum number of entries; 0 disables it
+FRD_REDIS_CLIENT_CACHE_SIZE = int(get_environ_variable(
+    name="FRD_REDIS_CLIENT_CACHE_SIZE",
+    default="0",
+))
+
+# Bounds of the in-process (STDLIB) key-value store: maximum number of keys (0 means unbounded) and which
+# keys can be evicted once it's full: 'VOLATILE_LRU' (least recently used keys with an expiration; the keys
+# without expiration, such as the processing lists of the reliable queues, are kept) or 'ALLKEYS_LRU'
+FRD_STDLIB_KEYVAL_MAXSIZE = int(get_environ_variable(
+    name="FRD_STDLIB_KEYVAL_MAXSIZE",
+    default="0",
+))
+
+FRD_STDLIB_KEYVAL_EVICTION_POLICY = get_environ_variable(
+    name="FRD_STDLIB_KEYVAL_EVICTION_POLICY",
+    default="VOLATILE_LRU",
+).upper()
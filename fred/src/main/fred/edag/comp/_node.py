@@ -1,14 +1,20 @@
 import uuid
 from inspect import Signature, signature, Parameter
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields
 from typing import Callable, Optional
 
 from fred.settings import logger_manager
 from fred.edag.comp.interface import ComponentInterface
+from fred.edag.policy import ExecutionPolicy
 
 logger = logger_manager.get_logger(__name__)
 
 
+def _load_node_fun(fname: str, payload: bytes) -> "NodeFun":
+    import dill
+    return NodeFun.auto(function=dill.loads(payload), name=fname)
+
+
 @dataclass(frozen=True, slots=True)
 class NodeFun:
     fname: str
@@ -46,6 +52,12 @@ class NodeFun:
             "kwargs": bound.kwargs,
         }
 
+    def __reduce__(self):
+        # The function is shipped by value (e.g., into the process-pool workers): the node decorator replaces
+        # the module attribute with the node; thus, pickling the function by reference would fail.
+        import dill
+        return _load_node_fun, (self.fname, dill.dumps(self.inner, recurse=True))
+
     def __call__(self, *args, **kwargs):
         params = self.validate_parameter_compliance(*args, **kwargs)
         return self.inner(*params["args"], **params["kwargs"])
@@ -70,9 +82,13 @@ class Node(ComponentInterface):
     nid: str = field(default_factory=lambda: str(uuid.uuid4()))
     _inplace: bool = False
     _explode: bool = False  # Whether this node's output should be exploded when used as input to another node
+    _policy: Optional[ExecutionPolicy] = None  # Where the node runs; defaults to 'INLINE' if inplace else 'THREAD'
+    _memoize: bool = False  # Whether the results are cached by the executor (keyed on the function, params, and inputs)
+    _memoize_ttl: Optional[float] = None  # Time-to-live (in seconds) of the cached results; None means the default
 
     def __hash__(self):
-        obj = asdict(self)
+        # Shallow field mapping (i.e., 'asdict' would deep-copy the function and the params on every hash)
+        obj = {attr.name: getattr(self, attr.name) for attr in fields(self)}
         obj["nfun"] = self.nfun.__hash__()
         obj["params"] = frozenset((obj.get("params") or {}).keys())  # only hash keys to avoid unhashable values
         return hash(frozenset(obj.items()))
@@ -89,9 +105,11 @@ class Node(ComponentInterface):
             value = kwargs.pop(key, None)
             if isinstance(value, bool):
                 kwargs["_inplace"] = value
+                inplace_requested = True
                 break
         else:
             kwargs["_inplace"] = self._inplace
+            inplace_requested = False
         # Verify if 'explode' is set via '_explode' or 'explode' keys; otherwise, keep current value
         for key in ("explode", "_explode"):
             value = kwargs.pop(key, None)
@@ -100,6 +118,26 @@ class Node(ComponentInterface):
                 break
         else:
             kwargs["_explode"] = self._explode
+        # Verify if 'policy' is set via '_policy' or 'policy' keys; otherwise, keep current value
+        # unless 'inplace' was explicitly requested (i.e., the policy would otherwise shadow it)
+        for key in ("policy", "_policy"):
+            if (value := kwargs.pop(key, None)) is not None:
+                kwargs["_policy"] = ExecutionPolicy.resolve(value)
+                break
+        else:
+            kwargs["_policy"] = None if inplace_requested else self._policy
+        # Verify if 'memoize' (and its time-to-live) is set with or without the underscore prefix
+        for key in ("memoize", "_memoize"):
+            value = kwargs.pop(key, None)
+            if isinstance(value, bool):
+                kwargs["_memoize"] = value
+                break
+        else:
+            kwargs["_memoize"] = self._memoize
+        kwargs["_memoize_ttl"] = next(
+            (kwargs.pop(key) for key in ("memoize_ttl", "_memoize_ttl") if key in kwargs),
+            self._memoize_ttl,
+        )
         # Create a new Node with updated attributes
         return self.__class__(
             **{
@@ -127,6 +165,9 @@ class Node(ComponentInterface):
             function: Callable,
             inplace: bool = False,
             explode: bool = False,
+            policy: Optional[str | ExecutionPolicy] = None,
+            memoize: bool = False,
+            memoize_ttl: Optional[float] = None,
             fname: Optional[str] = None,
             name: Optional[str] = None,
             key: Optional[str] = None,
@@ -139,6 +180,9 @@ class Node(ComponentInterface):
             nfun=NodeFun.auto(function=function, name=fname),
             _inplace=inplace,
             _explode=explode,
+            _policy=ExecutionPolicy.resolve(policy),
+            _memoize=memoize,
+            _memoize_ttl=memoize_ttl,
             params=params,
         )
 
@@ -152,6 +196,16 @@ class Node(ComponentInterface):
     def explode(self) -> "Node":
         return self.clone(_explode=True)
 
+    @property
+    def policy(self) -> ExecutionPolicy:
+        return self._policy or (ExecutionPolicy.INLINE if self._inplace else ExecutionPolicy.THREAD)
+
+    def with_policy(self, policy: str | ExecutionPolicy) -> "Node":
+        return self.clone(_policy=policy)
+
+    def memoize(self, ttl: Optional[float] = None) -> "Node":
+        return self.clone(_memoize=True, _memoize_ttl=ttl)
+
     @property
     def E(self) -> "Node":
         # Shortcut to set explode=True
@@ -172,6 +226,9 @@ class Node(ComponentInterface):
             params=self.params,
             _inplace=self._inplace,
             _explode=self._explode,
+            _policy=self._policy,
+            _memoize=self._memoize,
+            _memoize_ttl=self._memoize_ttl,
         )
 
     def with_params(self, update_key: Optional[str] = None, **params) -> "Node":
@@ -185,6 +242,9 @@ class Node(ComponentInterface):
             },
             _inplace=self._inplace,
             _explode=self._explode,
+            _policy=self._policy,
+            _memoize=self._memoize,
+            _memoize_ttl=self._memoize_ttl,
         )
 
     def execute(self, *args, **kwargs):
@@ -192,7 +252,13 @@ class Node(ComponentInterface):
             **self.params,
             **kwargs
         }
-        if self._inplace:
-            return self.fun(*args, **params)
         from fred.future.impl import Future
-        return Future(self.fun, **params)
+        match self.policy:
+            case ExecutionPolicy.INLINE:
+                return self.fun(*args, **params)
+            case ExecutionPolicy.PROCESS:
+                # The process-pool call is awaited by a future (i.e., the scheduler keeps launching other nodes)
+                from fred.edag.transport import call_in_process
+                return Future(lambda: call_in_process(self.fun, *args, **params))
+            case _:
+                return Future(self.fun, **params)
@@ -1,12 +1,24 @@
 import uuid
+from collections import deque
+from functools import partial
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future as TaskHandle,
+    wait as wait_tasks,
+)
 from graphlib import TopologicalSorter
-from dataclasses import dataclass, field
-from typing import Any, Optional
+from dataclasses import dataclass, field, replace
+from inspect import Parameter
+from typing import Any, Iterable, Optional
 
 from fred.future.impl import Future
 from fred.settings import logger_manager
 from fred.edag.comp.catalog import CompCatalog
+from fred.edag.fanout import FanOut
+from fred.edag.memo import NodeMemo
 from fred.edag.plan import Plan
+from fred.edag.policy import ExecutionPolicy
+from fred.edag.settings import FRD_EDAG_MAX_PARALLELISM
 
 
 logger = logger_manager.get_logger(__name__)
@@ -16,98 +28,186 @@ logger = logger_manager.get_logger(__name__)
 class Executor:
     predmap: dict[CompCatalog.NODE.ref, set[CompCatalog.NODE.ref]]
     results: dict[str, dict[str, Any]] = field(default_factory=dict)
+    memo_stats: dict[str, dict[str, Any]] = field(default_factory=dict)
 
     @classmethod
     def from_plan(cls, plan: Plan, **kwargs) -> "Executor":
         return cls(predmap=plan.as_predmap(**kwargs))
     
-    def get_tsort(self) -> TopologicalSorter:
-        return TopologicalSorter(self.predmap)
-        
+    def index(self) -> tuple[dict[str, CompCatalog.NODE.ref], dict[str, tuple[str, ...]]]:
+        """Indexes the plan by node ID: returns the nodes and the parent IDs of each node.
+        The scheduler works on the (string) IDs so that the nodes are not hashed on every step."""
+        nodes = {node.nid: node for node in self.predmap}
+        graph = {
+            node.nid: tuple(parent.nid for parent in parents)
+            for node, parents in self.predmap.items()
+        }
+        return nodes, graph
+
+    def get_tsort(self, graph: Optional[dict[str, tuple[str, ...]]] = None) -> TopologicalSorter:
+        if graph is None:
+            _, graph = self.index()
+        return TopologicalSorter(graph)
+
+    @staticmethod
+    def accepts(node: CompCatalog.NODE.ref) -> Optional[frozenset[str]]:
+        """Returns the argument names the node function accepts (None if it accepts any keyword)."""
+        parameters = node.nfun.signature.parameters.values()
+        if any(param.kind == Parameter.VAR_KEYWORD for param in parameters):
+            return None
+        return frozenset(param.name for param in parameters) | {"*"}
+
+    @staticmethod
+    def collect(
+            available: Iterable[dict],
+            accepts: Optional[frozenset[str]] = None,
+            start_with: Optional[dict] = None,
+    ) -> dict:
+        """Merges the node input arguments from the available outputs on top of the provided starting values.
+        When the accepted arguments are known, only those are looked up (i.e., the cost does not depend on
+        the size of the outputs) since the node function would drop the remaining ones anyway."""
+        kwargs = dict(start_with or {})
+        for node_out in available:
+            if accepts is None or len(node_out) <= len(accepts):
+                kwargs.update(node_out)
+            else:
+                kwargs.update({arg: node_out[arg] for arg in accepts if arg in node_out})
+        return kwargs if accepts is None else {
+            arg: val
+            for arg, val in kwargs.items()
+            if arg in accepts
+        }
+
+    def launch(self, node: CompCatalog.NODE.ref, kwargs: dict, fanout: Optional[FanOut] = None) -> Any:
+        """Executes the node; returns either the node output (i.e., inplace nodes) or a running Future.
+        In iterator mode (i.e., '*' input), the items are mapped via the fan-out stage; an empty (or None)
+        input produces an empty list (i.e., the node is not executed without items). Generators are only
+        streamed when the producer node is inplace; the output of the other nodes is persisted by its
+        Future, thus those producers must return a materialized iterable (e.g., a list) instead.
+        """
+        # Handle iterator mode; if '*' is provided in kwargs, execute node for each item in the iterator
+        # and collect results in a list (same order as the items).
+        # We should 'pop' to simulate 'consuming' the iterator input and avoid passing it to other nodes.
+        if "*" in kwargs:
+            logger.debug(f"Executor mapping functionality detected: Node '{node.name}' executing in iterator mode.")
+            # TODO: https://github.com/fahera-mx/fred-oss/issues/179
+            # TODO: Can we consider exploiting the item components?
+            iterator = kwargs.pop("*") or ()
+            function = partial(node.fun, **node.params)
+            fanout = fanout or FanOut.auto()
+            # An explicit node policy decides where the items run (e.g., a process pool for CPU-bound nodes)
+            fanout = fanout if node._policy is None else replace(fanout, policy=node._policy)
+
+            def stage() -> list:
+                return list(fanout.map(function=function, items=iterator))
+
+            # The map stage itself runs as a single future (i.e., the scheduler keeps launching other nodes)
+            return stage() if node.policy == ExecutionPolicy.INLINE else Future(stage)
+        return node.execute(**kwargs)
+
+    def store(
+            self,
+            run_id: str,
+            node: CompCatalog.NODE.ref,
+            value: Any,
+            non_destructive_node_explosion: bool = False,
+    ) -> None:
+        output = {node.key: value}
+        # We can only explode if  requested and the output result is a dict
+        if node._explode and isinstance(value, dict):
+            output = {
+                # Keep original output if non-destrictive-explode is requested;
+                # The original key can be overwritten if key collides during explosion.
+                **(output if non_destructive_node_explosion else {}),
+                # Explode keys into the output dict
+                **value,
+            }
+        # Store output in results
+        self.results[run_id][node.name] = output
+
     def loop(
             self,
             run_id: str,
-            tsort: TopologicalSorter,
-            prev_layer: list[list[str]],
             start_with: Optional[dict] = None,
             unrestricted: bool = False,
             non_destructive_node_explosion: bool = False,
+            max_parallelism: int = FRD_EDAG_MAX_PARALLELISM,
+            fanout: Optional[FanOut] = None,
+            memo: Optional[NodeMemo] = None,
     ) -> list[list[str]]:
-        start_with = start_with or {}
-        if not (nodes := tsort.get_ready()):
-            return prev_layer
-        # You can only get access to results of previous layers unless unrestricted is requested.
-        prev_layer_results = self.results[run_id] if unrestricted else {
-            key: val
-            for key, val in self.results[run_id].items()
-            if key in prev_layer[-1]
-        }
-        curr_layer = []
-        for node in nodes:
-            parents = [
-                parent.name
-                for parent in self.predmap.get(node, [])
-            ]
-            accessible_results = prev_layer_results if unrestricted else {
-                key: val
-                for key, val in prev_layer_results.items()
-                if key in parents
-            }
-            kwargs = {
-                **start_with,
-                **{
-                    arg: val
-                    for node_key, node_out in accessible_results.items()
-                    for arg, val in node_out.items()
-                }
-            }
-            # Handle iterator mode; if '*' is provided in kwargs, execute node for each item in the iterator
-            # and collect results in a list.
-            # We should 'pop' to simulate 'consuming' the iterator input and avoid passing it to other nodes.
-            if (iterator := kwargs.pop("*", None)):
-                logger.debug(f"Executor mapping functionality detected: Node '{node.name}' executing in iterator mode.")
-                # TODO: https://github.com/fahera-mx/fred-oss/issues/179
-                # TODO: Can we consider exploiting the item components?
-                node_output = [
-                    node.execute(item)
-                    for item in iterator
-                ]
-            else:
-                node_output = node.execute(**kwargs)
-            # Execute node function
-            match node_output:
-                case Future() as future:
-                    # Can't we just build the whole graph in the future and 'wait_and_resolve' only at the end?
-                    # Or at least per layer/generation?
-                    output = {node.key: future.wait_and_resolve()}
-                case present:
-                    output = {node.key: present}
-            # We can only explode if  requested and the output result is a dict
-            if node._explode and isinstance(output.get(node.key), dict):
-                output = {
-                    # Keep original output if non-destrictive-explode is requested;
-                    # The original key can be overwritten if key collides during explosion.
-                    **(output if non_destructive_node_explosion else {}),
-                    # Explode keys into the output dict
-                    **output[node.key],
-                }
-            # Store output in results
-            self.results[run_id][node.name] = {
-                #**self.results[run_id].get(node.name, {}),
-                **output,
-            }
-            # Mark node as done
-            tsort.done(node)
-            curr_layer.append(node.name)
-        prev_layer.append(curr_layer)
-        return self.loop(
-            run_id=run_id,
-            tsort=tsort,
-            prev_layer=prev_layer,
-            unrestricted=unrestricted,
-            start_with={},  # Only availabe during the first layer call
-            non_destructive_node_explosion=non_destructive_node_explosion,
-        )
+        """Executes the plan; every ready node is launched as soon as its parents are done (i.e., independent
+        nodes run concurrently) and each node is marked as done as soon as it completes, so that its successors
+        are scheduled right away instead of waiting for a whole layer. The scheduler is iterative (i.e., the
+        plan depth is not bounded by the recursion limit) and the parents of each node are indexed upfront.
+        Args:
+            run_id (str): The execution identifier (i.e., the key of the results).
+            start_with (Optional[dict]): Input arguments only available to the source nodes.
+            unrestricted (bool): Whether the nodes can access every available result (not only their parents').
+            non_destructive_node_explosion (bool): Whether to keep the original output of exploded nodes.
+            max_parallelism (int): Maximum number of nodes running concurrently; 0 means unbounded.
+            fanout (Optional[FanOut]): Map stage configuration of the nodes in iterator mode.
+            memo (Optional[NodeMemo]): Store of the memoized node results; defaults to the shared store.
+        Returns:
+            list[list[str]]: The names of the nodes in the order they became ready (i.e., the scheduling waves).
+        """
+        nodes, graph = self.index()
+        tsort = self.get_tsort(graph=graph)
+        tsort.prepare()
+        results = self.results[run_id]
+        # Unrestricted nodes see every output (in completion order) merged into a single mapping
+        merged: dict[str, Any] = {}
+        layers: list[list[str]] = [[]]
+        ready: deque = deque()
+        running: dict[TaskHandle, tuple[CompCatalog.NODE.ref, Future, Optional[str]]] = {}
+        sources: Optional[set[str]] = None
+        stats = self.memo_stats.setdefault(run_id, {"hits": 0, "misses": 0, "cached": []})
+
+        def complete(node: CompCatalog.NODE.ref, value: Any, memo_key: Optional[str] = None):
+            if memo is not None and memo_key is not None:
+                memo.store(key=memo_key, value=value, ttl=node._memoize_ttl)
+            self.store(run_id, node, value, non_destructive_node_explosion)
+            if unrestricted:
+                merged.update(results[node.name])
+            tsort.done(node.nid)
+
+        while tsort.is_active():
+            if (nids := tsort.get_ready()):
+                layers.append([nodes[nid].name for nid in nids])
+                ready.extend(nids)
+                # The starting values are only available to the nodes of the first layer
+                sources = set(nids) if sources is None else sources
+            if ready and (max_parallelism <= 0 or len(running) < max_parallelism):
+                nid = ready.popleft()
+                node = nodes[nid]
+                kwargs = self.collect(
+                    available=[merged] if unrestricted else [results[nodes[parent].name] for parent in graph[nid]],
+                    accepts=self.accepts(node),
+                    start_with=start_with if sources is not None and nid in sources else None,
+                )
+                memo_key = None
+                if node._memoize:
+                    memo = memo or NodeMemo.shared()
+                    if (memo_key := memo.key(node=node, kwargs=kwargs)) is not None:
+                        hit, value = memo.lookup(key=memo_key)
+                        stats["hits" if hit else "misses"] += 1
+                        if hit:
+                            stats["cached"].append(node.name)
+                            complete(node, value)
+                            continue
+                match self.launch(node=node, kwargs=kwargs, fanout=fanout):
+                    case Future() as future:
+                        running[future.task] = (node, future, memo_key)
+                    case present:
+                        complete(node, present, memo_key)
+                continue
+            if not running:
+                raise RuntimeError("Executor has no ready nor running nodes but the plan is not done.")
+            # Nothing else can be launched; wait for (at least) one of the running nodes to complete
+            completed, _ = wait_tasks(running, return_when=FIRST_COMPLETED)
+            for task in completed:
+                node, future, memo_key = running.pop(task)
+                complete(node, future.wait_and_resolve(), memo_key)
+        return layers
 
     def execute(
             self,
@@ -115,6 +215,9 @@ class Executor:
             unrestricted: bool = False,
             start_with: Optional[dict] = None,
             non_destructive_node_explosion: bool = False,
+            max_parallelism: Optional[int] = None,
+            fanout: Optional[FanOut] = None,
+            memo: Optional[NodeMemo] = None,
         ) -> dict:
         from fred.utils.dateops import datetime_utcnow
 
@@ -123,17 +226,15 @@ class Executor:
         # Initialize in-memory result storage for this run
         # TODO: Swap the result-store to our fred-keyval implementation
         self.results[run_id] = {}
-        # Prepare TopologicalSorter
-        tsort = self.get_tsort()
-        tsort.prepare()
         # Execute nodes in topological order
         layers = self.loop(
             run_id=run_id,
-            tsort=tsort,
-            prev_layer=[[]],
             unrestricted=unrestricted,
             start_with=start_with or {},
             non_destructive_node_explosion=non_destructive_node_explosion,
+            max_parallelism=FRD_EDAG_MAX_PARALLELISM if max_parallelism is None else max_parallelism,
+            fanout=fanout,
+            memo=memo,
         )
         return {
             "run_id": run_id,
@@ -141,4 +242,6 @@ class Executor:
             "run_end": datetime_utcnow(),
             "results": self.results[run_id] if keep else self.results.pop(run_id),
             "layers": layers,
+            # Memoized nodes served from the store ('cached') and the lookup counters of this run
+            "memo": self.memo_stats[run_id] if keep else self.memo_stats.pop(run_id),
         }
@@ -0,0 +1,57 @@
+from collections import deque
+from dataclasses import dataclass
+from itertools import batched
+from typing import Any, Callable, Iterable, Iterator
+
+from fred.edag.policy import ExecutionPolicy
+from fred.edag.settings import (
+    FRD_EDAG_FANOUT_POLICY,
+    FRD_EDAG_FANOUT_PARALLELISM,
+    FRD_EDAG_FANOUT_CHUNK_SIZE,
+)
+
+
+def _apply(function: Callable, chunk: tuple) -> list:
+    # Module-level to be picklable (i.e., process-pool tasks)
+    return [function(item) for item in chunk]
+
+
+@dataclass(frozen=True, slots=True)
+class FanOut:
+    """Map stage of the nodes in iterator mode (i.e., 'node[...]'): the items are grouped in chunks
+    and executed via the pool of the execution policy with at most 'parallelism' chunks in flight.
+    The input is consumed lazily (i.e., generators are not materialized upfront) and the results
+    are yielded in the input order. Note that generators can only reach the map stage from inplace
+    producer nodes (see 'Executor.launch').
+    """
+    policy: ExecutionPolicy = ExecutionPolicy[FRD_EDAG_FANOUT_POLICY]
+    parallelism: int = FRD_EDAG_FANOUT_PARALLELISM
+    chunk_size: int = FRD_EDAG_FANOUT_CHUNK_SIZE
+
+    @classmethod
+    def auto(cls, **kwargs) -> "FanOut":
+        return cls(
+            policy=ExecutionPolicy.resolve(kwargs.pop("policy", None)) or ExecutionPolicy[FRD_EDAG_FANOUT_POLICY],
+            parallelism=kwargs.pop("parallelism", None) or FRD_EDAG_FANOUT_PARALLELISM,
+            chunk_size=kwargs.pop("chunk_size", None) or FRD_EDAG_FANOUT_CHUNK_SIZE,
+        )
+
+    def map(self, function: Callable[[Any], Any], items: Iterable) -> Iterator:
+        chunks = batched(items, max(1, self.chunk_size))
+        if self.policy == ExecutionPolicy.INLINE:
+            for chunk in chunks:
+                yield from _apply(function, chunk)
+            return
+        parallelism = max(1, self.parallelism)
+        window: deque = deque()
+        try:
+            for chunk in chunks:
+                if len(window) >= parallelism:
+                    yield from window.popleft().result()
+                window.append(self.policy.submit(_apply, function, chunk))
+            while window:
+                yield from window.popleft().result()
+        finally:
+            # Pending chunks are dropped on failure (or when the consumer stops early)
+            for task in window:
+                task.cancel()
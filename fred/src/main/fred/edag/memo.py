@@ -0,0 +1,181 @@
+import math
+import types
+import pickle
+import hashlib
+import inspect
+from dataclasses import dataclass, fields, is_dataclass
+from functools import lru_cache
+from typing import Any, Optional
+
+from fred.settings import logger_manager
+from fred.dao.comp._cache import FredKeyValCache
+from fred.future.codec.catalog import FutureCodecCatalog
+from fred.edag.comp._node import Node
+from fred.edag.settings import (
+    FRD_EDAG_MEMO_BACKEND,
+    FRD_EDAG_MEMO_SIZE,
+    FRD_EDAG_MEMO_TTL,
+    FRD_EDAG_MEMO_PREFIX,
+)
+
+logger = logger_manager.get_logger(__name__)
+
+
+def _feed(hasher: "hashlib._Hash", value: Any, seen: set[int]) -> None:
+    # Canonical (i.e., process-independent) serialization of the value into the hasher
+    match value:
+        case None | bool() | int() | float() | complex() | str():
+            hasher.update(f"{type(value).__name__}:{value!r};".encode())
+        case bytes() | bytearray() | memoryview():
+            hasher.update(f"bytes:{len(value)}:".encode())
+            hasher.update(value)
+        case list() | tuple():
+            hasher.update(f"{type(value).__name__}:{len(value)}[".encode())
+            for item in value:
+                _feed(hasher, item, seen)
+            hasher.update(b"]")
+        case dict():
+            # Order-independent: the entries are sorted by the digest of their keys
+            hasher.update(f"dict:{len(value)}{{".encode())
+            entries = sorted(((digest(key, seen), item) for key, item in value.items()), key=lambda entry: entry[0])
+            for key_digest, item in entries:
+                hasher.update(key_digest.encode())
+                _feed(hasher, item, seen)
+            hasher.update(b"}")
+        case set() | frozenset():
+            hasher.update(f"set:{len(value)}{{{','.join(sorted(digest(item, seen) for item in value))}}}".encode())
+        case types.FunctionType() if id(value) in seen:
+            # Recursive references (e.g., a closure calling itself)
+            hasher.update(f"function:{value.__module__}.{value.__qualname__}:recursive;".encode())
+        case types.FunctionType():
+            seen.add(id(value))
+            hasher.update(f"function:{value.__module__}.{value.__qualname__}:".encode())
+            _feed_code(hasher, value.__code__)
+            _feed(hasher, value.__defaults__, seen)
+            _feed(hasher, value.__kwdefaults__, seen)
+            # Closures over different (immutable) values are different functions (e.g., factories of nodes);
+            # mutable state (e.g., clients, counters) only contributes its type to keep the keys stable
+            for cell in value.__closure__ or ():
+                match contents := cell.cell_contents:
+                    case (None | bool() | int() | float() | complex() | str() | bytes() | tuple() | frozenset()
+                          | types.FunctionType()):
+                        _feed(hasher, contents, seen)
+                    case _:
+                        hasher.update(f"cell:{type(contents).__module__}.{type(contents).__qualname__};".encode())
+        case inspect.Signature():
+            hasher.update(f"signature:{value};".encode())
+        case _ if hasattr(value, "tobytes") and hasattr(value, "dtype") and hasattr(value, "shape"):
+            # NumPy arrays (and alike); the raw buffer along with its layout
+            hasher.update(f"array:{value.dtype}:{value.shape}:".encode())
+            hasher.update(value.tobytes())
+        case _ if is_dataclass(value) and not isinstance(value, type):
+            hasher.update(f"{type(value).__module__}.{type(value).__qualname__}(".encode())
+            _feed(hasher, {attr.name: getattr(value, attr.name) for attr in fields(value)}, seen)
+            hasher.update(b")")
+        case _:
+            # Fallback (e.g., classes, builtins, and custom objects); unpicklable values cannot be memoized
+            hasher.update(b"pickle:")
+            hasher.update(pickle.dumps(value, protocol=5))
+
+
+def _feed_code(hasher: "hashlib._Hash", code: types.CodeType) -> None:
+    hasher.update(code.co_code)
+    for const in code.co_consts:
+        # Nested code objects (e.g., lambdas) are hashed by content; their 'repr' includes a memory address
+        if isinstance(const, types.CodeType):
+            _feed_code(hasher, const)
+        else:
+            hasher.update(f"{type(const).__name__}:{const!r};".encode())
+    hasher.update(",".join(code.co_names).encode())
+
+
+def digest(value: Any, seen: Optional[set[int]] = None) -> str:
+    """Returns a stable (i.e., the same across processes) SHA-256 digest of the value.
+    Raises:
+        TypeError: If the value (or any of its components) cannot be hashed (e.g., unpicklable objects).
+    """
+    hasher = hashlib.sha256()
+    try:
+        _feed(hasher, value, set() if seen is None else seen)
+    except (pickle.PicklingError, AttributeError, TypeError) as e:
+        raise TypeError(f"Value of type '{type(value).__name__}' cannot be digested: {e}") from e
+    return hasher.hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class NodeMemo:
+    """Content-addressed store of the node results; the entries are keyed on the node function identity
+    (i.e., its module, qualified name, code, defaults, and closure), the node params, and its inputs.
+    The results are either kept in memory (bounded LRU) or in a key-value component (e.g., Redis) to be
+    reused across processes; in both cases, the results are serialized via the DILL codec (i.e., every
+    hit is a fresh copy that the successor nodes can safely mutate).
+    Args:
+        cache (Optional[FredKeyValCache]): The in-memory store; used when no key-value component is provided.
+        keyval (Optional[type]): The key-value component (i.e., a 'FredKeyVal' class) of the store.
+        ttl (Optional[float]): Default time-to-live (in seconds) of the results; None means no expiration.
+        prefix (str): The prefix of the keys.
+    """
+    cache: Optional[FredKeyValCache] = None
+    keyval: Optional[type] = None
+    ttl: Optional[float] = FRD_EDAG_MEMO_TTL or None
+    prefix: str = FRD_EDAG_MEMO_PREFIX
+
+    @classmethod
+    def auto(cls, backend: Optional[str] = None, **kwargs) -> "NodeMemo":
+        from fred.dao.service.catalog import ServiceCatalog
+
+        ttl = kwargs.pop("ttl", FRD_EDAG_MEMO_TTL) or None
+        prefix = kwargs.pop("prefix", FRD_EDAG_MEMO_PREFIX)
+        match (backend or FRD_EDAG_MEMO_BACKEND).upper():
+            case "MEMORY":
+                cache = FredKeyValCache(maxsize=kwargs.pop("maxsize", FRD_EDAG_MEMO_SIZE), ttl=ttl)
+                return cls(cache=cache, ttl=ttl, prefix=prefix)
+            case service:
+                keyval = ServiceCatalog[service].component_catalog(**kwargs).KEYVAL.value
+                return cls(keyval=keyval, ttl=ttl, prefix=prefix)
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def shared(cls) -> "NodeMemo":
+        """Returns the process-wide store (lazily created on first use) configured via the settings."""
+        return cls.auto()
+
+    def key(self, node: Node, kwargs: dict) -> Optional[str]:
+        """Returns the key of the node results for the given inputs; None if the node cannot be memoized
+        for these inputs (e.g., unpicklable values or streamed iterators which hashing would consume)."""
+        if not isinstance(kwargs.get("*", ()), (list, tuple)):
+            return None
+        try:
+            return f"{self.prefix}:{digest((node.nfun.inner, node.nfun.signature, node.params, kwargs))}"
+        except TypeError as e:
+            logger.debug(f"Node '{node.name}' results cannot be memoized: {e}")
+            return None
+
+    def lookup(self, key: str) -> tuple[bool, Any]:
+        """Returns whether the key was found (i.e., a hit) and its cached value (a fresh copy on every hit)."""
+        try:
+            if self.keyval is not None:
+                payload = self.keyval(key=key).get()
+            else:
+                _, payload = self.cache.lookup(key) if self.cache is not None else (False, None)
+            return (False, None) if payload is None else (True, FutureCodecCatalog.DILL.codec.decode(payload=payload))
+        except Exception as e:
+            # The memoization must never fail the execution; the node is computed instead
+            logger.warning(f"Memoized result lookup failed for '{key}': {e}")
+            return False, None
+
+    def store(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = ttl or self.ttl
+        try:
+            # Snapshot of the result (i.e., mutating the returned value never alters the cached one)
+            payload = FutureCodecCatalog.DILL.encode(result=value)
+            if self.keyval is not None:
+                self.keyval(key=key).set(value=payload, **({"expire": math.ceil(ttl)} if ttl else {}))
+            elif self.cache is not None:
+                self.cache.store(key, payload, ttl=ttl)
+        except Exception as e:
+            logger.warning(f"Memoized result store failed for '{key}': {e}")
+
+    def clear(self) -> None:
+        if self.cache is not None:
+            self.cache.clear()
@@ -0,0 +1,91 @@
+import enum
+import threading
+import multiprocessing
+from concurrent.futures import Future as TaskHandle, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+from fred.settings import logger_manager
+from fred.future.executor.catalog import ExecutorCatalog
+from fred.edag.settings import (
+    FRD_EDAG_THREAD_POOL_MAX_WORKERS,
+    FRD_EDAG_PROCESS_POOL_MAX_WORKERS,
+    FRD_EDAG_PROCESS_START_METHOD,
+)
+
+logger = logger_manager.get_logger(__name__)
+
+# The process-wide pools by policy (lazily created on first use; a broken process-pool is replaced)
+_pools: dict["ExecutionPolicy", Any] = {}
+_pools_lock = threading.Lock()
+
+
+class ExecutionPolicy(enum.Enum):
+    """Where the edag work (e.g., the items of a node in iterator mode) is executed."""
+    INLINE = "INLINE"  # The calling thread
+    THREAD = "THREAD"  # The shared edag thread-pool (I/O-bound work)
+    PROCESS = "PROCESS"  # The shared edag process-pool (CPU-bound work; functions and values must be picklable)
+
+    def pool(self):
+        """Returns the process-wide pool of this policy (lazily created on first use); None for 'INLINE'."""
+        with _pools_lock:
+            if self not in _pools:
+                _pools[self] = self._create_pool()
+            return _pools[self]
+
+    def _discard_pool(self, pool) -> None:
+        # Only the given pool is dropped (i.e., another thread may have replaced it already)
+        with _pools_lock:
+            if _pools.get(self) is pool:
+                del _pools[self]
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def _create_pool(self):
+        match self:
+            case ExecutionPolicy.THREAD:
+                # A dedicated pool (i.e., not the shared future executor) since the future workers wait on this one
+                return ExecutorCatalog.POOL(max_workers=FRD_EDAG_THREAD_POOL_MAX_WORKERS, thread_name_prefix="frd-edag")
+            case ExecutionPolicy.PROCESS:
+                method = FRD_EDAG_PROCESS_START_METHOD
+                return ProcessPoolExecutor(
+                    max_workers=FRD_EDAG_PROCESS_POOL_MAX_WORKERS or None,
+                    mp_context=multiprocessing.get_context(
+                        method if method in multiprocessing.get_all_start_methods() else None
+                    ),
+                )
+            case _:
+                return None
+
+    def submit(self, function: Callable, *args) -> TaskHandle:
+        """Submits the function call into the pool of this policy (executed right away for 'INLINE')."""
+        match self.pool():
+            case None:
+                handle: TaskHandle = TaskHandle()
+                try:
+                    handle.set_result(function(*args))
+                except Exception as e:
+                    handle.set_exception(e)
+                return handle
+            case ProcessPoolExecutor() as pool:
+                try:
+                    return pool.submit(function, *args)
+                except BrokenProcessPool:
+                    # A worker died abruptly (e.g., killed by the OOM killer) and the pool is unusable afterwards;
+                    # the calls in flight fail with BrokenProcessPool, but the following ones get a new pool.
+                    logger.warning(f"Process pool of the {self.name} policy is broken; replacing it.")
+                    self._discard_pool(pool)
+                    return self.pool().submit(function, *args)
+            case pool:
+                return pool.submit(lambda: function(*args))
+
+    @classmethod
+    def resolve(cls, policy: Optional["str | ExecutionPolicy"]) -> Optional["ExecutionPolicy"]:
+        match policy:
+            case None:
+                return None
+            case ExecutionPolicy():
+                return policy
+            case str() as name:
+                return cls[name.upper()]
+            case _:
+                raise ValueError(f"Invalid execution policy '{policy}' type: {type(policy)}")
@@ -0,0 +1,76 @@
+from fred.settings import get_environ_variable
+
+
+# Maximum number of nodes executing concurrently (i.e., in-flight futures) per execution; 0 means unbounded
+# (i.e., every ready node is launched at once and the parallelism is only bounded by the future executor)
+FRD_EDAG_MAX_PARALLELISM = int(get_environ_variable(
+    name="FRD_EDAG_MAX_PARALLELISM",
+    default="0",
+))
+
+# Iterator mode (i.e., 'node[...]'): how the items are executed ('INLINE', 'THREAD', or 'PROCESS' pool), the
+# maximum number of in-flight chunks (bounds the memory used by streamed inputs), and the items per chunk
+FRD_EDAG_FANOUT_POLICY = get_environ_variable(
+    name="FRD_EDAG_FANOUT_POLICY",
+    default="THREAD",
+).upper()
+
+FRD_EDAG_FANOUT_PARALLELISM = int(get_environ_variable(
+    name="FRD_EDAG_FANOUT_PARALLELISM",
+    default="16",
+))
+
+FRD_EDAG_FANOUT_CHUNK_SIZE = int(get_environ_variable(
+    name="FRD_EDAG_FANOUT_CHUNK_SIZE",
+    default="1",
+))
+
+# Sizes of the shared pools used by the edag nodes; 0 defaults to the number of CPUs for the process pool
+FRD_EDAG_THREAD_POOL_MAX_WORKERS = int(get_environ_variable(
+    name="FRD_EDAG_THREAD_POOL_MAX_WORKERS",
+    default="32",
+))
+
+FRD_EDAG_PROCESS_POOL_MAX_WORKERS = int(get_environ_variable(
+    name="FRD_EDAG_PROCESS_POOL_MAX_WORKERS",
+    default="0",
+))
+
+# Start method of the process-pool workers; 'forkserver' avoids forking the (multi-threaded) parent process
+# and falls back to the platform default when not available (e.g., Windows). Note that with 'forkserver' or
+# 'spawn' the workers import the main module; thus, scripts must guard their entry point with
+# "if __name__ == '__main__':" and the node functions must be importable (e.g., defined at module level).
+FRD_EDAG_PROCESS_START_METHOD = get_environ_variable(
+    name="FRD_EDAG_PROCESS_START_METHOD",
+    default="forkserver",
+).lower()
+
+# Minimum size (in bytes) of the bytes and NumPy arrays transported through shared memory (instead of being
+# pickled through the pipe) from/to the process-pool nodes; 0 disables the shared-memory transport
+FRD_EDAG_SHARED_MEMORY_THRESHOLD = int(get_environ_variable(
+    name="FRD_EDAG_SHARED_MEMORY_THRESHOLD",
+    default="1048576",  # 1 MiB
+))
+
+# Memoized node results (opt-in per node; see 'Node.memoize'): the store ('MEMORY' for an in-process LRU or the
+# name of a service whose key-value component is used, e.g., 'REDIS' for cross-process reuse), the maximum number
+# of in-memory entries, the default time-to-live in seconds (0 means no expiration), and the key-value prefix
+FRD_EDAG_MEMO_BACKEND = get_environ_variable(
+    name="FRD_EDAG_MEMO_BACKEND",
+    default="MEMORY",
+).upper()
+
+FRD_EDAG_MEMO_SIZE = int(get_environ_variable(
+    name="FRD_EDAG_MEMO_SIZE",
+    default="1024",
+))
+
+FRD_EDAG_MEMO_TTL = float(get_environ_variable(
+    name="FRD_EDAG_MEMO_TTL",
+    default="0",
+))
+
+FRD_EDAG_MEMO_PREFIX = get_environ_variable(
+    name="FRD_EDAG_MEMO_PREFIX",
+    default="frd:edag:memo",
+)
@@ -0,0 +1,126 @@
+import sys
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable
+
+from fred.settings import logger_manager
+from fred.edag.policy import ExecutionPolicy
+from fred.edag.settings import FRD_EDAG_SHARED_MEMORY_THRESHOLD
+
+logger = logger_manager.get_logger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class SharedBlock:
+    """Picklable reference to a value (bytes or NumPy array) stored in a shared-memory block."""
+    name: str
+    size: int
+    dtype: str | None = None  # None for bytes
+    shape: tuple = ()
+
+
+def _buffer(block: SharedMemory) -> memoryview:
+    # The buffer is only missing once the block is closed
+    if (buf := block.buf) is None:
+        raise ValueError(f"Shared memory block '{block.name}' is closed.")
+    return buf
+
+
+def pack(value: Any, blocks: list[SharedMemory], threshold: int = FRD_EDAG_SHARED_MEMORY_THRESHOLD) -> Any:
+    """Replaces the (large) bytes and NumPy arrays of the value (including nested lists, tuples, and dict values)
+    with shared-memory references; the created blocks are appended into 'blocks'."""
+    numpy = sys.modules.get("numpy")  # NumPy arrays can only exist if the caller imported it
+    match value:
+        case _ if threshold <= 0:
+            return value
+        case bytes() | bytearray() if len(value) >= threshold:
+            block = SharedMemory(create=True, size=len(value))
+            _buffer(block)[:len(value)] = value
+            blocks.append(block)
+            return SharedBlock(name=block.name, size=len(value))
+        case _ if numpy is not None and isinstance(value, numpy.ndarray) and value.nbytes >= threshold \
+                and not value.dtype.hasobject:
+            block = SharedMemory(create=True, size=value.nbytes)
+            numpy.ndarray(value.shape, dtype=value.dtype, buffer=block.buf)[...] = value
+            blocks.append(block)
+            return SharedBlock(name=block.name, size=value.nbytes, dtype=value.dtype.str, shape=value.shape)
+        case list() | tuple():
+            return type(value)(pack(item, blocks=blocks, threshold=threshold) for item in value)
+        case dict():
+            return {key: pack(item, blocks=blocks, threshold=threshold) for key, item in value.items()}
+        case _:
+            return value
+
+
+def unpack(value: Any, blocks: list[SharedMemory], copy: bool = False) -> Any:
+    """Resolves the shared-memory references of the value; the attached blocks are appended into 'blocks'.
+    NumPy arrays are views over the shared block (i.e., zero-copy) unless 'copy' is requested (the block
+    must outlive the view); bytes are always copied out of the block."""
+    match value:
+        case SharedBlock(name=name, size=size, dtype=None):
+            block = SharedMemory(name=name)
+            blocks.append(block)
+            return bytes(_buffer(block)[:size])
+        case SharedBlock(name=name, dtype=dtype, shape=shape):
+            import numpy
+            block = SharedMemory(name=name)
+            blocks.append(block)
+            array = numpy.ndarray(shape, dtype=numpy.dtype(dtype), buffer=block.buf)
+            return array.copy() if copy else array
+        case list() | tuple():
+            return type(value)(unpack(item, blocks=blocks, copy=copy) for item in value)
+        case dict():
+            return {key: unpack(item, blocks=blocks, copy=copy) for key, item in value.items()}
+        case _:
+            return value
+
+
+def release(blocks: list[SharedMemory], unlink: bool = False) -> None:
+    for block in blocks:
+        try:
+            block.close()
+        except BufferError:
+            # A view over the block is still alive (e.g., kept by the function); the mapping is released with it
+            logger.debug(f"Shared-memory block '{block.name}' still in use; skipping close.")
+        if unlink:
+            block.unlink()
+    blocks.clear()
+
+
+def _call(function: Callable, args: tuple, kwargs: dict, threshold: int) -> Any:
+    # Process-pool entrypoint: the inputs are views over the parent blocks and the output is packed
+    # into new blocks (owned by the parent once returned; i.e., the parent unlinks them)
+    attached: list[SharedMemory] = []
+    created: list[SharedMemory] = []
+    try:
+        output = function(*unpack(args, blocks=attached), **unpack(kwargs, blocks=attached))
+        packed = pack(output, blocks=created, threshold=threshold)
+        del output
+    except BaseException:
+        release(created, unlink=True)
+        raise
+    finally:
+        release(created)
+        release(attached)
+    return packed
+
+
+def call_in_process(function: Callable, *args, **kwargs) -> Any:
+    """Calls the function in the shared process pool and waits for its output.
+    The function, the inputs, and the output must be picklable; the bytes and NumPy arrays
+    above 'FRD_EDAG_SHARED_MEMORY_THRESHOLD' are transported through shared memory instead."""
+    threshold = FRD_EDAG_SHARED_MEMORY_THRESHOLD
+    inputs: list[SharedMemory] = []
+    outputs: list[SharedMemory] = []
+    try:
+        task = ExecutionPolicy.PROCESS.submit(
+            _call,
+            function,
+            pack(args, blocks=inputs, threshold=threshold),
+            pack(kwargs, blocks=inputs, threshold=threshold),
+            threshold,
+        )
+        return unpack(task.result(), blocks=outputs, copy=True)
+    finally:
+        release(outputs, unlink=True)
+        release(inputs, unlink=True)
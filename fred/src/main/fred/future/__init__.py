@@ -1,5 +1,6 @@
 from fred.maturity import Maturity, MaturityLevel
 from fred.future.impl import Future
+from fred.future.impl_async import AsyncFuture
 
 
 module_maturity = Maturity(
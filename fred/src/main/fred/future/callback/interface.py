@@ -1,4 +1,4 @@
-from threading import Thread
+from concurrent.futures import Future as TaskHandle
 from typing import (
     Generic,
     TypeVar,
@@ -7,6 +7,7 @@ from typing import (
 
 from fred.settings import logger_manager
 from fred.monad.catalog import EitherMonad
+from fred.future.executor.catalog import ExecutorCatalog, EXECUTOR_REF_TYPE
 
 logger = logger_manager.get_logger(__name__)
 
@@ -21,31 +22,37 @@ class CallbackInterface(Generic[A]):
     def _on_complete(self, future_id: str, output: EitherMonad.Either[A]):
         raise NotImplementedError
     
-    def run(self, future_id: str, blocking: bool = False, output: Optional[EitherMonad.Either[A]] = None) -> Optional[Thread]:
+    def run(
+            self,
+            future_id: str,
+            blocking: bool = False,
+            output: Optional[EitherMonad.Either[A]] = None,
+            executor: Optional[EXECUTOR_REF_TYPE] = None,
+    ) -> Optional[TaskHandle]:
         """Executes the callback with the provided output and handles any exceptions.
+        Blocking callbacks run in the calling thread; non-blocking callbacks are submitted
+        into the (shared) future executor.
         Args:
             output (EitherMonad.Either[A]): The output to be passed to the callback.
+            executor (Optional[EXECUTOR_REF_TYPE]): The executor to submit non-blocking callbacks into.
         Returns:
-            bool: True if the callback executed successfully, False otherwise.
+            Optional[TaskHandle]: The task handle of the callback execution, or None if the execution failed.
         """
         # TODO: Consider using a richer return type to capture more details about the execution
         #  and optionally propagate the callback return value.
         try:
             match output:
                 case None:
-                    thread = Thread(
-                        target=lambda: self._on_start(future_id=future_id),
-                        daemon=True
-                    )
+                    def function():
+                        return self._on_start(future_id=future_id)
                 case EitherMonad.Either():
-                    thread = Thread(
-                        target=lambda: self._on_complete(future_id=future_id, output=output),
-                        daemon=True
-                    )
-            thread.start()
-            if blocking:
-                thread.join()
-            return thread
+                    def function():
+                        return self._on_complete(future_id=future_id, output=output)
+            if not blocking:
+                return ExecutorCatalog.resolve(executor).submit(function)
+            task: TaskHandle = TaskHandle()
+            task.set_result(function())
+            return task
         except Exception as e:
             logger.error(f"Callback execution failed on future '{future_id}': {e}")
             return None
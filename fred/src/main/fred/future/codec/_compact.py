@@ -0,0 +1,105 @@
+import json
+from dataclasses import fields
+from functools import lru_cache
+from typing import Any
+
+from fred.monad.catalog import EitherMonad
+from fred.future.codec.interface import FutureCodecInterface
+
+JSON_NATIVE_TYPES = (str, int, float, bool, type(None))
+
+
+def is_json_native(value: Any) -> bool:
+    """Returns True if the value survives a JSON round-trip unchanged (e.g., no tuples, sets or custom types)."""
+    match value:
+        case list():
+            return all(is_json_native(item) for item in value)
+        case dict():
+            return all(isinstance(key, str) and is_json_native(item) for key, item in value.items())
+        case _:
+            # Exact type-checks to avoid coercing subclasses (e.g., IntEnum) into their base types
+            return type(value) in JSON_NATIVE_TYPES
+
+
+@lru_cache(maxsize=None)
+def _get_class(reference: str) -> type:
+    import importlib
+
+    module_name, class_name = reference.split(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+class CompactCodec(FutureCodecInterface):
+    """Versioned wire format composed of a JSON header and an optional pickled section.
+    The header holds the FutureResult class reference and every JSON-native field; the
+    successful value of a FutureDefined instance is also stored in the header when it's
+    JSON-native (fast path), so that most payloads never touch dill. The remaining fields
+    (e.g., exceptions or custom objects) are pickled together into the section that follows
+    the header line; the section is base64-encoded on text payloads and kept raw on binary ones.
+
+    Layout: '{"frd": <version>, "cls": ..., "fields": {...}, ...}' + '\\n' + '<pickled-section>'
+    """
+    version: int = 1
+    separator: str = "\n"
+
+    @classmethod
+    def encode(cls, result: Any, binary: bool = False) -> str | bytes:
+        header_fields: dict[str, Any] = {}
+        header: dict[str, Any] = {
+            "frd": cls.version,
+            "cls": f"{type(result).__module__}:{type(result).__qualname__}",
+            "fields": header_fields,
+        }
+        pickled = {}
+        for field in fields(result):
+            match (field.name, getattr(result, field.name)):
+                case ("value", EitherMonad.Right(value=value)) if is_json_native(value):
+                    header["right"] = value
+                case (name, value) if is_json_native(value):
+                    header_fields[name] = value
+                case (name, value):
+                    pickled[name] = value
+        # The JSON encoder escapes newlines within strings; thus, the separator only appears once.
+        head = json.dumps(header, separators=(",", ":"))
+        if not pickled:
+            return head.encode("utf-8") if binary else head
+        import dill
+        section = dill.dumps(pickled)
+        if binary:
+            return head.encode("utf-8") + cls.separator.encode("utf-8") + section
+        import base64
+        return head + cls.separator + base64.b64encode(section).decode("ascii")
+
+    @classmethod
+    def decode(cls, payload: str | bytes) -> Any:
+        head: str | bytes
+        section: str | bytes
+        if isinstance(payload, bytes):
+            head, _, section = payload.partition(cls.separator.encode("utf-8"))
+        else:
+            head, _, section = payload.partition(cls.separator)
+        header = json.loads(head)
+        if header.get("frd") != cls.version:
+            raise ValueError(f"Unsupported FutureResult wire-format version: {header.get('frd')}")
+        values = header["fields"]
+        if "right" in header:
+            values["value"] = EitherMonad.Right(value=header["right"])
+        if section:
+            import dill
+            if isinstance(section, str):
+                import base64
+                section = base64.b64decode(section)
+            values.update(dill.loads(section))
+        # Build the instance without calling '__init__' since the FutureResult
+        # '__post_init__' hooks would write the state back into the backend.
+        klass = _get_class(header["cls"])
+        instance: Any = object.__new__(klass)
+        for name, value in values.items():
+            object.__setattr__(instance, name, value)
+        return instance
+
+    @classmethod
+    def accepts(cls, payload: str | bytes) -> bool:
+        if isinstance(payload, bytes):
+            return payload.startswith(b'{"frd":')
+        return payload.startswith('{"frd":')
@@ -0,0 +1,32 @@
+from typing import Any
+
+from fred.future.codec.interface import FutureCodecInterface
+
+
+class DillCodec(FutureCodecInterface):
+    """The original wire format: the whole FutureResult dataclass pickled via dill.
+    Text payloads are base64-encoded; binary payloads keep the raw pickle bytes.
+    """
+
+    @classmethod
+    def encode(cls, result: Any, binary: bool = False) -> str | bytes:
+        import dill
+        import base64
+
+        payload = dill.dumps(result)
+        return payload if binary else base64.b64encode(payload).decode("ascii")
+
+    @classmethod
+    def decode(cls, payload: str | bytes) -> Any:
+        import dill
+        import base64
+
+        # Raw pickles start with the PROTO opcode (0x80); anything else is base64-encoded.
+        if isinstance(payload, bytes) and payload.startswith(b"\x80"):
+            return dill.loads(payload)
+        return dill.loads(base64.b64decode(payload))
+
+    @classmethod
+    def accepts(cls, payload: str | bytes) -> bool:
+        # Legacy payloads have no header; thus, this codec acts as the fallback.
+        return True
@@ -0,0 +1,42 @@
+import enum
+from typing import Any, Optional
+
+from fred.future.settings import FRD_FUTURE_CODEC
+from fred.future.codec.interface import FutureCodecInterface
+from fred.future.codec._dill import DillCodec
+from fred.future.codec._compact import CompactCodec
+
+
+class FutureCodecCatalog(enum.Enum):
+    COMPACT = CompactCodec
+    DILL = DillCodec
+
+    @property
+    def codec(self) -> type[FutureCodecInterface]:
+        return self.value
+
+    def encode(self, result: Any, binary: bool = False) -> str | bytes:
+        return self.codec.encode(result=result, binary=binary)
+
+    @classmethod
+    def resolve(cls, codec: Optional[str | enum.Enum] = None) -> 'FutureCodecCatalog':
+        """Resolves a codec reference (name or catalog entry); defaults to the 'FRD_FUTURE_CODEC' setting."""
+        match codec or FRD_FUTURE_CODEC:
+            case FutureCodecCatalog() as entry:
+                return entry
+            case str() as name:
+                return cls[name.upper()]
+            case _:
+                raise ValueError(f"Invalid codec '{codec}' type: {type(codec)}")
+
+    @classmethod
+    def infer(cls, payload: str | bytes) -> 'FutureCodecCatalog':
+        """Infers the codec that produced the payload; the members are checked in order (i.e., DILL is the fallback)."""
+        for entry in cls:
+            if entry.codec.accepts(payload):
+                return entry
+        raise ValueError("Unable to infer the codec of the provided payload.")
+
+    @classmethod
+    def decode(cls, payload: str | bytes) -> Any:
+        return cls.infer(payload=payload).codec.decode(payload=payload)
@@ -0,0 +1,23 @@
+from typing import Any
+
+
+class FutureCodecInterface:
+    """Base interface for the wire formats used to persist FutureResult instances.
+    A codec converts a FutureResult into a payload that can be stored in the key-value
+    backend (and broadcasted via pub-sub) and back. Codecs can produce either text payloads
+    (for backends that only handle strings, e.g., Redis with 'decode_responses') or raw
+    bytes payloads (for backends that can hold binary values, e.g., the STDLIB memstore).
+    """
+
+    @classmethod
+    def encode(cls, result: Any, binary: bool = False) -> str | bytes:
+        raise NotImplementedError
+
+    @classmethod
+    def decode(cls, payload: str | bytes) -> Any:
+        raise NotImplementedError
+
+    @classmethod
+    def accepts(cls, payload: str | bytes) -> bool:
+        """Returns True if the payload looks like it was produced by this codec."""
+        raise NotImplementedError
@@ -0,0 +1,14 @@
+from threading import Thread
+from typing import Callable
+
+from fred.future.executor.interface import ExecutorInterface
+
+
+class DaemonExecutor(ExecutorInterface):
+    """Unbounded executor that spawns a new daemon thread per task.
+    This was the original Future execution model; it remains available for
+    long-running computations (e.g., runner loops) that should not hold a pool worker.
+    """
+
+    def _submit(self, task: Callable[[], None]) -> None:
+        Thread(target=task, daemon=True).start()
@@ -0,0 +1,99 @@
+import heapq
+import itertools
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable, Optional
+
+from fred.settings import logger_manager
+
+logger = logger_manager.get_logger(__name__)
+
+
+@dataclass(slots=True)
+class DeadlineCall:
+    """A callable scheduled on a DeadlineScheduler; it can be cancelled until it runs."""
+    function: Callable[[], None]
+    scheduler: "DeadlineScheduler" = field(repr=False)
+    cancelled: bool = False
+
+    def cancel(self) -> None:
+        self.scheduler._cancel(self)
+
+
+class DeadlineScheduler:
+    """Runs callables once their deadline is reached using a single daemon thread that sleeps
+    until the earliest deadline (a min-heap of deadlines); unlike a 'threading.Timer' per call,
+    any number of pending deadlines (e.g., the timeouts of chained futures) costs one thread.
+    The callables run on the scheduler thread; thus, they must be short (e.g., settling a task
+    handle or submitting the actual work into an executor).
+    """
+
+    def __init__(self, thread_name: str = "frd-deadlines"):
+        self._thread_name = thread_name
+        self._deadlines: list[tuple[float, int, DeadlineCall]] = []
+        self._counter = itertools.count()
+        self._cancelled = 0
+        self._wakeup = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def shared(cls) -> "DeadlineScheduler":
+        """Returns the process-wide scheduler (lazily created on first use)."""
+        return cls()
+
+    def call_later(self, delay: float, function: Callable[[], None]) -> DeadlineCall:
+        """Schedules the callable to run after the delay (in seconds); returns a cancellable handle."""
+        call = DeadlineCall(function=function, scheduler=self)
+        with self._wakeup:
+            if self._cancelled > 1024 and self._cancelled > len(self._deadlines) // 2:
+                # Drops the cancelled entries (e.g., the timeouts of futures that completed in time)
+                self._deadlines = [entry for entry in self._deadlines if not entry[2].cancelled]
+                heapq.heapify(self._deadlines)
+                self._cancelled = 0
+            heapq.heappush(self._deadlines, (time.monotonic() + max(delay, 0), next(self._counter), call))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run_forever, name=self._thread_name, daemon=True)
+                self._thread.start()
+            elif self._deadlines[0][2] is call:
+                # The new deadline is the earliest one; the scheduler must wake up earlier
+                self._wakeup.notify()
+        return call
+
+    def _cancel(self, call: DeadlineCall) -> None:
+        with self._wakeup:
+            if not call.cancelled:
+                call.cancelled = True
+                self._cancelled += 1
+
+    def _next(self) -> DeadlineCall:
+        with self._wakeup:
+            while True:
+                while self._deadlines and self._deadlines[0][2].cancelled:
+                    heapq.heappop(self._deadlines)
+                    self._cancelled -= 1
+                if not self._deadlines:
+                    self._wakeup.wait()
+                    continue
+                if (remaining := self._deadlines[0][0] - time.monotonic()) > 0:
+                    self._wakeup.wait(timeout=remaining)
+                    continue
+                _, _, call = heapq.heappop(self._deadlines)
+                # Marked as cancelled so that a late 'cancel' is a no-op
+                call.cancelled = True
+                return call
+
+    def _run_forever(self) -> None:
+        while True:
+            call = self._next()
+            try:
+                call.function()
+            except Exception as e:
+                logger.error(f"Scheduled call failed: {e}")
+
+    def pending(self) -> int:
+        """Returns the number of scheduled (not cancelled) calls."""
+        with self._wakeup:
+            return len(self._deadlines) - self._cancelled
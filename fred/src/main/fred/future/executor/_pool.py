@@ -0,0 +1,93 @@
+import queue
+import threading
+from typing import Callable, Optional
+
+from fred.settings import logger_manager
+from fred.future.settings import FRD_FUTURE_EXECUTOR_MAX_WORKERS
+from fred.future.executor.interface import ExecutorInterface
+
+logger = logger_manager.get_logger(__name__)
+
+
+class PoolExecutor(ExecutorInterface):
+    """Bounded thread-pool executor backed by daemon worker threads.
+
+    Workers are spawned lazily (up to 'max_workers') only when there are more queued tasks
+    than idle workers, and then kept alive to pick up new tasks; this avoids paying the
+    thread creation cost on every Future. Daemon threads are used on purpose (instead of the
+    standard 'ThreadPoolExecutor') to keep the original Future semantics where a pending
+    computation never blocks the interpreter exit.
+
+    Since Futures can wait on other Futures (e.g., nested futures or callbacks), a task submitted
+    from within a worker of this same pool while the pool is saturated is executed inline by the
+    submitting worker (caller-runs policy), so that a worker waiting on its own nested task is never
+    starved by the pool bound. Note that this does not make the pool deadlock-free: workers blocked
+    on tasks queued earlier (e.g., by other threads) still deadlock once every worker is blocked;
+    such long waits should use a larger pool or the 'DAEMON' executor.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, thread_name_prefix: str = "frd-future", **kwargs):
+        super().__init__(max_workers=max_workers, thread_name_prefix=thread_name_prefix, **kwargs)
+        self._max_workers = max(1, int(max_workers or FRD_FUTURE_EXECUTOR_MAX_WORKERS))
+        self._thread_name_prefix = thread_name_prefix
+        self._tasks: queue.SimpleQueue = queue.SimpleQueue()
+        self._workers: list[threading.Thread] = []
+        self._idle = 0
+        self._inline = 0
+        self._local = threading.local()
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    def _worker_loop(self):
+        self._local.executor = self
+        while True:
+            with self._lock:
+                self._idle += 1
+            task = self._tasks.get()
+            with self._lock:
+                self._idle -= 1
+            if task is None:
+                break
+            task()
+
+    def _submit(self, task: Callable[[], None]) -> None:
+        caller_is_worker = getattr(self._local, "executor", None) is self
+        with self._lock:
+            # Note: the 'queued' counter already includes the task being submitted.
+            starving = self._idle < self._queued
+            can_spawn = len(self._workers) < self._max_workers
+            run_inline = caller_is_worker and starving and not can_spawn
+            if run_inline:
+                self._inline += 1
+            elif starving and can_spawn:
+                worker = threading.Thread(
+                    target=self._worker_loop,
+                    name=f"{self._thread_name_prefix}-{len(self._workers)}",
+                    daemon=True,
+                )
+                self._workers.append(worker)
+                worker.start()
+        if run_inline:
+            logger.debug("Executor pool saturated; running nested task inline on the calling worker.")
+            return task()
+        self._tasks.put(task)
+
+    def stats(self) -> dict:
+        payload = super().stats()
+        with self._lock:
+            payload["workers"] = len(self._workers)
+            payload["idle"] = self._idle
+            payload["inline"] = self._inline
+        return payload
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            workers, self._workers = self._workers, []
+        for _ in workers:
+            self._tasks.put(None)
+        if wait:
+            for worker in workers:
+                if worker is not threading.current_thread():
+                    worker.join()
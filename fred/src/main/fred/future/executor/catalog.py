@@ -0,0 +1,46 @@
+import enum
+from functools import lru_cache
+from typing import Optional, TypeAlias
+
+from fred.future.settings import FRD_FUTURE_EXECUTOR
+from fred.future.executor.interface import ExecutorInterface
+from fred.future.executor._pool import PoolExecutor
+from fred.future.executor._daemon import DaemonExecutor
+
+EXECUTOR_REF_TYPE: TypeAlias = str | ExecutorInterface | enum.Enum
+
+
+class ExecutorCatalog(enum.Enum):
+    POOL = PoolExecutor
+    DAEMON = DaemonExecutor
+
+    def __call__(self, *args, **kwargs) -> ExecutorInterface:
+        return self.value(*args, **kwargs)
+
+    @lru_cache(maxsize=None)
+    def shared(self) -> ExecutorInterface:
+        """Returns the process-wide executor instance for this catalog entry.
+        The instance is lazily created on first use and reused by every Future
+        that does not specify its own executor.
+        """
+        return self.value()
+
+    @classmethod
+    def resolve(cls, executor: Optional[EXECUTOR_REF_TYPE] = None) -> ExecutorInterface:
+        """Resolves an executor reference into an executor instance.
+        Args:
+            executor (Optional[EXECUTOR_REF_TYPE]): Either an executor instance, a catalog entry, or
+                the name of a catalog entry. If None, defaults to the shared executor configured via
+                the 'FRD_FUTURE_EXECUTOR' environment variable.
+        Returns:
+            ExecutorInterface: The executor instance to submit tasks into.
+        """
+        match executor or FRD_FUTURE_EXECUTOR:
+            case ExecutorInterface() as instance:
+                return instance
+            case ExecutorCatalog() as entry:
+                return entry.shared()
+            case str() as name:
+                return cls[name.upper()].shared()
+            case _:
+                raise ValueError(f"Invalid executor '{executor}' type: {type(executor)}")
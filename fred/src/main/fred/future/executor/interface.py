@@ -0,0 +1,97 @@
+import threading
+from concurrent.futures import Future as TaskHandle
+from typing import (
+    Callable,
+    Optional,
+    TypeVar,
+)
+
+from fred.settings import logger_manager
+
+logger = logger_manager.get_logger(__name__)
+
+A = TypeVar("A")
+
+
+class ExecutorInterface:
+    """Base interface for the executors that run the work submitted by Futures and callbacks.
+    An executor receives a zero-argument callable and returns a task handle (a standard
+    'concurrent.futures.Future') that can be used to wait for the task to complete.
+
+    Subclasses must implement the '_submit' method; the public 'submit' method takes care of
+    tracking the queue-depth and active-worker metrics exposed via 'stats'.
+    """
+
+    def __init__(self, **kwargs):
+        self.config = kwargs
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+
+    def _submit(self, task: Callable[[], None]) -> None:
+        raise NotImplementedError
+
+    def _track(self, function: Callable[[], A], handle: TaskHandle) -> Callable[[], None]:
+        # Wraps the function to keep the metrics consistent and to propagate the outcome
+        # into the task handle regardless of the underlying execution mechanism.
+        def task():
+            with self._lock:
+                self._queued -= 1
+                self._active += 1
+            if not handle.set_running_or_notify_cancel():
+                with self._lock:
+                    self._active -= 1
+                return
+            try:
+                handle.set_result(function())
+            except BaseException as e:
+                with self._lock:
+                    self._failed += 1
+                handle.set_exception(e)
+            finally:
+                with self._lock:
+                    self._active -= 1
+                    self._completed += 1
+        return task
+
+    def submit(self, function: Callable[[], A], handle: Optional[TaskHandle] = None) -> TaskHandle:
+        """Submits a zero-argument callable to be executed by the executor.
+        Args:
+            function (Callable[[], A]): The callable to execute.
+            handle (Optional[TaskHandle]): A pre-existing (pending) task handle to complete with the outcome
+                of the callable; useful when the handle is created before the task can be scheduled.
+        Returns:
+            TaskHandle: A 'concurrent.futures.Future' that completes when the callable returns or fails.
+        """
+        handle = TaskHandle() if handle is None else handle
+        with self._lock:
+            self._queued += 1
+            self._submitted += 1
+        self._submit(task=self._track(function=function, handle=handle))
+        return handle
+
+    @property
+    def max_workers(self) -> int | None:
+        return None
+
+    def stats(self) -> dict:
+        """Returns a snapshot of the executor metrics.
+        Returns:
+            dict: The executor name, max-workers, queue-depth, active-workers and task counters.
+        """
+        with self._lock:
+            return {
+                "executor": self.__class__.__name__,
+                "max_workers": self.max_workers,
+                "queued": self._queued,
+                "active": self._active,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        pass
@@ -1,14 +1,21 @@
 import time
-from threading import Thread
+from concurrent.futures import (
+    Future as TaskHandle,
+    InvalidStateError,
+    wait as wait_tasks,
+)
 from typing import (
+    Any,
     Callable,
     Optional,
     TypeVar,
 )
 
 from fred.settings import logger_manager
-from fred.future.settings import FRD_FUTURE_DEFAULT_EXPIRATION
+from fred.future.settings import FRD_FUTURE_DEFAULT_EXPIRATION, FRD_FUTURE_SUBSCRIBE_RECHECK
 from fred.future.callback.interface import CallbackInterface
+from fred.future.executor.catalog import ExecutorCatalog, EXECUTOR_REF_TYPE
+from fred.future.executor._deadline import DeadlineScheduler
 from fred.monad.interface import MonadInterface
 from fred.monad.catalog import EitherMonad
 from fred.future.result import (
@@ -28,7 +35,8 @@ class Future(MonadInterface[A]):
     """A Future represents a computation that will complete at some point in the future,
     yielding a result of type A or failing with an exception. It allows for asynchronous
     programming by enabling non-blocking operations and chaining of computations.
-    This implementation uses threading to execute the computation in a separate thread.
+    This implementation submits the computation into an executor (by default, a shared
+    and bounded thread-pool) instead of spawning a dedicated thread per future.
 
     The Future class provides methods to wait for the computation to complete,
     retrieve the result, and chain further computations using flat_map and map.
@@ -54,8 +62,6 @@ class Future(MonadInterface[A]):
     
     TODO: Analyze impact on performance and resource usage when using many Futures. Specially
     on garbage collection and memory leaks.
-    
-    TODO: Consider using more advanced concurrency primitives for better control and efficiency.
     """
 
     def __init__(
@@ -65,41 +71,102 @@ class Future(MonadInterface[A]):
             on_complete: Optional[CallbackInterface] = None,
             parent_id: Optional[str] = None,
             broadcast: bool = False,
+            executor: Optional[EXECUTOR_REF_TYPE] = None,
             **kwargs
         ):
         """Initializes a Future with the provided function to be executed asynchronously.
-        The function is executed in a separate thread, allowing for non-blocking operations.
+        The function is submitted into an executor, allowing for non-blocking operations.
 
         Args:
             function (Callable[..., A]): The function to be executed asynchronously.
+            executor (Optional[EXECUTOR_REF_TYPE]): The executor to submit the function into; either an
+                executor instance, an 'ExecutorCatalog' entry or its name. Defaults to the shared executor
+                configured via the 'FRD_FUTURE_EXECUTOR' environment variable.
             future_id (Optional[str], keyword-only): A reserved keyword-only parameter used to
                 uniquely identify this Future instance. This value is consumed by the Future
                 infrastructure and is not passed to the target function.
             **kwargs: Additional keyword arguments to be passed to the function when executed.
                 All keyword arguments except 'future_id' are forwarded to the target function.
         """
+        self._start(
+            function=function,
+            function_kwargs=kwargs,
+            on_start=on_start,
+            on_complete=on_complete,
+            parent_id=parent_id,
+            broadcast=broadcast,
+            executor=executor,
+        )
+
+    def _start(
+            self,
+            function: Callable[..., A],
+            function_kwargs: dict,
+            on_start: Optional[CallbackInterface] = None,
+            on_complete: Optional[CallbackInterface] = None,
+            parent_id: Optional[str] = None,
+            broadcast: bool = False,
+            executor: Optional[EXECUTOR_REF_TYPE] = None,
+            after: Optional[TaskHandle] = None,
+        ):
         # Create a new available future
         future = FutureUndefinedPending.auto(
             parent_id=parent_id,
             broadcast=broadcast,
-            future_id=kwargs.pop("future_id", None),
+            future_id=function_kwargs.pop("future_id", None),
         )
         # Register the Future-ID and define the available future via the provided function.
-        # Note: The 'apply' method is blocking by itself; thus, we run it in a separate thread.
-        # Note: The thread is a daemon to ensure it does not block program exit.
+        # Note: The 'apply' method is blocking by itself; thus, we submit it into the executor.
         self.future_id = future.future_id
         self.parent_id = parent_id
-        self.thread = Thread(
-            target=lambda: future.apply(
+        self.executor = ExecutorCatalog.resolve(executor)
+
+        def run():
+            return future.apply(
                 function=function,
                 on_complete=on_complete,
                 on_start=on_start,
-                **kwargs
-            ),
-            daemon=True,
+                executor=self.executor,
+                **function_kwargs
+            )
+
+        if after is None:
+            self.task = self.executor.submit(run)
+            return
+        # Continuations are only submitted once the 'after' task completes; no thread is parked meanwhile.
+        self.task = TaskHandle()
+        after.add_done_callback(lambda _: self.executor.submit(run, handle=self.task))
+
+    @classmethod
+    def _continuation(
+            cls,
+            after: TaskHandle,
+            function: Callable[[], B],
+            parent_id: Optional[str] = None,
+            executor: Optional[EXECUTOR_REF_TYPE] = None,
+        ) -> 'Future[B]':
+        """Creates a Future (in pending state) whose function is only scheduled after the given task completes."""
+        instance: Future[B] = cls.__new__(cls)
+        instance._start(
+            function=function,
+            function_kwargs={},
+            parent_id=parent_id,
+            executor=executor,
+            after=after,
         )
-        # Start the thread to execute the function asynchronously
-        self.thread.start()
+        return instance
+
+    def _outcome(self) -> EitherMonad.Either[A]:
+        """Returns the Either-value of a completed future.
+        The in-process result of the executor task is used when available to avoid a backend
+        round-trip; otherwise, it falls back to the backend state via 'wait'."""
+        if not self.task.done() or self.task.exception():
+            return self.wait()
+        match self.task.result():
+            case FutureDefined(value=value):
+                return value
+            case _:
+                return self.wait()
 
     @property
     def _result(self) -> Optional[FutureResult[A]]:
@@ -107,11 +174,12 @@ class Future(MonadInterface[A]):
     
     @property
     def _status(self) -> Optional[str]:
-        return FutureResult._get_status_key(future_id=self.future_id).get()
+        return FutureResult.fetch_status(future_id=self.future_id)
 
     @property
     def _output(self) -> Optional[str]:
-        return FutureResult._get_output_key(future_id=self.future_id).get()
+        output, = FutureResult.read(self.future_id, "output")
+        return output
 
     def wait(self, timeout: Optional[float] = None) -> EitherMonad.Either[A]:
         """Waits for the future to complete and returns the result as an Either monad.
@@ -132,19 +200,21 @@ class Future(MonadInterface[A]):
             RuntimeError: If the future status is inconsistent after waiting.
             TypeError: If the future result type is unknown.
         """
-        # Wait for the thread to complete or timeout
-        self.thread.join(timeout=timeout)
-        if self.thread.is_alive():
+        # Wait for the executor task to complete or timeout
+        wait_tasks([self.task], timeout=timeout)
+        if not self.task.done():
             raise TimeoutError("Future did not complete within the specified timeout.")
-        # After the thread has completed, check the status consistency
-        if not self._status:
+        # After the task has completed, check the status consistency
+        # The status and the serialized result are read together (atomically on the HASH layout)
+        status, payload = FutureResult.read(self.future_id, "status", "obj")
+        if not status:
             raise RuntimeError("Future status should be set but isn't.")
-        if not self._status.startswith("DEFINED"):
+        if not status.startswith("DEFINED"):
             raise RuntimeError("Future status should be DEFINED after wait.")
         # Check the result-type consistency
         # If the future is still pending or in-progress, it's an error and should not happen
         # If the future is defined, return the contained value or exception
-        match self._result:
+        match FutureResult.from_string(payload=payload) if payload else None:
             case FutureUndefinedPending():
                 raise RuntimeError("Future is still pending after wait.")
             case FutureUndefinedInProgress():
@@ -180,7 +250,7 @@ class Future(MonadInterface[A]):
                            - "DEFINED:SUCCESS"
                            - "DEFINED:FAILURE"
         """
-        return ":".join(self._status.split(":")[:2]) if self._status else None
+        return ":".join(status.split(":")[:2]) if (status := self._status) else None
 
     def __repr__(self) -> str:
         return f"FUTURE[{self.state}]('{self.future_id}')"
@@ -230,22 +300,56 @@ class Future(MonadInterface[A]):
         The simple implementation of this method is: function(self.wait_and_resolve())
         Nonetheless, the simple implementation would block the current thread
         until the first future is resolved, which is not ideal in an asynchronous context.
-        Instead, we create a new Future that encapsulates the entire operation,
-        allowing it to be executed asynchronously.
+        Instead, the operation is registered as a continuation: the function is only scheduled
+        when the current future completes, and the resulting future is only defined when the
+        future returned by the function completes; no thread is blocked while waiting.
 
         Args:
             function (Callable[[A], Future[B]]): A function that takes the result of the
                                                   current future and returns a new Future.
-            timeout (Optional[float]): Maximum time to wait for the current future to complete.
+            timeout (Optional[float]): Maximum time to wait for the chained operation (i.e., the current
+                                       future and the one returned by the function) to complete; the
+                                       resulting future fails with a TimeoutError when exceeded.
                                        If None, waits indefinitely.
         Returns:
             Future[B]: A new Future representing the chained operation."""
-        # TODO: Is there a more efficient implementation?
-        return Future(
+        bound: TaskHandle = TaskHandle()
+        ready: TaskHandle = TaskHandle()
+
+        def settle(value=None, error: Optional[BaseException] = None):
+            try:
+                if error:
+                    ready.set_exception(error)
+                else:
+                    ready.set_result(value)
+            except InvalidStateError:
+                pass  # Already settled (e.g., by the timeout)
+
+        def relay(handle: TaskHandle):
+            match handle.exception():
+                case None if isinstance(inner := handle.result(), Future):
+                    inner.task.add_done_callback(lambda _: settle(value=inner))
+                case None:
+                    # The function did not return a future; otherwise, the chained future would never settle
+                    kind = type(handle.result()).__name__
+                    settle(error=TypeError(f"Expected a Future from the flat_map function; got '{kind}'."))
+                case error:
+                    settle(error=error)
+
+        self.task.add_done_callback(
+            lambda _: self.executor.submit(lambda: function(self._outcome().resolve()), handle=bound)
+        )
+        bound.add_done_callback(relay)
+        if timeout is not None:
+            # A single (shared) scheduler thread keeps track of every timeout; no thread is parked per call
+            error = TimeoutError("Chained future did not complete within the specified timeout.")
+            deadline = DeadlineScheduler.shared().call_later(timeout, lambda: settle(error=error))
+            ready.add_done_callback(lambda _: deadline.cancel())
+        return self._continuation(
+            after=ready,
             parent_id=self.future_id,
-            function=lambda:
-                function(self.wait_and_resolve(timeout=timeout))
-                .wait_and_resolve(timeout=timeout)
+            executor=self.executor,
+            function=lambda: ready.result()._outcome().resolve(),
         )
 
     def map(self, function: Callable[[A], B]) -> 'Future[B]':
@@ -256,19 +360,48 @@ class Future(MonadInterface[A]):
         return self.flat_map(function=lambda value: type(self).from_value(function(value)))
 
         However, that implementation would create an intermediate Future just to
-        hold the transformed value, which is unnecessary overhead. Instead, we can directly create a new Future
-        that applies the transformation function to the result of the current future.
+        hold the transformed value, which is unnecessary overhead. Instead, we directly create a new Future
+        registered as a continuation of the current future; the transformation is only scheduled
+        once the current future completes and it receives the in-process result (no thread is parked
+        and there is no backend round-trip to read the parent result).
 
         Args:
             function (Callable[[A], B]): A function that takes the result of the current future
                                           and returns a new value.
         Returns: Future[B]: A new Future containing the transformed result.
         """
-        return Future(
-            function=lambda: function(self.wait_and_resolve()),
+        return self._continuation(
+            after=self.task,
             parent_id=self.future_id,
+            executor=self.executor,
+            function=lambda: function(self._outcome().resolve()),
         )
 
+    def map_fused(self, *functions: Callable, persist_intermediate: bool = False) -> 'Future':
+        """Applies a sequence of functions to the result of the future in a single execution.
+        This is equivalent to chaining 'map' calls (i.e., future.map(f).map(g)...), but the functions
+        are fused into one continuation so that the intermediate results do not go through the
+        FutureResult state machine (and therefore are not persisted into the backend).
+
+        Args:
+            *functions (Callable): The functions to apply sequentially.
+            persist_intermediate (bool): If True, each function is applied via its own 'map' call
+                                         persisting every intermediate future. Defaults to False.
+        Returns: Future: A new Future containing the result of the last function.
+        """
+        if persist_intermediate:
+            future = self
+            for function in functions:
+                future = future.map(function)
+            return future
+
+        def fused(value):
+            for function in functions:
+                value = function(value)
+            return value
+
+        return self.map(fused)
+
     @classmethod
     def pullsync(
             cls,
@@ -322,75 +455,122 @@ class Future(MonadInterface[A]):
             on_complete: Optional[CallbackInterface] = None,
             retry_delay: float = 0.2,
             retry: int = 3,
+            executor: Optional[EXECUTOR_REF_TYPE] = None,
+            timeout: Optional[float] = None,
     ) -> 'Future[A]':
         """Subscribes to updates for an existing future using a publish-subscribe mechanism.
         This method allows for receiving real-time updates about the future's state
         and result without blocking.
+        The broadcast channel is subscribed BEFORE reading the future state from the backend; thus,
+        a completion that happens in between is buffered by the subscription instead of being missed.
+        While waiting, the backend state is re-checked every 'FRD_FUTURE_SUBSCRIBE_RECHECK' seconds
+        without messages (e.g., in case the completion message was dropped).
         Args:
             future_id (str): The unique identifier of the future to subscribe to.
             on_start (Optional[CallbackInterface]): An optional callback to be executed
                                                    when the subscription starts.
             on_complete (Optional[CallbackInterface]): An optional callback to be executed
                                                       when the future completes.
+            executor (Optional[EXECUTOR_REF_TYPE]): The executor to run the subscription into. Defaults to
+                the shared executor for already-defined futures and to a dedicated daemon thread when
+                waiting on the broadcast channel (long-lived waits should not hold a pool worker).
+            timeout (Optional[float]): Maximum time (in seconds) to wait for the future to complete; the
+                returned Future fails with a TimeoutError afterwards. If None, waits indefinitely.
         Returns:
             Future[A]: A Future instance that will execute the subscription logic.
         """
-        # TODO: Consider adding a timeout parameter to avoid waiting indefinitely...
-        # TODO: There's a known issue where if the future completes before we subscribe,
-        #       we might miss the completion message.
+        deadline = None if timeout is None else time.monotonic() + timeout
+        channel = FutureResult._get_bcast_channel(future_id=future_id)
+        try:
+            subscription = channel.subscription()
+            subscription.wait_ready(timeout=FRD_FUTURE_SUBSCRIBE_RECHECK)
+        except NotImplementedError:
+            # Services without pub/sub support can still resolve already-defined futures
+            subscription = None
+
+        def release():
+            if subscription is not None:
+                channel.unsubscribe(subscription_id=subscription.subscription_id)
+
         # Define a closure that will handle incoming messages from the pub-sub channel
         def closure():
-            for payload in FutureResult._get_bcast_channel(future_id=future_id).subscribe():
-                logger.info(f"Received pubsub message for future '{future_id}': {payload}")
-                if payload.get("type") != "message":
-                    continue
-                message = payload.get("data")
-                if not message:
-                    continue
-                match FutureResult.from_string(message):
-                    case FutureDefined(value=value):
-                        return value.resolve()
-                    case FutureUndefinedPending():
+            try:
+                while True:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError(f"Future '{future_id}' did not complete within {timeout} seconds.")
+                    wait = min(FRD_FUTURE_SUBSCRIBE_RECHECK, remaining if remaining is not None else float("inf"))
+                    if (payload := subscription.get(timeout=wait)) is None:
+                        match FutureResult.from_backend(future_id=future_id):
+                            case FutureDefined(value=value):
+                                return value.resolve()
+                            case _:
+                                continue
+                    logger.info(f"Received pubsub message for future '{future_id}': {payload}")
+                    if payload.get("type") != "message" or not (message := payload.get("data")):
                         continue
-                    case FutureUndefinedInProgress():
-                        continue
-                    case _:
-                        raise TypeError("Unknown FutureResult type")
-        shared_params = {
+                    match FutureResult.from_string(message):
+                        case FutureDefined(value=value):
+                            return value.resolve()
+                        case FutureUndefinedPending():
+                            continue
+                        case FutureUndefinedInProgress():
+                            continue
+                        case _:
+                            raise TypeError("Unknown FutureResult type")
+            finally:
+                release()
+        shared_params: dict[str, Any] = {
             "parent_id": future_id,
             "broadcast": False,
             "on_start": on_start,
             "on_complete": on_complete,
         }
         # Depending on the current state of the future, either return the resolved value
-        # or subscribe to the broadcast channel to wait for updates (via closure).
-        match FutureResult.from_backend(future_id=future_id):
+        # or wait for updates on the (already subscribed) broadcast channel (via closure).
+        try:
+            instance = FutureResult.from_backend(future_id=future_id)
+        except Exception:
+            release()
+            raise
+        match instance:
             case FutureDefined(value=value):
+                release()
                 return cls(
                     function=lambda: value.resolve(),
+                    executor=executor,
                     **shared_params
                 )
-            case instance:
+            case None:
                 # The future-result can be None if the future_id does not exist
-                if not instance:
-                    if retry <= 0:
-                        raise ValueError(f"Future with ID '{future_id}' does not exist.")
-                    logger.error(f"Future with ID '{future_id}' does not exist; attempting to retry ({retry} retries left).")
-                    time.sleep(retry_delay)
-                    return cls.subscribe(
-                        future_id=future_id,
-                        on_start=on_start,
-                        on_complete=on_complete,
-                        retry_delay=retry_delay,
-                        retry=max(0, retry - 1),
-                    )
+                release()
+                if retry <= 0:
+                    raise ValueError(f"Future with ID '{future_id}' does not exist.")
+                logger.error(
+                    f"Future with ID '{future_id}' does not exist; attempting to retry ({retry} retries left)."
+                )
+                time.sleep(retry_delay)
+                return cls.subscribe(
+                    future_id=future_id,
+                    on_start=on_start,
+                    on_complete=on_complete,
+                    retry_delay=retry_delay,
+                    retry=max(0, retry - 1),
+                    executor=executor,
+                    timeout=None if deadline is None else max(deadline - time.monotonic(), 0),
+                )
+            case instance if not instance.broadcast:
                 # If the future exists, but is not configured for broadcast, raise an error...
-                if not instance.broadcast:
-                    raise ValueError("Future is not configured for broadcast; cannot subscribe.")
-                # If the future exists and is configured for broadcast, subscribe to updates...
+                release()
+                raise ValueError("Future is not configured for broadcast; cannot subscribe.")
+            case _ if subscription is None:
+                raise NotImplementedError(f"Pub/sub not available to subscribe to future '{future_id}'.")
+            case _:
+                # If the future exists and is configured for broadcast, wait for the updates...
                 logger.info(f"Subscribing to future '{future_id}' via broadcast channel.")
                 return cls(
                     function=closure,
+                    executor=executor or ExecutorCatalog.DAEMON,
                     **shared_params
                 )
 
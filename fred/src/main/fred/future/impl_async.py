@@ -0,0 +1,276 @@
+import uuid
+import asyncio
+from time import perf_counter
+from typing import (
+    Awaitable,
+    Callable,
+    Generator,
+    Generic,
+    Optional,
+    TypeVar,
+)
+
+from fred.settings import logger_manager
+from fred.monad.catalog import EitherMonad
+from fred.dao.comp._pubsub import FredSubscription
+from fred.future.settings import FRD_FUTURE_SUBSCRIBE_RECHECK
+from fred.future.impl import Future
+from fred.future.result import (
+    FutureResult,
+    FutureUndefinedPending,
+    FutureUndefinedInProgress,
+    FutureDefined,
+)
+
+A = TypeVar("A")
+B = TypeVar("B")
+
+logger = logger_manager.get_logger(__name__)
+
+
+class AsyncFuture(Generic[A]):
+    """An asyncio-native counterpart of the Future class.
+    An AsyncFuture wraps an asyncio task that collapses into an Either monad, which makes it
+    awaitable (i.e., 'await future' resolves the value or raises the original exception) and
+    compatible with 'asyncio.gather', 'asyncio.wait_for', etc.
+
+    AsyncFutures can be created from coroutine functions (with the same FutureResult state
+    transitions as the regular Future), from an existing Future (without blocking the event loop),
+    or by subscribing to a future that lives in the backend (via the async key-value and pub-sub
+    components); the latter allows waiting on thousands of results concurrently on a single loop.
+    """
+
+    def __init__(
+            self,
+            function: Callable[..., Awaitable[A]],
+            parent_id: Optional[str] = None,
+            broadcast: bool = False,
+            **kwargs
+        ):
+        """Initializes an AsyncFuture with the provided coroutine function; the coroutine is scheduled
+        as a task on the running event loop. The backend state transitions are offloaded into worker threads.
+        Args:
+            function (Callable[..., Awaitable[A]]): The coroutine function to be executed.
+            future_id (Optional[str], keyword-only): A reserved keyword-only parameter used to
+                uniquely identify this AsyncFuture instance. This value is not passed to the target function.
+            **kwargs: Additional keyword arguments to be passed to the function when executed.
+        """
+        self.future_id = kwargs.pop("future_id", None) or str(uuid.uuid4())
+        self.parent_id = parent_id
+        self.task = asyncio.ensure_future(
+            self._apply(function=function, broadcast=broadcast, **kwargs)
+        )
+
+    @classmethod
+    def _from_awaitable(
+            cls,
+            future_id: str,
+            awaitable: Awaitable[EitherMonad.Either[A]],
+            parent_id: Optional[str] = None,
+        ) -> 'AsyncFuture[A]':
+        instance = cls.__new__(cls)
+        instance.future_id = future_id
+        instance.parent_id = parent_id
+        instance.task = asyncio.ensure_future(awaitable)
+        return instance
+
+    async def _apply(self, function: Callable[..., Awaitable[A]], broadcast: bool, **kwargs) -> EitherMonad.Either[A]:
+        shared_params = {
+            "future_id": self.future_id,
+            "parent_id": self.parent_id,
+            "broadcast": broadcast,
+        }
+        await asyncio.to_thread(FutureUndefinedPending, **shared_params)
+        await asyncio.to_thread(
+            FutureUndefinedInProgress,
+            started_at=perf_counter(),
+            function_name=getattr(function, "__name__", "undefined"),
+            **shared_params,
+        )
+        try:
+            match await function(**kwargs):
+                case EitherMonad.Right(value=value):
+                    ok, value = True, EitherMonad.Right.from_value(val=value)
+                case EitherMonad.Left(exception=exception):
+                    ok, value = False, EitherMonad.Left.from_value(val=exception)
+                case value:
+                    ok, value = True, EitherMonad.Right.from_value(val=value)
+        except Exception as e:
+            ok, value = False, EitherMonad.Left.from_value(val=e)
+        try:
+            await asyncio.to_thread(FutureDefined, value=value, ok=ok, **shared_params)
+        except Exception as e:
+            logger.error(f"AsyncFuture[{self.future_id}] failed to persist its defined state: {e}")
+        return value
+
+    def __await__(self) -> Generator[None, None, A]:
+        return self.wait_and_resolve().__await__()
+
+    def __repr__(self) -> str:
+        return f"ASYNCFUTURE[{'DONE' if self.task.done() else 'PENDING'}]('{self.future_id}')"
+
+    def __str__(self) -> str:
+        return self.future_id
+
+    async def wait(self, timeout: Optional[float] = None) -> EitherMonad.Either[A]:
+        """Waits (without blocking the event loop) for the future to complete and returns the result as an Either monad.
+        Args:
+            timeout (Optional[float]): Maximum time to wait for the future to complete.
+                                       If None, waits indefinitely.
+        Returns:
+            Either[A]: An Either monad containing the result or exception.
+        Raises:
+            TimeoutError: If the future does not complete within the specified timeout.
+        """
+        # Shielding keeps the underlying task alive when the wait times out (as with the regular Future).
+        return await asyncio.wait_for(asyncio.shield(self.task), timeout=timeout)
+
+    async def wait_and_resolve(self, timeout: Optional[float] = None) -> A:
+        """Waits for the future to complete and resolves the result; raises if the future failed.
+        Args:
+            timeout (Optional[float]): Maximum time to wait for the future to complete.
+                                       If None, waits indefinitely.
+        Returns:
+            A: The resolved value of the future if it completed successfully.
+        """
+        return (await self.wait(timeout=timeout)).resolve()
+
+    def getwhatevernow(self) -> Optional[EitherMonad.Either[A]]:
+        """Gets the current result of the future without waiting; None if not completed."""
+        if not self.task.done() or self.task.exception():
+            return None
+        return self.task.result()
+
+    async def state(self) -> Optional[str]:
+        """Returns the current state of the future as stored in the backend (e.g., 'DEFINED:SUCCESS')."""
+        status, = await FutureResult.aread(self.future_id, "status")
+        return ":".join(status.split(":")[:2]) if status else None
+
+    def map(self, function: Callable[[A], B]) -> 'AsyncFuture[B]':
+        """Applies a function to the result of the future, returning a new AsyncFuture."""
+        async def step() -> B:
+            return function(await self.wait_and_resolve())
+        return AsyncFuture(function=step, parent_id=self.future_id)
+
+    def flat_map(self, function: Callable[[A], Awaitable[B]]) -> 'AsyncFuture[B]':
+        """Chains the current future with another awaitable-producing function (e.g., returning an AsyncFuture)."""
+        async def step() -> B:
+            return await function(await self.wait_and_resolve())
+        return AsyncFuture(function=step, parent_id=self.future_id)
+
+    @classmethod
+    def from_value(cls, val: A, **kwargs) -> 'AsyncFuture[A]':
+        """Creates an AsyncFuture that is immediately resolved with the given value."""
+        async def value() -> A:
+            return val
+        return cls(function=value, **kwargs)
+
+    @classmethod
+    def from_future(cls, future: Future[A]) -> 'AsyncFuture[A]':
+        """Wraps a regular (thread-based) Future into an AsyncFuture without blocking the event loop.
+        Args:
+            future (Future[A]): The future to wrap.
+        Returns:
+            AsyncFuture[A]: An AsyncFuture that completes when the wrapped future completes.
+        """
+        async def collapse() -> EitherMonad.Either[A]:
+            await asyncio.wait([asyncio.wrap_future(future.task)])
+            return await asyncio.to_thread(future._outcome)
+        return cls._from_awaitable(future_id=future.future_id, awaitable=collapse(), parent_id=future.parent_id)
+
+    @classmethod
+    def subscribe(
+            cls,
+            future_id: str,
+            retry: int = 3,
+            retry_delay: float = 0.2,
+            retry_backoff_rate: float = 0.1,
+            retry_delay_max: float = 15,
+            timeout: Optional[float] = None,
+        ) -> 'AsyncFuture[A]':
+        """Subscribes to an existing future (by ID) stored in the backend.
+        The subscription uses the async pub-sub broadcast channel when the future is configured
+        for broadcast (and the service supports it); otherwise, it polls the backend with an
+        exponential backoff using 'asyncio.sleep' (i.e., without blocking the event loop).
+        Args:
+            future_id (str): The unique identifier of the future to subscribe to.
+            retry (int): Number of retries when the future does not exist (yet) in the backend.
+            retry_delay (float): Initial delay between retries/polls.
+            retry_backoff_rate (float): Incremental increase in delay after each poll.
+            retry_delay_max (float): Maximum delay between polls.
+            timeout (Optional[float]): Maximum time (in seconds) to wait for the future to complete; the
+                AsyncFuture fails with a TimeoutError afterwards. If None, waits indefinitely.
+        Returns:
+            AsyncFuture[A]: An AsyncFuture that completes when the subscribed future is defined.
+        """
+        awaitable = cls._await_backend(
+            future_id=future_id,
+            retry=retry,
+            retry_delay=retry_delay,
+            retry_backoff_rate=retry_backoff_rate,
+            retry_delay_max=retry_delay_max,
+        )
+        return cls._from_awaitable(
+            future_id=future_id,
+            # The timeout cancels the wait itself (i.e., the subscription is released), not only the caller's await
+            awaitable=asyncio.wait_for(awaitable, timeout=timeout) if timeout is not None else awaitable,
+        )
+
+    @staticmethod
+    async def _await_broadcast(
+            subscription: FredSubscription,
+            timeout: Optional[float] = None,
+    ) -> Optional[EitherMonad.Either]:
+        async for payload in subscription.alisten(timeout=timeout):
+            if payload.get("type") != "message" or not (message := payload.get("data")):
+                continue
+            match FutureResult.from_string(message):
+                case FutureDefined(value=value):
+                    return value
+                case FutureUndefinedPending() | FutureUndefinedInProgress():
+                    continue
+                case _:
+                    raise TypeError("Unknown FutureResult type")
+        return None
+
+    @classmethod
+    async def _await_backend(
+            cls,
+            future_id: str,
+            retry: int,
+            retry_delay: float,
+            retry_backoff_rate: float,
+            retry_delay_max: float,
+        ) -> EitherMonad.Either:
+        # The broadcast channel is subscribed BEFORE reading the state; thus, a completion
+        # that happens in between is buffered by the subscription instead of being missed.
+        channel = FutureResult._get_bcast_channel(future_id=future_id)
+        try:
+            subscription = channel.subscription(loop=asyncio.get_running_loop())
+            await subscription.await_ready(timeout=FRD_FUTURE_SUBSCRIBE_RECHECK)
+        except NotImplementedError:
+            logger.debug(f"Async broadcast not available for future '{future_id}'; polling instead.")
+            subscription = None
+        try:
+            delay = retry_delay
+            while True:
+                match await FutureResult.afrom_backend(future_id=future_id):
+                    case FutureDefined(value=value):
+                        return value
+                    case None:
+                        if retry <= 0:
+                            raise ValueError(f"Future with ID '{future_id}' does not exist.")
+                        logger.error(
+                            f"Future with ID '{future_id}' does not exist; attempting to retry ({retry} retries left)."
+                        )
+                        retry -= 1
+                    case instance if instance.broadcast and subscription is not None:
+                        # Re-checks the backend state after a while without messages (e.g., dropped messages)
+                        if (value := await cls._await_broadcast(subscription, timeout=FRD_FUTURE_SUBSCRIBE_RECHECK)):
+                            return value
+                        continue
+                await asyncio.sleep(delay)
+                delay = min(delay * (1 + retry_backoff_rate), retry_delay_max)
+        finally:
+            if subscription is not None:
+                channel.unsubscribe(subscription_id=subscription.subscription_id)
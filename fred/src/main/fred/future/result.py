@@ -1,5 +1,7 @@
+import enum
 import json
 from time import perf_counter
+from concurrent.futures import wait as wait_tasks
 from dataclasses import dataclass
 from typing import (
     Callable,
@@ -16,11 +18,18 @@ from fred.future.settings import (
     FRD_FUTURE_BACKEND,
     FRD_FUTURE_DEFAULT_EXPIRATION,
     FRD_FUTURE_DEFAULT_TIMEOUT,
+    FRD_FUTURE_LAYOUT,
+    FRD_FUTURE_LAYOUT_FALLBACK,
+    FRD_FUTURE_CACHE_SIZE,
+    FRD_FUTURE_CACHE_TTL,
 )
 from fred.future.callback.interface import CallbackInterface
+from fred.future.executor.catalog import EXECUTOR_REF_TYPE
+from fred.future.codec.catalog import FutureCodecCatalog
 from fred.dao.service.catalog import ServiceCatalog
 from fred.utils.dateops import datetime_utcnow
 from fred.dao.comp.catalog import FredKeyVal, FredQueue, FredPubSub
+from fred.dao.comp._cache import FredKeyValCache
 from fred.monad.catalog import EitherMonad
 
 logger = logger_manager.get_logger(__name__)
@@ -28,10 +37,41 @@ logger = logger_manager.get_logger(__name__)
 A = TypeVar("A")
 
 
+def _is_defined_record(cache: FredKeyValCache, key: str, value: str | bytes | dict) -> bool:
+    # Defined records are immutable (i.e., safe to cache); the other fields of the KEYS layout
+    # are cacheable once the status of the same future has been cached as defined.
+    match value:
+        case dict():
+            return (value.get("status") or "").startswith("DEFINED")
+        case str() if key.endswith(":status"):
+            return value.startswith("DEFINED")
+        case _:
+            prefix, _, _ = key.rpartition(":")
+            return (cache.peek(f"{prefix}:status") or "").startswith("DEFINED")
+
+
+class FutureLayout(enum.Enum):
+    """Storage layout of the future records in the key-value backend.
+    KEYS: one key per field (i.e., 'frd:future:<id>:status', ':obj' and ':output').
+    HASH: a single hash per future (i.e., 'frd:future:<id>') with one field per record entry.
+    """
+    KEYS = "KEYS"
+    HASH = "HASH"
+
+    @property
+    def fallback(self) -> 'FutureLayout':
+        return FutureLayout.KEYS if self == FutureLayout.HASH else FutureLayout.HASH
+
+
 class FutureBackend:
     keyval: type[FredKeyVal]
     queue: type[FredQueue]
     pubsub: type[FredPubSub]
+    # Backends able to hold raw bytes store the FutureResult payloads without base64-encoding
+    binary: bool = False
+    layout: FutureLayout = FutureLayout[FRD_FUTURE_LAYOUT.upper()]
+    # Whether the records missing on the configured layout are read on the other one (see 'FRD_FUTURE_LAYOUT_FALLBACK')
+    layout_fallback: bool = FRD_FUTURE_LAYOUT_FALLBACK
 
     @classmethod
     def with_backend(cls, service: ServiceCatalog, **kwargs) -> type['FutureBackend']:
@@ -45,13 +85,19 @@ class FutureBackend:
             type[FutureBackend]: A new subclass of FutureBackend configured with the specified backend.
         """
         components = service.component_catalog(**kwargs)
+        keyval = components.KEYVAL.value
+        if FRD_FUTURE_CACHE_SIZE > 0:
+            cache = FredKeyValCache(maxsize=FRD_FUTURE_CACHE_SIZE, ttl=FRD_FUTURE_CACHE_TTL)
+            cache.cacheable = lambda key, value: _is_defined_record(cache=cache, key=key, value=value)
+            keyval = keyval.with_cache(cache=cache)
         return type(
             f"{service.name.title()}{cls.__name__}",
             (cls,),
             {
-                "keyval": components.KEYVAL.value,
+                "keyval": keyval,
                 "queue": components.QUEUE.value,
                 "pubsub": components.PUBSUB.value,
+                "binary": service == ServiceCatalog.STDLIB,
             },
         )
 
@@ -75,6 +121,11 @@ class FutureBackend:
             **kwargs
         )
 
+    @classmethod
+    def cache_stats(cls) -> Optional[dict]:
+        """Returns the metrics (e.g., hits and misses) of the client-side cache of the records; None if disabled."""
+        return cls.keyval._cache.stats() if cls.keyval._cache is not None else None
+
 
 @dataclass(frozen=True, slots=False)
 class FutureResult(Generic[A], FutureBackend.infer_backend()):
@@ -108,9 +159,141 @@ class FutureResult(Generic[A], FutureBackend.infer_backend()):
             return True
         return False
 
+    def _persist(self, state: str, output: Optional[str] = None) -> None:
+        """Writes the state transition into the backend as a single batch: the status key, the
+        serialized FutureResult (obj key), the optional output key, and the broadcast message
+        (if enabled) are sent together (i.e., in a single round-trip for Redis).
+        Args:
+            state (str): The status prefix (e.g., 'UNDEFINED:PENDING' or 'DEFINED:SUCCESS').
+            output (Optional[str]): The output payload; only set for defined futures.
+        """
+        obj_payload = self.stringify()
+        record = {
+            "status": f"{state}:{datetime_utcnow().isoformat()}",
+            "obj": obj_payload,
+        }
+        if output is not None:
+            record["output"] = output
+        publish = {self.bcast_channel.name: obj_payload} if self.broadcast else None
+        match self.layout:
+            case FutureLayout.HASH:
+                self._get_record_key(future_id=self.future_id).hset(
+                    mapping=record,
+                    expire=FRD_FUTURE_DEFAULT_EXPIRATION,
+                    publish=publish,
+                )
+            case FutureLayout.KEYS:
+                self.keyval.set_many(
+                    mapping={
+                        self._get_field_key(future_id=self.future_id, field=field).key: value
+                        for field, value in record.items()
+                    },
+                    expire=FRD_FUTURE_DEFAULT_EXPIRATION,
+                    publish=publish,
+                )
+
+    @classmethod
+    def _get_record_key(cls, future_id: str) -> FredKeyVal:
+        return cls.keyval(key=cls._get_future_keyname(future_id=future_id))
+
+    @classmethod
+    def _get_field_key(cls, future_id: str, field: str) -> FredKeyVal:
+        return cls.keyval(key=":".join([cls._get_future_keyname(future_id=future_id), field]))
+
+    @classmethod
+    def _layouts(cls) -> tuple[FutureLayout, ...]:
+        return (cls.layout, cls.layout.fallback) if cls.layout_fallback else (cls.layout,)
+
+    @classmethod
+    def _read_layout(cls, future_id: str, fields: tuple[str, ...], layout: FutureLayout) -> list[Optional[str]]:
+        match layout:
+            case FutureLayout.HASH:
+                return cls._get_record_key(future_id=future_id).hmget(*fields)
+            case FutureLayout.KEYS:
+                # A single MGET for every field (i.e., one round-trip)
+                return cls.keyval.mget([cls._get_field_key(future_id=future_id, field=field).key for field in fields])
+
+    @classmethod
+    def read(cls, future_id: str, *fields: str) -> list[Optional[str]]:
+        """Reads the record fields (i.e., 'status', 'obj' and/or 'output') of a future.
+        Only the configured layout is read unless the layout fallback is enabled (i.e., while migrating
+        between layouts), in which case the other layout is read for the records not found on the configured
+        one, so that records written before switching layouts remain readable. Reads on the HASH layout
+        are atomic (i.e., the status and the result always belong to the same transition).
+        Args:
+            future_id (str): The unique identifier of the future.
+            *fields (str): The record fields to retrieve.
+        Returns:
+            list[Optional[str]]: The field values (None for missing fields) in the same order.
+        """
+        values: list[Optional[str]] = []
+        for layout in cls._layouts():
+            values = cls._read_layout(future_id=future_id, fields=fields, layout=layout)
+            if any(value is not None for value in values):
+                break
+        return values
+
+    @classmethod
+    def _read_many_layout(
+            cls,
+            future_ids: list[str],
+            fields: tuple[str, ...],
+            layout: FutureLayout,
+    ) -> list[list[Optional[str]]]:
+        match layout:
+            case FutureLayout.HASH:
+                keys = [cls._get_record_key(future_id=future_id).key for future_id in future_ids]
+                return cls.keyval.hmget_many(keys, *fields)
+            case FutureLayout.KEYS:
+                keys = [
+                    cls._get_field_key(future_id=future_id, field=field).key
+                    for future_id in future_ids
+                    for field in fields
+                ]
+                values = cls.keyval.mget(keys)
+                return [values[index:index + len(fields)] for index in range(0, len(values), len(fields))]
+
+    @classmethod
+    def read_many(cls, future_ids: list[str], *fields: str) -> dict[str, list[Optional[str]]]:
+        """Bulk counterpart of the 'read' method: reads the record fields of multiple futures with a
+        single MGET (KEYS layout) or pipeline (HASH layout) per read layout instead of a round-trip per future.
+        Args:
+            future_ids (list[str]): The unique identifiers of the futures.
+            *fields (str): The record fields to retrieve.
+        Returns:
+            dict[str, list[Optional[str]]]: The field values (None for missing fields) by future ID.
+        """
+        records = dict(zip(future_ids, cls._read_many_layout(future_ids=future_ids, fields=fields, layout=cls.layout)))
+        if not cls.layout_fallback:
+            return records
+        if (missing := [future_id for future_id, values in records.items() if all(value is None for value in values)]):
+            fallback = cls._read_many_layout(future_ids=missing, fields=fields, layout=cls.layout.fallback)
+            records.update(zip(missing, fallback))
+        return records
+
+    @classmethod
+    async def aread(cls, future_id: str, *fields: str) -> list[Optional[str]]:
+        """Asyncio counterpart of the 'read' method."""
+        values: list[Optional[str]] = []
+        for layout in cls._layouts():
+            match layout:
+                case FutureLayout.HASH:
+                    values = await cls._get_record_key(future_id=future_id).ahmget(*fields)
+                case FutureLayout.KEYS:
+                    values = [await cls._get_field_key(future_id=future_id, field=field).aget() for field in fields]
+            if any(value is not None for value in values):
+                return values
+        return values
+
+    @classmethod
+    def fetch_status(cls, future_id: str) -> Optional[str]:
+        """Returns the raw status of a future (e.g., 'DEFINED:SUCCESS:<timestamp>') regardless of the layout."""
+        status, = cls.read(future_id, "status")
+        return status
+
     @classmethod
     def _get_status_key(cls, future_id: str) -> FredKeyVal:
-        return cls.keyval(key=":".join([cls._get_future_keyname(future_id=future_id), "status"]))
+        return cls._get_field_key(future_id=future_id, field="status")
 
     @property
     def status(self) -> FredKeyVal:
@@ -118,7 +301,7 @@ class FutureResult(Generic[A], FutureBackend.infer_backend()):
     
     @classmethod
     def _get_output_key(cls, future_id: str) -> FredKeyVal:
-        return cls.keyval(key=":".join([cls._get_future_keyname(future_id=future_id), "output"]))
+        return cls._get_field_key(future_id=future_id, field="output")
 
     @property
     def output(self) -> FredKeyVal:
@@ -126,33 +309,44 @@ class FutureResult(Generic[A], FutureBackend.infer_backend()):
     
     @classmethod
     def _get_obj_key(cls, future_id: str) -> FredKeyVal:
-        return cls.keyval(key=":".join([cls._get_future_keyname(future_id=future_id), "obj"]))
+        return cls._get_field_key(future_id=future_id, field="obj")
 
     @property
     def obj(self) -> FredKeyVal:
         return self._get_obj_key(future_id=self.future_id)
 
-    def stringify(self) -> str:
-        import dill
-        import base64
-        return base64.b64encode(dill.dumps(self)).decode("ascii")
+    def stringify(self, codec: Optional[str | FutureCodecCatalog] = None) -> str | bytes:
+        """Serializes the FutureResult using the configured wire format (see 'FRD_FUTURE_CODEC').
+        The payload is returned as raw bytes when the backend supports binary values."""
+        return FutureCodecCatalog.resolve(codec=codec).encode(result=self, binary=self.binary)
 
     @classmethod
-    def from_string(cls, payload: str) -> 'FutureResult[A]':
-        import dill
-        import base64
-        return dill.loads(base64.b64decode(payload))
+    def from_string(cls, payload: str | bytes) -> 'FutureResult[A]':
+        """Deserializes a FutureResult payload; the codec is inferred from the payload itself,
+        which keeps the payloads written with previous wire formats (e.g., dill) readable."""
+        return FutureCodecCatalog.decode(payload=payload)
     
     def _from_backend(self) -> Optional['FutureResult[A]']:
-        payload = self.obj.get()
+        # The status is read along (same round-trip); it allows caching the defined records (see FRD_FUTURE_CACHE_SIZE)
+        _, payload = self.read(self.future_id, "status", "obj")
         if not payload:
-            return
+            return None
         return self.from_string(payload=payload)
 
     @classmethod
     def from_backend(cls, future_id: str) -> Optional['FutureResult[A]']:
         return FutureResult(future_id=future_id, parent_id=None, broadcast=False)._from_backend()
 
+    async def _afrom_backend(self) -> Optional['FutureResult[A]']:
+        _, payload = await self.aread(self.future_id, "status", "obj")
+        if not payload:
+            return None
+        return self.from_string(payload=payload)
+
+    @classmethod
+    async def afrom_backend(cls, future_id: str) -> Optional['FutureResult[A]']:
+        return await FutureResult(future_id=future_id, parent_id=None, broadcast=False)._afrom_backend()
+
     @property
     def _pre(self) -> Optional['FutureResult']:
         if not self.parent_id:
@@ -193,21 +387,14 @@ class FutureUndefinedPending(FutureResult[A]):
 
     def __post_init__(self):
         logger.debug(f"Future[{self.future_id}] initialized and pending execution")
-        self.status.set(
-            value=f"UNDEFINED:PENDING:{datetime_utcnow().isoformat()}",
-            expire=FRD_FUTURE_DEFAULT_EXPIRATION
-        )
-        self.obj.set(
-            value=(obj_payload := self.stringify()),
-            expire=FRD_FUTURE_DEFAULT_EXPIRATION
-        )
-        self.bcast_now(item=obj_payload, ignore_flag=False)
+        self._persist(state="UNDEFINED:PENDING")
 
     def apply(
             self,
             function: Callable[..., A],
             on_start: Optional[CallbackInterface] = None,
             on_complete: Optional[CallbackInterface] = None,
+            executor: Optional[EXECUTOR_REF_TYPE] = None,
             **kwargs
         ) -> 'FutureDefined[A]':
         """Applies a function to the Future, transitioning it from pending to in-progress and finalizing as defined.
@@ -217,6 +404,7 @@ class FutureUndefinedPending(FutureResult[A]):
         exception, and returns a FutureDefined instance representing the completed state.
         Args:
             function (Callable[..., A]): The function to execute, which should return a value of type A.
+            executor (Optional[EXECUTOR_REF_TYPE]): The executor used to run non-blocking callbacks.
             **kwargs: Additional keyword arguments to pass to the function during execution.
         Returns:
             FutureDefined[A]: A new instance of FutureDefined representing the completed state of the Future.
@@ -232,6 +420,7 @@ class FutureUndefinedPending(FutureResult[A]):
             function=function,
             on_start=on_start,
             on_complete=on_complete,
+            executor=executor,
             **kwargs
         )
 
@@ -244,15 +433,7 @@ class FutureUndefinedInProgress(FutureResult[A]):
 
     def __post_init__(self):
         logger.debug(f"Future[{self.future_id}] started execution of function '{self.function_name}'")
-        self.status.set(
-            value=f"UNDEFINED:IN_PROGRESS:{datetime_utcnow().isoformat()}",
-            expire=FRD_FUTURE_DEFAULT_EXPIRATION
-        )
-        self.obj.set(
-            value=(obj_payload := self.stringify()),
-            expire=FRD_FUTURE_DEFAULT_EXPIRATION
-        )
-        self.bcast_now(item=obj_payload, ignore_flag=False)
+        self._persist(state="UNDEFINED:IN_PROGRESS")
 
     def exec(
             self,
@@ -260,6 +441,7 @@ class FutureUndefinedInProgress(FutureResult[A]):
             on_start: Optional[CallbackInterface] = None,
             on_complete: Optional[CallbackInterface] = None,
             fail: bool = False,
+            executor: Optional[EXECUTOR_REF_TYPE] = None,
             **kwargs,
         ) -> 'FutureDefined[A]':
         """Executes the function associated with the Future, capturing its result or exception.
@@ -272,14 +454,15 @@ class FutureUndefinedInProgress(FutureResult[A]):
         Args:
             function (Callable[..., A]): The function to execute, which should return a value of type A.
             fail (bool): If True, exceptions raised during function execution will be propagated. Defaults to False.
+            executor (Optional[EXECUTOR_REF_TYPE]): The executor used to run the non-blocking on_start callback.
             **kwargs: Additional keyword arguments to pass to the function during execution.
         Returns:
             FutureDefined[A]: A new instance of FutureDefined representing the completed state of the Future.
         """
         # Execute on_start callback if provided
-        on_start_thread = (
+        on_start_task = (
             logger.debug(f"Future[{self.future_id}] executing on_start callback")
-            or on_start.run(future_id=self.future_id, blocking=False)
+            or on_start.run(future_id=self.future_id, blocking=False, executor=executor)
         ) if on_start else None
         try:
             ok = False
@@ -314,8 +497,8 @@ class FutureUndefinedInProgress(FutureResult[A]):
         if on_complete:
             logger.debug(f"Future[{self.future_id}] executing on_complete callback")
             on_complete.run(future_id=self.future_id, output=value, blocking=True)
-        if on_start_thread:
-            on_start_thread.join()
+        if on_start_task:
+            wait_tasks([on_start_task])
         return future_defined
 
 
@@ -327,27 +510,15 @@ class FutureDefined(FutureResult[A]):
     def __post_init__(self):
         state = "SUCCESS" if self.ok else "FAILURE"
         logger.debug(f"FutureDefined[{self.future_id}] completed with state: {state}")
-        self.status.set(
-            value=f"DEFINED:{state}:{datetime_utcnow().isoformat()}",
-            expire=FRD_FUTURE_DEFAULT_EXPIRATION
-        )
-        self.obj.set(
-            value=(obj_payload := self.stringify()),
-            expire=FRD_FUTURE_DEFAULT_EXPIRATION
-        )
-        self.bcast_now(item=obj_payload, ignore_flag=False)
         match self.value:
             case EitherMonad.Right(value=value):
-                # TODO: Consider using a more robust serialization method...
                 # TODO: Should we consider collapsing nested-futures? i.e., Future[Future[A]] => Future[A]
-                payload = json.dumps(value)
-                self.output.set(
-                    value=payload,
-                    expire=FRD_FUTURE_DEFAULT_EXPIRATION
-                )
+                try:
+                    output = json.dumps(value)
+                except (TypeError, ValueError) as e:
+                    # The value is still available via the serialized FutureResult (obj key)
+                    logger.warning(f"FutureDefined[{self.future_id}] output is not JSON-serializable: {e}")
+                    output = None
             case EitherMonad.Left(exception=exception):
-                payload = json.dumps({"error": str(exception)})
-                self.output.set(
-                    value=str(exception),
-                    expire=FRD_FUTURE_DEFAULT_EXPIRATION
-                )
+                output = str(exception)
+        self._persist(state=f"DEFINED:{state}", output=output)
@@ -11,8 +11,63 @@ FRD_FUTURE_DEFAULT_EXPIRATION = int(get_environ_variable(
     default="3600",  # 1 hour
 ))
 
+FRD_FUTURE_CODEC = get_environ_variable(
+    "FRD_FUTURE_CODEC",
+    default="COMPACT",
+)
+
+# Storage layout of the future records: 'KEYS' (one key per field) or 'HASH' (a single hash per future)
+FRD_FUTURE_LAYOUT = get_environ_variable(
+    "FRD_FUTURE_LAYOUT",
+    default="KEYS",
+)
+
+# Whether the reads fall back to the other layout when a record is not found (i.e., only while migrating
+# between layouts); otherwise, pending or unknown futures would cost an additional round-trip on every read
+FRD_FUTURE_LAYOUT_FALLBACK = get_environ_variable(
+    "FRD_FUTURE_LAYOUT_FALLBACK",
+    default="false",
+).lower() in ("1", "true", "yes", "on")
+
+FRD_FUTURE_EXECUTOR = get_environ_variable(
+    "FRD_FUTURE_EXECUTOR",
+    default="POOL",
+)
+
+FRD_FUTURE_EXECUTOR_MAX_WORKERS = int(get_environ_variable(
+    "FRD_FUTURE_EXECUTOR_MAX_WORKERS",
+    default="64",
+))
+
+# Maximum time (in seconds) a subscriber waits for a broadcast message before re-checking the future state
+# in the backend (e.g., in case the completion message was dropped by a bounded subscription buffer)
+FRD_FUTURE_SUBSCRIBE_RECHECK = float(get_environ_variable(
+    "FRD_FUTURE_SUBSCRIBE_RECHECK",
+    default="5.0",
+))
+
+# Number of re-checks (see 'FRD_FUTURE_SUBSCRIBE_RECHECK') after which the bulk waiters report a future without
+# any record in the backend (e.g., an unknown or expired ID) as missing instead of waiting for it indefinitely;
+# note that the requests not yet picked up by a runner have no record either
+FRD_FUTURE_MISSING_RECHECKS = int(get_environ_variable(
+    "FRD_FUTURE_MISSING_RECHECKS",
+    default="12",
+))
+
 # TODO: This is currently not used, but reserved for future use...
 FRD_FUTURE_DEFAULT_TIMEOUT = int(get_environ_variable(
     "FRD_FUTURE_DEFAULT_TIMEOUT",
     default="900",  # 15 minutes
 ))
+
+# Client-side cache of the defined (i.e., immutable) future records: maximum number of cached keys (0 disables
+# the cache) and time-to-live (in seconds) of each entry; repeated reads of finished futures skip the backend.
+FRD_FUTURE_CACHE_SIZE = int(get_environ_variable(
+    "FRD_FUTURE_CACHE_SIZE",
+    default="0",
+))
+
+FRD_FUTURE_CACHE_TTL = float(get_environ_variable(
+    "FRD_FUTURE_CACHE_TTL",
+    default="300",
+))
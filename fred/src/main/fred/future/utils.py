@@ -1,7 +1,13 @@
 import time
-from typing import TypeVar, Optional
+import asyncio
+from typing import AsyncIterator, Iterable, Iterator, TypeVar, Optional
 
-from fred.future.settings import FRD_FUTURE_DEFAULT_EXPIRATION
+from fred.monad.catalog import EitherMonad
+from fred.future.settings import (
+    FRD_FUTURE_DEFAULT_EXPIRATION,
+    FRD_FUTURE_SUBSCRIBE_RECHECK,
+    FRD_FUTURE_MISSING_RECHECKS,
+)
 
 A = TypeVar("A")
 
@@ -37,3 +43,196 @@ def pull_future_result(
             )
         case _:
             raise ValueError(f"Unknown future state for ID '{future_id}'")
+
+
+def _read_defined_results(future_ids: list[str]) -> tuple[list[tuple[str, EitherMonad.Either]], list[str]]:
+    # Bulk read of the futures state; returns the defined (i.e., completed) results and the IDs without any record
+    from fred.future.result import FutureResult, FutureDefined
+
+    results, missing = [], []
+    for future_id, (status, obj) in FutureResult.read_many(future_ids, "status", "obj").items():
+        if status is None and obj is None:
+            missing.append(future_id)
+            continue
+        if not (status or "").startswith("DEFINED") or not obj:
+            continue
+        match FutureResult.from_string(obj):
+            case FutureDefined(value=value):
+                results.append((future_id, value))
+    return results, missing
+
+
+def _timeout_result(future_id: str, timeout: Optional[float]) -> EitherMonad.Either:
+    return EitherMonad.Left(TimeoutError(f"Future '{future_id}' did not complete within {timeout} seconds."))
+
+
+def _missing_results(
+        missing: list[str],
+        misses: dict[str, int],
+        missing_rechecks: Optional[int],
+) -> list[tuple[str, EitherMonad.Either]]:
+    # Counts the consecutive reads without a record; the futures missing for too long are reported as such
+    for future_id in set(misses).difference(missing):
+        misses.pop(future_id)
+    for future_id in missing:
+        misses[future_id] = misses.get(future_id, 0) + 1
+    if missing_rechecks is None:
+        return []
+    return [
+        (future_id, EitherMonad.Left(ValueError(f"No future found with ID '{future_id}'")))
+        for future_id in missing
+        if misses[future_id] > missing_rechecks
+    ]
+
+
+def wait_future_results(
+        future_ids: Iterable[str],
+        timeout: Optional[float] = None,
+        recheck: float = FRD_FUTURE_SUBSCRIBE_RECHECK,
+        missing_rechecks: Optional[int] = FRD_FUTURE_MISSING_RECHECKS,
+    ) -> Iterator[tuple[str, EitherMonad.Either]]:
+    """Waits for multiple futures and yields their results in completion order.
+    The already-defined results are read in bulk (see 'FutureResult.read_many'); the remaining
+    futures are awaited through a single shared subscription to their broadcast channels (i.e.,
+    no thread or connection per future). The backend is read again in bulk after 'recheck' seconds
+    without messages, which covers futures that do not broadcast (or dropped messages).
+    Args:
+        future_ids (Iterable[str]): The unique identifiers of the futures.
+        timeout (Optional[float]): Maximum time (in seconds) to wait; the futures still pending afterwards
+            are yielded with a TimeoutError (Left) value. If None, waits indefinitely.
+        recheck (float): Maximum time (in seconds) without messages before reading the backend again.
+        missing_rechecks (Optional[int]): Number of re-reads after which the futures without any record
+            (e.g., unknown or expired IDs) are yielded with a ValueError (Left) value. If None, waits for them.
+    Yields:
+        tuple[str, EitherMonad.Either]: The future ID and its result.
+    """
+    from fred.future.result import FutureResult, FutureDefined
+
+    # Channel name by future ID (duplicated IDs are only yielded once)
+    pending = {
+        future_id: FutureResult._get_bcast_channel(future_id=future_id).name
+        for future_id in dict.fromkeys(future_ids)
+    }
+    if not pending:
+        return
+    by_channel = {channel: future_id for future_id, channel in pending.items()}
+    deadline = None if timeout is None else time.monotonic() + timeout
+    channel = FutureResult._get_bcast_channel(future_id=next(iter(pending)))
+    try:
+        # Subscribing before reading the backend avoids missing the results completed in between
+        subscription = channel.subscription(channels=list(pending.values()))
+        subscription.wait_ready(timeout=recheck)
+    except NotImplementedError:
+        subscription = None
+
+    def settle(future_id: str) -> None:
+        if (name := pending.pop(future_id, None)) is not None and subscription is not None:
+            subscription.remove(name)
+
+    misses: dict[str, int] = {}
+    try:
+        while pending:
+            results, missing = _read_defined_results(future_ids=list(pending))
+            results += _missing_results(missing, misses=misses, missing_rechecks=missing_rechecks)
+            for future_id, value in results:
+                settle(future_id)
+                yield future_id, value
+            while pending:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    for future_id in list(pending):
+                        settle(future_id)
+                        yield future_id, _timeout_result(future_id=future_id, timeout=timeout)
+                    return
+                wait = recheck if remaining is None else min(remaining, recheck)
+                if subscription is None:
+                    time.sleep(wait)
+                    break
+                if (payload := subscription.get(timeout=wait)) is None:
+                    break
+                if payload.get("type") != "message" or not (message := payload.get("data")):
+                    continue
+                future_id = by_channel.get(payload.get("channel"), "")
+                match FutureResult.from_string(message):
+                    case FutureDefined(value=value) if future_id in pending:
+                        settle(future_id)
+                        yield future_id, value
+                    case _:
+                        continue
+    finally:
+        if subscription is not None:
+            channel.unsubscribe(subscription_id=subscription.subscription_id)
+
+
+async def await_future_results(
+        future_ids: Iterable[str],
+        timeout: Optional[float] = None,
+        recheck: float = FRD_FUTURE_SUBSCRIBE_RECHECK,
+        missing_rechecks: Optional[int] = FRD_FUTURE_MISSING_RECHECKS,
+    ) -> AsyncIterator[tuple[str, EitherMonad.Either]]:
+    """Asyncio counterpart of 'wait_future_results': the shared subscription delivers the broadcast
+    messages into the event loop (i.e., no thread is held while waiting) and only the bulk reads of
+    the backend run in a worker thread.
+    Args:
+        future_ids (Iterable[str]): The unique identifiers of the futures.
+        timeout (Optional[float]): Maximum time (in seconds) to wait; the futures still pending afterwards
+            are yielded with a TimeoutError (Left) value. If None, waits indefinitely.
+        recheck (float): Maximum time (in seconds) without messages before reading the backend again.
+        missing_rechecks (Optional[int]): Number of re-reads after which the futures without any record
+            (e.g., unknown or expired IDs) are yielded with a ValueError (Left) value. If None, waits for them.
+    Yields:
+        tuple[str, EitherMonad.Either]: The future ID and its result.
+    """
+    from fred.future.result import FutureResult, FutureDefined
+
+    pending = {
+        future_id: FutureResult._get_bcast_channel(future_id=future_id).name
+        for future_id in dict.fromkeys(future_ids)
+    }
+    if not pending:
+        return
+    by_channel = {channel: future_id for future_id, channel in pending.items()}
+    deadline = None if timeout is None else time.monotonic() + timeout
+    channel = FutureResult._get_bcast_channel(future_id=next(iter(pending)))
+    try:
+        subscription = channel.subscription(channels=list(pending.values()), loop=asyncio.get_running_loop())
+        await subscription.await_ready(timeout=recheck)
+    except NotImplementedError:
+        subscription = None
+
+    def settle(future_id: str) -> None:
+        if (name := pending.pop(future_id, None)) is not None and subscription is not None:
+            subscription.remove(name)
+
+    misses: dict[str, int] = {}
+    try:
+        while pending:
+            results, missing = await asyncio.to_thread(_read_defined_results, list(pending))
+            results += _missing_results(missing, misses=misses, missing_rechecks=missing_rechecks)
+            for future_id, value in results:
+                if future_id in pending:
+                    settle(future_id)
+                    yield future_id, value
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                for future_id in list(pending):
+                    settle(future_id)
+                    yield future_id, _timeout_result(future_id=future_id, timeout=timeout)
+                return
+            wait = recheck if remaining is None else min(remaining, recheck)
+            if subscription is None:
+                await asyncio.sleep(wait)
+                continue
+            # Listens until no message arrives within the wait (or the deadline); then reads the backend again
+            async for payload in subscription.alisten(timeout=wait):
+                if (message := payload.get("data")):
+                    future_id = by_channel.get(payload.get("channel"), "")
+                    match FutureResult.from_string(message):
+                        case FutureDefined(value=value) if future_id in pending:
+                            settle(future_id)
+                            yield future_id, value
+                if not pending or (deadline is not None and time.monotonic() >= deadline):
+                    break
+    finally:
+        if subscription is not None:
+            channel.unsubscribe(subscription_id=subscription.subscription_id)
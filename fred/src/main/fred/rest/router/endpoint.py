@@ -1,4 +1,5 @@
 import os
+import inspect
 from dataclasses import dataclass, field
 from typing import Callable, Optional
 
@@ -14,6 +15,12 @@ class RouterEndpointConfig:
     path: Optional[str] = None
     methods: list[str] = field(default_factory=lambda: ["GET"])
     configs: dict = field(default_factory=dict)
+    # When enabled, the request body is not parsed as JSON; instead, the endpoint receives the raw
+    # body as an async iterator of bytes (i.e., 'body' keyword argument) to consume it incrementally.
+    stream_body: bool = False
+    # Request headers left out of the endpoint parameters; e.g., standard headers sharing their name with
+    # a payload field (such as the 'Priority' header of RFC 9218, 'u=1, i', vs. the request priority).
+    ignore_headers: tuple[str, ...] = ()
 
     @classmethod
     def auto(cls, **kwargs) -> "RouterEndpointConfig":
@@ -23,8 +30,10 @@ class RouterEndpointConfig:
                 kwargs.pop("methods", None)
                 or ["GET"]
             ),
+            stream_body=kwargs.pop("stream_body", False),
+            ignore_headers=tuple(header.lower() for header in kwargs.pop("ignore_headers", ())),
             configs=kwargs
-        ) 
+        )
 
 
 @dataclass(frozen=True, slots=False)
@@ -79,19 +88,29 @@ class RouterEndpointAnnotation(RouterEndpoint):
         # - https://www.starlette.dev/requests/
         async def closure(request: Request):
             params = {
-                **request.headers,
+                **{
+                    header: value
+                    for header, value in request.headers.items()
+                    if header not in self.configs.ignore_headers
+                },
                 **request.path_params,
                 **request.query_params,
             }
             try:
-                if request.method in ("POST", "PUT", "PATCH"):
+                if self.configs.stream_body:
+                    params["body"] = request.stream()
+                elif request.method in ("POST", "PUT", "PATCH"):
                     params.update(await request.json())
             except Exception:
                 pass
             # Since the annotation is usually applied to methods within a class,
             # in most cases the 'other_instance' will be 'None'; therefore using 'other_class'
             # should allow accessing the shared-class level state (e.g., runner_backend).
-            return self.function(other_class, **params)
+            result = self.function(other_class, **params)
+            # Coroutine endpoints are awaited on the server event loop (i.e., without blocking a thread).
+            if inspect.isawaitable(result):
+                result = await result
+            return result
         return RouterEndpoint(
             function=closure,
             configs=self.configs,
@@ -1,9 +1,11 @@
 from dataclasses import dataclass
+from typing import Optional
 
 from fred.settings import logger_manager
 from fred.dao.comp.catalog import FredKeyVal, FredQueue, CompCatalog
 from fred.dao.service.interface import ServiceInterface
 from fred.dao.service.catalog import ServiceCatalog
+from fred.worker.runner.settings import FRD_RUNNER_QUEUE_COMPONENT
 
 logger = logger_manager.get_logger(name=__name__)
 
@@ -19,7 +21,9 @@ class RunnerBackend:
     _srv: ServiceInterface  # Allows direct access to a client instance
 
     @classmethod
-    def auto(cls, service_name: str, **kwargs) -> 'RunnerBackend':
+    def auto(cls, service_name: str, queue_component: Optional[str] = None, **kwargs) -> 'RunnerBackend':
+        # The queue component can be either the list-based 'QUEUE' or the Redis Streams-based 'STREAM'
+        queue_catalog = CompCatalog[(queue_component or FRD_RUNNER_QUEUE_COMPONENT).upper()]
         match (srv_catalog := ServiceCatalog[service_name.upper()]):
             case ServiceCatalog.REDIS:
                 from fred.dao.service.utils import get_redis_configs_from_payload
@@ -36,7 +40,7 @@ class RunnerBackend:
         srv_instance = srv_catalog.auto(**service_kwargs)
         return cls(
             keyval=CompCatalog.KEYVAL.value.mount(srv_ref=srv_instance),
-            queue=CompCatalog.QUEUE.value.mount(srv_ref=srv_instance),
+            queue=queue_catalog.value.mount(srv_ref=srv_instance),
             _cat=srv_catalog,
             _srv=srv_instance,
         )
@@ -1,9 +1,13 @@
+import os
+import json
 import time
+import itertools
 from dataclasses import dataclass
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
 from fred.future import Future
-from fred.future.result import FutureResult
+from fred.future.result import FutureResult, FutureLayout
+from fred.monad.catalog import EitherMonad
 from fred.dao.comp.catalog import FredQueue
 from fred.worker.runner.status import RunnerStatus
 from fred.worker.runner.signal import RunnerSignal
@@ -13,6 +17,8 @@ from fred.worker.runner.settings import (
     FRD_RUNNER_BACKEND,
     FRD_RUNNER_REQUEST_QUEUE,
     FRD_RUNNER_RESPONSE_QUEUE,
+    FRD_RUNNER_DISPATCH_CHUNK_SIZE,
+    FRD_RUNNER_PRIORITY_LEVELS,
 )
 from fred.settings import logger_manager
 
@@ -31,6 +37,7 @@ class RunnerClient:
             cls,
             queue_slug: Optional[str] = None,
             service_name: Optional[str] = None,
+            priority_levels: int = FRD_RUNNER_PRIORITY_LEVELS,
             **kwargs
         ) -> "RunnerClient":
         queue_slug = queue_slug or kwargs.pop("queue_slug", None) or (
@@ -45,7 +52,7 @@ class RunnerClient:
         )
         return cls(
             _runner_backend=runner_backend,
-            req_queue=runner_backend.queue(name=queue_name_request),
+            req_queue=runner_backend.queue(name=queue_name_request, levels=priority_levels),
             res_queue=runner_backend.queue(name=queue_name_response),
         )
 
@@ -85,28 +92,82 @@ class RunnerClient:
         }
 
     def futures(self) -> dict[str, Optional[str]]:
-        return {
-            key: self._runner_backend.keyval(key=key).get()
-            for key in self._runner_backend.keyval.keys(pattern="frd:future:*:status")
-        }
+        keyval = self._runner_backend.keyval
+        layouts = FutureResult._layouts()
+        futures = {
+            key: keyval(key=key).get()
+            for key in keyval.keys(pattern="frd:future:*:status")
+        } if FutureLayout.KEYS in layouts else {}
+        if FutureLayout.HASH in layouts:
+            # Futures stored with the HASH layout keep the whole record under a single key;
+            # the status is reported under the (KEYS layout) status keyname for consistency.
+            for key in keyval.keys(pattern="frd:future:*"):
+                if key.count(":") == 2:
+                    futures[f"{key}:status"] = keyval(key=key).hget(field="status")
+        return futures
 
     def send(
             self,
             item: dict,
             req_uuid_hash: bool = False,
             item_uuid_hash: bool = False,
+            priority: int = 0,
     ) -> str:
         item_instance = RunnerModelCatalog.ITEM.value.uuid(payload=item, uuid_hash=item_uuid_hash)
         request = item_instance.as_request(
             use_hash=req_uuid_hash,
             request_id=item.get("request_id"),
         )
-        request.dispatch(request_queue=self.req_queue)
+        # Higher priorities are consumed first; the priority is clamped into the levels of the request queue
+        # (i.e., the 'priority_levels' of the runners consuming it)
+        request.dispatch(request_queue=self.req_queue, priority=priority)
         return request.request_id
+
+    @staticmethod
+    def _read_jsonl(path: str | os.PathLike) -> Iterator[dict]:
+        with open(path, "r") as file:
+            for line in file:
+                if (line := line.strip()):
+                    yield json.loads(line)
+
+    def send_many(
+            self,
+            items: Iterable[dict] | str | os.PathLike,
+            chunk_size: int = FRD_RUNNER_DISPATCH_CHUNK_SIZE,
+            req_uuid_hash: bool = False,
+            item_uuid_hash: bool = False,
+            priority: int = 0,
+    ) -> Iterator[str]:
+        """Sends multiple items as requests (bulk equivalent of 'send').
+        The items are consumed in chunks; each chunk is validated and serialized at once and
+        pushed into the request queue with a single round-trip (see 'FredQueue.add_many'). Only
+        one chunk is kept in memory at a time; thus, the items can be a (lazy) generator or a
+        path to a JSONL file (one item per line) that is read in streaming fashion.
+        Note that this method is a generator: each chunk is sent when its request IDs are
+        consumed (e.g., 'for request_id in client.send_many(items): ...' or 'list(...)').
+        Args:
+            items (Iterable[dict] | str | os.PathLike): The items or the path to a JSONL file.
+            chunk_size (int): Number of items sent per round-trip.
+            req_uuid_hash (bool): Use deterministic (hash-based) request IDs.
+            item_uuid_hash (bool): Use deterministic (hash-based) item IDs.
+            priority (int): Priority of the requests (see 'send').
+        Yields:
+            str: The request IDs in the same order as the items.
+        """
+        if isinstance(items, (str, os.PathLike)):
+            items = self._read_jsonl(path=items)
+        for chunk in itertools.batched(items, max(chunk_size, 1)):
+            payloads = RunnerModelCatalog.ITEM.value.as_payload_many(payloads=list(chunk), uuid_hash=item_uuid_hash)
+            request_ids, requests = RunnerModelCatalog.REQUEST.value.serialize_many(
+                payloads=payloads,
+                uuid_hash=req_uuid_hash,
+            )
+            self.req_queue.add_many(requests, priority=priority, chunk_size=chunk_size)
+            yield from request_ids
     
     @staticmethod
     def fetch_status(request_id: str) -> Optional[str]:
-        return FutureResult._get_status_key(future_id=request_id).get()
+        return FutureResult.fetch_status(future_id=request_id)
 
     def _pullsync(
             self,
@@ -197,3 +258,26 @@ class RunnerClient:
         if now:
             return future.getwhatevernow()
         return future.wait_and_resolve(timeout=timeout)
+
+    def fetch_results(
+            self,
+            request_ids: Iterable[str],
+            timeout: Optional[float] = None,
+            **kwargs,
+    ) -> Iterator[tuple[str, EitherMonad.Either]]:
+        """Fetches the results of multiple requests as a stream in completion order.
+        The finished results are read in bulk (a single MGET/pipeline) and the rest are awaited
+        through a single shared subscription (see 'wait_future_results') instead of a 'Future.subscribe'
+        call (i.e., a thread and a subscription) per request.
+        Args:
+            request_ids (Iterable[str]): The request IDs (i.e., the future IDs).
+            timeout (Optional[float]): Maximum time (in seconds) to wait; the requests still pending afterwards
+                are yielded with a TimeoutError (Left) value.
+            **kwargs: Forwarded to 'wait_future_results' (e.g., 'missing_rechecks'; the unknown or expired
+                request IDs are yielded with a ValueError (Left) value).
+        Yields:
+            tuple[str, EitherMonad.Either]: The request ID and its result.
+        """
+        from fred.future.utils import wait_future_results
+
+        yield from wait_future_results(future_ids=request_ids, timeout=timeout, **kwargs)
@@ -1,14 +1,24 @@
 import uuid
 import json
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, wait as wait_tasks
 from dataclasses import dataclass
+from time import perf_counter
 from typing import Optional
 
 from fred.future import Future
+from fred.future.executor.catalog import ExecutorCatalog
 from fred.monad.catalog import EitherMonad
 from fred.utils.dateops import datetime_utcnow
 from fred.dao.comp.catalog import FredQueue
-from fred.worker.runner.settings import FRD_RUNNER_BACKEND
+from fred.worker.runner.settings import (
+    FRD_RUNNER_BACKEND,
+    FRD_RUNNER_BATCH_SIZE,
+    FRD_RUNNER_POLL_TIMEOUT,
+    FRD_RUNNER_VISIBILITY_TIMEOUT,
+)
 from fred.worker.runner.backend import RunnerBackend
+from fred.worker.runner.scheduler import WeightedQueueGroup
 from fred.worker.runner.model.catalog import RunnerModelCatalog
 from fred.worker.interface import HandlerInterface
 from fred.worker.runner.status import RunnerStatus
@@ -43,73 +53,185 @@ class RunnerHandler(HandlerInterface):
             future_id=request_id,
         )
 
+    @staticmethod
+    def _runner_parse(message: str) -> tuple[dict, str, str]:
+        item = json.loads(message)
+        item_id = item.get("item_id") or (
+            logger.warning("No item_id provided in item-payload; generating a new one using UUID5 hash.")
+            or str(uuid.uuid5(uuid.NAMESPACE_OID, message))
+        )
+        # The request_id is used as the future_id for tracking purposes
+        request_id = item.get("request_id") or (
+            logger.warning(f"No request_id provided in item-payload; using the item_id '{item_id}' instead.")
+            or item_id
+        )
+        return item, item_id, request_id
+
+    @staticmethod
+    def _runner_harvest(in_flight: deque, ordered: bool) -> list[tuple[str, str, str, Future]]:
+        # Collects the completed in-flight items; when ordered, the items are only collected
+        # in dispatch order (i.e., a completed item waits for the previous ones to complete).
+        if ordered:
+            completed = []
+            while in_flight and in_flight[0][-1].task.done():
+                completed.append(in_flight.popleft())
+            return completed
+        completed = [entry for entry in in_flight if entry[-1].task.done()]
+        for entry in completed:
+            in_flight.remove(entry)
+        return completed
+
+    @staticmethod
+    def _runner_pending(in_flight: deque, ordered: bool) -> list:
+        # The tasks to wait for before the next harvest; when ordered, only the head item can unblock the
+        # harvest (i.e., waiting on every in-flight task would return right away once a later item is done).
+        if ordered:
+            return [in_flight[0][-1].task] if in_flight else []
+        return [entry[-1].task for entry in in_flight if not entry[-1].task.done()]
+
     def _runner_loop(
             self,
             runner: HandlerInterface,
-            req_queue: FredQueue,
+            req_queue: FredQueue | WeightedQueueGroup,
             lifespan: int,
             timeout: int,
             res_queue: Optional[FredQueue] = None,
+            concurrency: int = 1,
+            ordered: bool = True,
+            consumer: Optional[str] = None,
+            visibility: float = FRD_RUNNER_VISIBILITY_TIMEOUT,
     ) -> dict:
+        # When a consumer ID is provided, the requests are claimed in reliable mode (i.e., acknowledged
+        # once processed); the claimed requests of runners that crash mid-item are eventually handed back
+        # into the queue by the reaper (see 'FredQueue.reap') after the visibility timeout.
+        def fetch(timeout: float) -> list[str]:
+            if not consumer:
+                return req_queue.pop_many(n=FRD_RUNNER_BATCH_SIZE, timeout=timeout)
+            return req_queue.claim_many(
+                consumer=consumer,
+                n=FRD_RUNNER_BATCH_SIZE,
+                timeout=timeout,
+                visibility=visibility,
+            )
+
+        def settle(message: str) -> None:
+            if consumer:
+                req_queue.ack(consumer=consumer, item=message)
+
+        def hand_back(messages: list[str]) -> None:
+            if not consumer:
+                return req_queue.requeue(items=messages)
+            for message in reversed(messages):
+                req_queue.nack(consumer=consumer, item=message, front=True)
+
+        last_heartbeat = perf_counter()
+
+        def heartbeat(force: bool = False) -> None:
+            nonlocal last_heartbeat
+            if consumer and (force or perf_counter() - last_heartbeat > visibility / 3):
+                req_queue.touch(consumer=consumer, visibility=visibility)
+                last_heartbeat = perf_counter()
+
         start_time = datetime_utcnow()
         last_processed_time = datetime_utcnow()
+        concurrency = max(1, concurrency)
+        # Messages fetched from the queue but not yet dispatched, and the items currently being processed
+        backlog: deque[str] = deque()
+        in_flight: deque[tuple[str, str, str, Future]] = deque()
+        stop = False
+        if consumer:
+            req_queue.reap()
         while (elapsed_seconds := (datetime_utcnow() - start_time).total_seconds()):
-            if elapsed_seconds > lifespan:
+            heartbeat()
+            for message, item_id, request_id, future in self._runner_harvest(in_flight=in_flight, ordered=ordered):
+                match future.wait():
+                    case EitherMonad.Right(value):
+                        if res_queue:
+                            logger.debug(
+                                f"Processed item ID '{item_id}' on request ID '{request_id}' "
+                                "and pushed result to response queue."
+                            )
+                            res_queue.add(value)
+                        # Acknowledged only once the result is pushed (i.e., a crash in between redelivers the request)
+                        settle(message)
+                    case EitherMonad.Left(error):
+                        logger.error(f"Error processing item ID '{item_id}' on request ID '{request_id}': {error}")
+                        settle(message)
+                        continue
+                    case _:
+                        logger.error(
+                            f"Unexpected result processing item ID '{item_id}' on request ID '{request_id}': {future}"
+                        )
+                        settle(message)
+                        continue
+                last_processed_time = datetime_utcnow()
+            idle_seconds = (datetime_utcnow() - last_processed_time).total_seconds()
+            poll_timeout = max(min(FRD_RUNNER_POLL_TIMEOUT, timeout - idle_seconds, lifespan - elapsed_seconds), 0.01)
+            if not stop and elapsed_seconds > lifespan:
                 logger.info("Lifespan exceeded; exiting runner loop.")
-                break
-            if (idle_seconds := (datetime_utcnow() - last_processed_time).total_seconds()) > timeout:
+                stop = True
+            # The runner is not idle while items are in flight
+            if not stop and not in_flight and idle_seconds > timeout:
                 logger.info(f"Idle time ({idle_seconds}) exceeded timeout ({timeout}); exiting runner loop.")
-                break
-            # Fetch item from Redis queue 
-            try:
-                message = req_queue.pop()
-                # If no item, iterate again
-                if not message:
-                    continue
-            except Exception as e:
-                logger.error(f"Error fetching item from Redis queue '{req_queue}': {e}")
-                continue
-            # Handle special signals
-            match message:
-                case "STOP" | "SHUTDOWN" | "TERMINATE":
-                    logger.info("Received STOP signal; exiting runner loop.")
+                stop = True
+            if stop:
+                # Hand back the messages that were not dispatched and drain the in-flight items before exiting
+                hand_back(list(backlog))
+                backlog.clear()
+                if not in_flight:
                     break
-                case "PING":
-                    logger.info("Received PING signal; continuing.")
-                    last_processed_time = datetime_utcnow()
-                    continue
-                case _:
-                    pass
-            try:
-                item = json.loads(message)
-                item_id = item.get("item_id") or (
-                    logger.warning("No item_id provided in item-payload; generating a new one using UUID5 hash.")
-                    or str(uuid.uuid5(uuid.NAMESPACE_OID, message))
-                )
-                # The request_id is used as the future_id for tracking purposes
-                request_id = item.get("request_id") or (
-                    logger.warning(f"No request_id provided in item-payload; using the item_id '{item_id}' instead.")
-                    or item_id
+                wait_tasks(
+                    self._runner_pending(in_flight=in_flight, ordered=ordered),
+                    timeout=poll_timeout,
+                    return_when=FIRST_COMPLETED,
                 )
-            except Exception as e:
-                logger.error(f"Error decoding or parsing item from Redis: {e}")
                 continue
-            # Process item using runner and handle result
-            future = self._runner_process(item=item, runner=runner, item_id=item_id, request_id=request_id).map(
-                lambda res: res if isinstance(res, str) else json.dumps(res, default=str)
-            )
-            match future.wait():
-                case EitherMonad.Right(value):
-                    if res_queue:
-                        logger.debug(f"Processed item ID '{item_id}' on request ID '{request_id}' and pushed result to response queue.")
-                        res_queue.add(value)
-                case EitherMonad.Left(error):
-                    logger.error(f"Error processing item ID '{item_id}' on request ID '{request_id}': {error}")
-                    continue
-                case _:
-                    logger.error(f"Unexpected result processing item ID '{item_id}' on request ID '{request_id}': {future}")
+            # Fetch a batch of items from the queue; blocks (up to the poll timeout bounded by the
+            # remaining idle/lifespan time) instead of busy-spinning while the queue is empty.
+            # While items are in flight, the pop only blocks briefly to keep collecting the results.
+            if not backlog and len(in_flight) < concurrency:
+                try:
+                    backlog.extend(fetch(timeout=min(poll_timeout, 0.05) if in_flight else poll_timeout))
+                    if consumer and not backlog and not in_flight:
+                        # Idle runners take care of handing back the requests claimed by dead runners
+                        req_queue.reap()
+                        heartbeat(force=True)
+                except Exception as e:
+                    logger.error(f"Error fetching items from queue '{req_queue}': {e}")
+            # Dispatch up to 'concurrency' items; the remaining messages stay in the backlog (backpressure)
+            while backlog and len(in_flight) < concurrency:
+                message = backlog.popleft()
+                # Handle special signals
+                match message:
+                    case "STOP" | "SHUTDOWN" | "TERMINATE":
+                        logger.info("Received STOP signal; exiting runner loop.")
+                        settle(message)
+                        stop = True
+                        break
+                    case "PING":
+                        logger.info("Received PING signal; continuing.")
+                        settle(message)
+                        last_processed_time = datetime_utcnow()
+                        continue
+                    case _:
+                        pass
+                try:
+                    item, item_id, request_id = self._runner_parse(message=message)
+                except Exception as e:
+                    logger.error(f"Error decoding or parsing item from queue: {e}")
+                    settle(message)
                     continue
-            last_processed_time = datetime_utcnow()
+                # Process item using runner; the result is collected once the future completes
+                future = self._runner_process(item=item, runner=runner, item_id=item_id, request_id=request_id).map(
+                    lambda res: res if isinstance(res, str) else json.dumps(res, default=str)
+                )
+                in_flight.append((message, item_id, request_id, future))
+            if len(in_flight) >= concurrency:
+                wait_tasks(
+                    self._runner_pending(in_flight=in_flight, ordered=ordered),
+                    timeout=poll_timeout,
+                    return_when=FIRST_COMPLETED,
+                )
         return {
             "started_at": start_time.isoformat(),
             "stopped_at": datetime_utcnow().isoformat(),
@@ -117,7 +239,7 @@ class RunnerHandler(HandlerInterface):
             "last_processed_at": last_processed_time.isoformat(),
             "idle_seconds": (datetime_utcnow() - last_processed_time).total_seconds(),
         }
- 
+
 
     def handler(self, payload: dict) -> dict:
         # Configure the backend service abstraction (e.g., Redis)
@@ -128,8 +250,11 @@ class RunnerHandler(HandlerInterface):
         # Outer handler model instance
         spec = RunnerModelCatalog.RUNNER_SPEC.value.from_payload(payload=payload)
         
-        # Determine request and response queues to use for this runner instance
-        req_queue = runner_backend.queue(name=spec.request_queue_name)
+        # Determine request and response queues to use for this runner instance; when several queue slugs
+        # are configured, the requests are consumed across them using weighted round-robin scheduling.
+        req_queue = runner_backend.queue(name=spec.request_queue_name, levels=spec.priority_levels) \
+            if not (weights := spec.request_queue_weights) else \
+            WeightedQueueGroup.from_weights(queue=runner_backend.queue, weights=weights, levels=spec.priority_levels)
         res_queue = runner_backend.queue(name=spec.response_queue_name) \
             if spec.use_response_queue else None
         # Get runner (inner handler) instance and ID
@@ -154,8 +279,13 @@ class RunnerHandler(HandlerInterface):
             lifespan=spec.lifetime,
             timeout=spec.timeout,
             res_queue=res_queue,
+            concurrency=spec.concurrency,
+            ordered=spec.ordered,
+            consumer=runner_id if spec.reliable else None,
             # The runner_id is used as the future_id for tracking purposes
             future_id=runner_id,
+            # The runner loop is long-lived; run it on a dedicated thread instead of holding a pool worker
+            executor=ExecutorCatalog.DAEMON,
         )
         runner_status.set(
             value=RunnerStatus.RUNNING.get_val(spec.queue_slug, f"Q({req_queue.size()})"),
@@ -2,6 +2,7 @@ import json
 import uuid
 from typing import Optional
 
+from pydantic import TypeAdapter
 from pydantic.dataclasses import dataclass
 
 from fred.utils.dateops import datetime_utcnow
@@ -9,23 +10,48 @@ from fred.worker.runner.model._request import RunnerRequest
 from fred.worker.runner.model.interface import ModelInterface
 
 
+# Validates a whole chunk of item payloads in a single call (instead of a model instance per item)
+_payloads_adapter = TypeAdapter(list[dict])
+
+
 @dataclass(frozen=True, slots=True)
 class RunnerItem(ModelInterface):
     item_id: str
     item_created_at: str
     item_payload: dict
 
-    @classmethod
-    def uuid(cls, payload: dict, uuid_hash: bool = False) -> "RunnerItem":
-        item_id = payload.get("item_id") or (
+    @staticmethod
+    def _item_id(payload: dict, uuid_hash: bool = False) -> str:
+        return payload.get("item_id") or (
             str(uuid.uuid5(uuid.NAMESPACE_DNS, json.dumps(payload, default=str)))
             if uuid_hash else str(uuid.uuid4())
         )
+
+    @classmethod
+    def uuid(cls, payload: dict, uuid_hash: bool = False) -> "RunnerItem":
         return cls(
-            item_id=item_id,
+            item_id=cls._item_id(payload=payload, uuid_hash=uuid_hash),
             item_created_at=datetime_utcnow().isoformat(),
             item_payload=payload
         )
+
+    @classmethod
+    def as_payload_many(cls, payloads: list[dict], uuid_hash: bool = False) -> list[dict]:
+        """Bulk equivalent of 'cls.uuid(payload).as_payload()' for a chunk of payloads.
+        The chunk is validated at once and the item payloads are built directly (i.e., no
+        intermediate model instances); all the items of the chunk share the creation timestamp.
+        Raises:
+            pydantic.ValidationError: If any of the payloads is not a dictionary.
+        """
+        item_created_at = datetime_utcnow().isoformat()
+        return [
+            {
+                "item_id": cls._item_id(payload=payload, uuid_hash=uuid_hash),
+                "item_created_at": item_created_at,
+                **payload,
+            }
+            for payload in _payloads_adapter.validate_python(payloads)
+        ]
     
     def as_payload(self) -> dict:
         return {
@@ -20,11 +20,35 @@ class RunnerRequest(ModelInterface):
             uuid_hash: bool = False,
             request_id: Optional[str] = None,
     ) -> "RunnerRequest":
-        request_id = request_id or (
+        return cls(
+            request_id=cls._request_id(payload=payload, uuid_hash=uuid_hash, request_id=request_id),
+            payload=payload,
+        )
+
+    @staticmethod
+    def _request_id(payload: dict, uuid_hash: bool = False, request_id: Optional[str] = None) -> str:
+        return request_id or (
             str(uuid.uuid5(uuid.NAMESPACE_OID, json.dumps(payload, default=str)))
             if uuid_hash else str(uuid.uuid4())
         )
-        return cls(request_id=request_id, payload=payload)
+
+    @classmethod
+    def serialize_many(cls, payloads: list[dict], uuid_hash: bool = False, **kwargs) -> tuple[list[str], list[str]]:
+        """Bulk equivalent of 'cls.uuid(payload)' followed by the 'dispatch' serialization.
+        The request ID is taken from the 'request_id' key of each payload when available.
+        Returns:
+            tuple[list[str], list[str]]: The request IDs and the serialized requests (same order).
+        """
+        serialization_kwargs = {
+            "default": str,
+            **kwargs
+        }
+        request_ids, requests = [], []
+        for payload in payloads:
+            request_id = cls._request_id(payload=payload, uuid_hash=uuid_hash, request_id=payload.get("request_id"))
+            request_ids.append(request_id)
+            requests.append(json.dumps({"request_id": request_id, **payload}, **serialization_kwargs))
+        return request_ids, requests
     
     def as_payload(self) -> dict:
         return {
@@ -32,10 +56,10 @@ class RunnerRequest(ModelInterface):
             **self.payload,
         }
     
-    def dispatch(self, request_queue: FredQueue, **kwargs):
+    def dispatch(self, request_queue: FredQueue, priority: int = 0, **kwargs):
         serialization_kwargs = {
             "default": str,
             **kwargs
         }
         request = json.dumps(self.as_payload(), **serialization_kwargs)
-        return request_queue.add(request)
+        return request_queue.add(request, priority=priority)
@@ -1,5 +1,6 @@
 import uuid
 from dataclasses import dataclass
+from typing import Optional
 
 from fred.settings import logger_manager
 from fred.utils.dateops import datetime_utcnow
@@ -8,6 +9,7 @@ from fred.worker.runner.model.interface import ModelInterface
 from fred.worker.runner.settings import (
     FRD_RUNNER_REQUEST_QUEUE,
     FRD_RUNNER_RESPONSE_QUEUE,
+    FRD_RUNNER_PRIORITY_LEVELS,
 )
 
 logger = logger_manager.get_logger(name=__name__)
@@ -23,6 +25,11 @@ class RunnerSpec(ModelInterface):
     use_response_queue: bool = False
     lifetime: int = 3600  # Default to 1 hour if not specified
     timeout: int = 30  # Default to 30 seconds if not specified
+    concurrency: int = 1  # Maximum number of items processed at the same time (i.e., in flight)
+    ordered: bool = True  # Push the results into the response queue following the request order
+    reliable: bool = False  # Acknowledge the requests once processed (i.e., hand them back if the runner crashes)
+    priority_levels: int = FRD_RUNNER_PRIORITY_LEVELS  # Request priority levels consumed by the runner (highest first)
+    queue_weights: Optional[dict[str, int]] = None  # Weighted round-robin consumption across several queue slugs
 
     @classmethod
     def auto(cls, **kwargs) -> "RunnerSpec":
@@ -58,6 +65,11 @@ class RunnerSpec(ModelInterface):
             use_response_queue=payload.pop("use_response_queue", False),
             lifetime=payload.pop("lifetime", 3600),
             timeout=payload.pop("timeout", 30),
+            concurrency=int(payload.pop("concurrency", 1)),
+            ordered=payload.pop("ordered", True),
+            reliable=payload.pop("reliable", False),
+            priority_levels=int(payload.pop("priority_levels", FRD_RUNNER_PRIORITY_LEVELS)),
+            queue_weights=payload.pop("queue_weights", None),
         )
     
     def as_dict(self) -> dict:
@@ -71,6 +83,11 @@ class RunnerSpec(ModelInterface):
             "use_response_queue": self.use_response_queue,
             "lifetime": self.lifetime,
             "timeout": self.timeout,
+            "concurrency": self.concurrency,
+            "ordered": self.ordered,
+            "reliable": self.reliable,
+            "priority_levels": self.priority_levels,
+            "queue_weights": self.queue_weights,
         }
     
     def as_event(self, drop_id: bool = False) -> dict:
@@ -83,6 +100,18 @@ class RunnerSpec(ModelInterface):
     def request_queue_name(self) -> str:
         return FRD_RUNNER_REQUEST_QUEUE or f"req:{self.queue_slug}"
     
+    @property
+    def request_queue_weights(self) -> Optional[dict[str, int]]:
+        """Returns the request queue names mapped to their weights when consuming from several queue slugs;
+        the runner's own queue slug is always included (with weight 1 unless specified)."""
+        if not self.queue_weights:
+            return None
+        weights = {self.request_queue_name: int(self.queue_weights.get(self.queue_slug, 1))}
+        for queue_slug, weight in self.queue_weights.items():
+            if queue_slug != self.queue_slug:
+                weights[f"req:{queue_slug}"] = int(weight)
+        return weights
+
     @property
     def response_queue_name(self) -> str:
         return FRD_RUNNER_RESPONSE_QUEUE or f"res:{self.queue_slug}"
@@ -3,6 +3,7 @@ from threading import Thread
 from typing import Optional
 
 from fred.future import Future
+from fred.future.executor.catalog import ExecutorCatalog
 from fred.settings import logger_manager
 from fred.monad.catalog import EitherMonad
 from fred.worker.runner.status import RunnerStatus
@@ -92,6 +93,7 @@ class PluginInterface:
         future_exec = Future(
             function=self._execute_wrapper,
             spec=spec,
+            executor=ExecutorCatalog.DAEMON,
             **kwargs
         )
         future_monitor = None
@@ -132,5 +134,6 @@ class PluginInterface:
         return Future(
             function=self._monitor,
             spec=spec,
+            executor=ExecutorCatalog.DAEMON,
             **kwargs
         )
@@ -1,14 +1,142 @@
-from typing import Optional
+import re
+import json
+import uuid
+import codecs
+import asyncio
+from typing import AsyncIterator, Iterator, Optional
 
-from fred.future import Future
+from fastapi import HTTPException, status
+from fastapi.responses import StreamingResponse
+
+from fred.future import AsyncFuture
+from fred.monad.catalog import EitherMonad
 from fred.settings import logger_manager
 from fred.utils.dateops import datetime_utcnow
 from fred.rest.router.interface import RouterInterfaceMixin
 from fred.rest.router.endpoint import RouterEndpointAnnotation
+from fred.worker.runner.settings import (
+    FRD_RUNNER_DISPATCH_CHUNK_SIZE,
+    FRD_RUNNER_PRIORITY_LEVELS,
+    FRD_RUNNER_OUTPUTS_TIMEOUT,
+    FRD_RUNNER_STREAM_POLL_INTERVAL,
+    FRD_RUNNER_VISIBILITY_TIMEOUT,
+)
 
 logger = logger_manager.get_logger(name=__name__)
 
 
+def _result_payload(request_id: str, result: EitherMonad.Either) -> dict:
+    match result:
+        case EitherMonad.Right(value):
+            return {"request_id": request_id, "ok": True, "output": value}
+        case EitherMonad.Left(error):
+            return {"request_id": request_id, "ok": False, "error": f"{type(error).__name__}: {error}"}
+        case _:
+            return {"request_id": request_id, "ok": False, "error": f"Unexpected result: {result}"}
+
+
+def _as_bool(value: bool | str) -> bool:
+    # Query-string parameters are received as strings when called through the REST endpoint.
+    return value if isinstance(value, bool) else str(value).lower() in ("1", "true", "yes")
+
+
+def _as_priority(value: int | str) -> int:
+    # The priority is read from the query string or the body (the 'Priority' header is ignored; see RFC 9218)
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid priority '{value}'; expected an integer.",
+        )
+
+
+def _parse_output(item: str | dict) -> dict | str:
+    # Response queue items are JSON documents on remote backends (and the objects themselves on STDLIB)
+    if not isinstance(item, str):
+        return item
+    try:
+        return json.loads(item)
+    except json.JSONDecodeError:
+        return item
+
+
+def _stream_event(payload: dict, sse: bool, event: str = "result") -> str:
+    data = json.dumps(payload, default=str)
+    if not sse:
+        return data + "\n"
+    # Server-Sent Events; the request ID (if any) is used as the event ID
+    event_id = f"id: {request_id}\n" if (request_id := payload.get("request_id")) else ""
+    return f"event: {event}\n{event_id}data: {data}\n\n"
+
+
+# Prefixes of a JSON string, number, or literal (i.e., a value truncated by the end of the buffer)
+_TRUNCATED_TOKEN = re.compile(
+    r'"(?:[^"\\]|\\.)*\\?|-?[0-9.eE+-]*|t(?:r(?:ue?)?)?|f(?:a(?:l(?:se?)?)?)?|n(?:u(?:ll?)?)?'
+)
+
+
+async def _iter_json_items(body: AsyncIterator[bytes]) -> AsyncIterator[dict]:
+    """Incrementally parses a streamed body of JSON items: either NDJSON (i.e., whitespace
+    separated values, usually one per line) or a JSON array. Only the incomplete tail of the
+    body is buffered between chunks.
+    Raises:
+        ValueError: If the body contains an invalid (or truncated) JSON item or a malformed array.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    parser = json.JSONDecoder()
+    # The expected token of a JSON array body: an item (or the closing bracket), a separator, or nothing else
+    buffer, is_array, expect = "", None, "item"
+
+    def parse(final: bool = False) -> Iterator[dict]:
+        nonlocal buffer, is_array, expect
+        position = 0
+        while True:
+            while position < len(buffer) and buffer[position] in " \t\r\n":
+                position += 1
+            if position == len(buffer):
+                break
+            char = buffer[position]
+            if is_array is None:
+                # The first value determines the format
+                is_array = char == "["
+                position += is_array
+                expect = "item-or-close" if is_array else "item"
+                continue
+            if is_array and expect == "end":
+                raise ValueError(f"Unexpected data after the JSON array at position {position}.")
+            if is_array and expect == "separator":
+                if char not in ",]":
+                    raise ValueError(f"Expected ',' or ']' between the JSON array items at position {position}.")
+                position += 1
+                expect = "item" if char == "," else "end"
+                continue
+            if is_array and expect == "item-or-close" and char == "]":
+                position += 1
+                expect = "end"
+                continue
+            try:
+                item, position = parser.raw_decode(buffer, position)
+            except json.JSONDecodeError as e:
+                # Only a value truncated by the end of the buffer is incomplete (i.e., waits for the next chunk)
+                if final or not _TRUNCATED_TOKEN.fullmatch(buffer, e.pos):
+                    raise
+                break
+            expect = "separator" if is_array else "item"
+            yield item
+        buffer = buffer[position:]
+        if final and is_array and expect != "end":
+            raise ValueError("Unterminated JSON array.")
+
+    async for chunk in body:
+        buffer += decoder.decode(chunk)
+        for item in parse():
+            yield item
+    buffer += decoder.decode(b"", final=True)
+    for item in parse(final=True):
+        yield item
+
+
 class RunnerRouterMixin(RouterInterfaceMixin):
 
     @RouterEndpointAnnotation.set(
@@ -94,6 +222,7 @@ class RunnerRouterMixin(RouterInterfaceMixin):
         tags=["Runner"],
         summary="Execute a task by dispatching a request to the specified queue.",
         response_description="Details about the dispatched request.",
+        ignore_headers=("priority",),
     )
     def runner_execute(self, **kwargs) -> dict:
         from fred.worker.runner.model.catalog import RunnerModelCatalog
@@ -103,11 +232,13 @@ class RunnerRouterMixin(RouterInterfaceMixin):
             logger.error("No 'queue_slug' value provided; defaulting to 'demo'.")
             or "demo"
         )
+        priority = _as_priority(kwargs.pop("priority", 0))
 
         item = RunnerModelCatalog.ITEM.value.uuid(payload=kwargs, uuid_hash=False)
         request = item.as_request(use_hash=False, request_id=request_id)
         request.dispatch(
-            request_queue=self.runner_backend.queue(f"req:{queue_slug}")
+            request_queue=self.runner_backend.queue(f"req:{queue_slug}", levels=FRD_RUNNER_PRIORITY_LEVELS),
+            priority=priority,
         )
         # Starting the runner to process the request if requested; this should always be BEFORE placing the request in the queue
         # to avoid race conditions where a blocking runner is spawned before the request is enqueued.
@@ -124,6 +255,71 @@ class RunnerRouterMixin(RouterInterfaceMixin):
             "runner_start_output": runner_start_output,
         }
 
+    @RouterEndpointAnnotation.set(
+        path="/execute_batch",
+        methods=["POST"],
+        tags=["Runner"],
+        summary="Execute multiple tasks by streaming requests (NDJSON or a JSON array) to the specified queue.",
+        response_description="The request IDs (NDJSON) in the same order as the items.",
+        stream_body=True,
+        ignore_headers=("priority",),
+    )
+    async def runner_execute_batch(
+            self,
+            body: AsyncIterator[bytes],
+            queue_slug: Optional[str] = None,
+            priority: int = 0,
+            chunk_size: int = FRD_RUNNER_DISPATCH_CHUNK_SIZE,
+            **kwargs,
+    ) -> StreamingResponse:
+        from fred.worker.runner.client import RunnerClient
+
+        queue_slug = queue_slug or (
+            logger.error("No 'queue_slug' value provided; defaulting to 'demo'.")
+            or "demo"
+        )
+        # Unlike '/execute', the headers and query parameters are not merged into the item payloads
+        priority, chunk_size = _as_priority(priority), max(int(chunk_size), 1)
+        client = RunnerClient(
+            _runner_backend=self.runner_backend,
+            req_queue=self.runner_backend.queue(f"req:{queue_slug}", levels=FRD_RUNNER_PRIORITY_LEVELS),
+            res_queue=self.runner_backend.queue(f"res:{queue_slug}"),
+        )
+
+        def dispatch(items: list[dict]) -> list[str]:
+            return list(client.send_many(items, chunk_size=chunk_size, priority=priority))
+
+        # The items are dispatched chunk by chunk while the body is being received (i.e., a single
+        # pipelined round-trip per chunk, and only the request IDs are kept in memory); the queue
+        # writes run in a worker thread to keep the event loop free.
+        request_ids, error, chunk = [], None, []
+        try:
+            async for item in _iter_json_items(body):
+                chunk.append(item)
+                if len(chunk) >= chunk_size:
+                    request_ids.extend(await asyncio.to_thread(dispatch, chunk))
+                    chunk = []
+            if chunk:
+                request_ids.extend(await asyncio.to_thread(dispatch, chunk))
+        except ValueError as e:
+            # The requests dispatched before the invalid item are still reported (followed by the error)
+            logger.error(f"Batch dispatch to queue '{queue_slug}' interrupted after {len(request_ids)} requests: {e}")
+            error = f"{type(e).__name__}: {e}"
+
+        # The response is streamed once the body has been consumed; reading the request body while
+        # streaming the response is not supported by every ASGI server (i.e., no full-duplex).
+        # The lines are sent in blocks of 'chunk_size' (sync iterators are consumed through a thread pool).
+        def lines() -> Iterator[str]:
+            for start in range(0, len(request_ids), chunk_size):
+                yield "".join(
+                    json.dumps({"request_id": request_id}) + "\n"
+                    for request_id in request_ids[start:start + chunk_size]
+                )
+            if error is not None:
+                yield json.dumps({"error": error, "dispatched": len(request_ids)}) + "\n"
+
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
     @RouterEndpointAnnotation.set(
         path="/output/{request_id}",
         methods=["GET"],
@@ -131,17 +327,148 @@ class RunnerRouterMixin(RouterInterfaceMixin):
         summary="Fetch the output of a previously dispatched request.",
         response_description="The output of the request.",
     )
-    def runner_output(self, request_id: str, nonblocking: bool = False, timeout: Optional[float] = None, **kwargs) -> dict:
+    async def runner_output(
+            self,
+            request_id: str,
+            nonblocking: bool = False,
+            timeout: Optional[float] = None,
+            **kwargs,
+    ) -> dict:
+
+        from fred.future.result import FutureResult, FutureDefined
 
         output_requested_at = datetime_utcnow().isoformat()
-        # Subscribe to the future result using the request_id
-        future = Future.subscribe(future_id=request_id)
+        nonblocking = _as_bool(nonblocking)
+        timeout = float(timeout) if timeout is not None else None
         if nonblocking:
-            # TODO: Implement non-blocking fetch logic... let's ensure it's worth the effort.
-            raise NotImplementedError("Non-blocking fetch not implemented yet...")
+            # Reports the current state right away (i.e., a status poll); the output is only included once defined
+            status, obj = await FutureResult.aread(request_id, "status", "obj")
+            match FutureResult.from_string(obj) if obj and (status or "").startswith("DEFINED") else None:
+                case FutureDefined(value=value):
+                    result = _result_payload(request_id=request_id, result=value)
+                case _:
+                    result = {"request_id": request_id}
+            return {
+                **result,
+                # Status without the timestamp (e.g., 'UNDEFINED:IN_PROGRESS' or 'DEFINED:SUCCESS'); None if unknown
+                "status": ":".join(status.split(":")[:2]) if status else None,
+                "ready": "ok" in result,
+                "output_requested_at": output_requested_at,
+                "output_delivered_at": datetime_utcnow().isoformat(),
+            }
+        # Subscribe to the future result using the request_id; the async future awaits the result
+        # on the event loop instead of parking a server thread per pending request.
+        future = AsyncFuture.subscribe(future_id=request_id, timeout=timeout)
+        output = await future.wait_and_resolve(timeout=timeout)
         return {
             "request_id": request_id,
             "output_requested_at": output_requested_at,
             "output_delivered_at": datetime_utcnow().isoformat(),
-            "output": future.wait_and_resolve(timeout=timeout),
+            "output": output,
         }
+
+    @RouterEndpointAnnotation.set(
+        path="/outputs",
+        methods=["POST"],
+        tags=["Runner"],
+        summary="Fetch the outputs of multiple previously dispatched requests.",
+        response_description="The outputs of the requests in completion order.",
+    )
+    async def runner_outputs(
+            self,
+            request_ids: list[str] | str,
+            timeout: float | str = FRD_RUNNER_OUTPUTS_TIMEOUT,
+            **kwargs,
+    ) -> dict:
+        from fred.future.utils import await_future_results
+
+        outputs_requested_at = datetime_utcnow().isoformat()
+        request_ids = request_ids.split(",") if isinstance(request_ids, str) else request_ids
+        # Always bounded (i.e., the request never hangs the connection); the pending requests time out
+        timeout = float(timeout)
+        # The finished results are read in bulk and the rest are awaited through a single shared
+        # subscription driven by the event loop (i.e., no thread is held while waiting).
+        results = [
+            _result_payload(request_id=request_id, result=result)
+            async for request_id, result in await_future_results(future_ids=request_ids, timeout=timeout)
+        ]
+        return {
+            "outputs_requested_at": outputs_requested_at,
+            "outputs_delivered_at": datetime_utcnow().isoformat(),
+            "results": results,
+        }
+
+    @RouterEndpointAnnotation.set(
+        path="/outputs/stream",
+        methods=["GET", "POST"],
+        tags=["Runner"],
+        summary="Stream the outputs of multiple requests (or of a queue slug) as they complete (NDJSON or SSE).",
+        response_description="The outputs of the requests in completion order.",
+    )
+    async def runner_outputs_stream(
+            self,
+            request_ids: Optional[list[str] | str] = None,
+            queue_slug: Optional[str] = None,
+            timeout: Optional[float] = None,
+            sse: bool | str = False,
+            **kwargs,
+    ) -> StreamingResponse:
+        from fred.future.utils import await_future_results
+
+        # Server-Sent Events are used when requested explicitly or via the 'Accept' header
+        sse = _as_bool(sse) or "text/event-stream" in kwargs.get("accept", "")
+        timeout = float(timeout) if timeout is not None else None
+        if request_ids is not None:
+            request_ids = request_ids.split(",") if isinstance(request_ids, str) else request_ids
+
+            async def events() -> AsyncIterator[str]:
+                # Driven by the broadcast of the results (a single shared subscription); no thread is held while waiting
+                async for request_id, result in await_future_results(future_ids=request_ids, timeout=timeout):
+                    yield _stream_event(_result_payload(request_id=request_id, result=result), sse=sse)
+                if sse:
+                    yield _stream_event({"count": len(set(request_ids))}, sse=sse, event="end")
+        elif queue_slug:
+            # The results pushed into the response queue by the runners (i.e., 'use_response_queue') are claimed
+            # as they arrive and only acknowledged once the chunk was handed to the server; the chunk being sent
+            # when the client disconnects is handed back into the queue (i.e., at-least-once delivery). Note that
+            # the streams of the same slug split the results among them (i.e., each result is streamed once).
+            res_queue = self.runner_backend.queue(f"res:{queue_slug}")
+            consumer = f"outputs-stream:{uuid.uuid4()}"
+
+            def claim() -> list[str]:
+                # Non-blocking; the queue calls run in a worker thread to keep the event loop free
+                return res_queue.claim_many(
+                    consumer=consumer,
+                    n=FRD_RUNNER_DISPATCH_CHUNK_SIZE,
+                    visibility=FRD_RUNNER_VISIBILITY_TIMEOUT,
+                )
+
+            def settle(items: list[str], delivered: bool) -> None:
+                acked = [item for item in items if res_queue.ack(consumer=consumer, item=item)]
+                if acked and not delivered:
+                    # Placed at the consuming end of the queue (i.e., streamed next and in order)
+                    res_queue.requeue(items=acked)
+
+            async def events() -> AsyncIterator[str]:
+                deadline = None if timeout is None else asyncio.get_running_loop().time() + timeout
+                items: list[str] = []
+                try:
+                    # Hands back the results claimed by the streams of crashed servers (i.e., expired leases)
+                    await asyncio.to_thread(res_queue.reap)
+                    while deadline is None or asyncio.get_running_loop().time() < deadline:
+                        if not (items := await asyncio.to_thread(claim)):
+                            await asyncio.sleep(FRD_RUNNER_STREAM_POLL_INTERVAL)
+                            continue
+                        yield "".join(
+                            _stream_event({"queue_slug": queue_slug, "output": _parse_output(item)}, sse=sse)
+                            for item in items
+                        )
+                        # Resumed once the chunk was sent; otherwise, the stream was closed while sending it
+                        await asyncio.to_thread(settle, items, delivered=True)
+                        items = []
+                finally:
+                    if items:
+                        await asyncio.to_thread(settle, items, delivered=False)
+        else:
+            raise ValueError("Either 'request_ids' or 'queue_slug' must be provided.")
+        return StreamingResponse(events(), media_type="text/event-stream" if sse else "application/x-ndjson")
@@ -0,0 +1,127 @@
+import time
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+from fred.settings import logger_manager
+from fred.dao.comp.catalog import FredQueue
+
+logger = logger_manager.get_logger(name=__name__)
+
+
+@dataclass(frozen=False, slots=False)
+class WeightedQueueGroup:
+    """A group of request queues consumed with (smooth) weighted round-robin scheduling.
+    Each fetch picks the next queue according to the weights and falls back to the other
+    queues (in scheduling order) when the picked one is empty; thus, when every queue is
+    saturated, the batches are fetched proportionally to the weights (e.g., interactive
+    traffic keeps its share while batch jobs use the spare capacity), and no capacity is
+    wasted otherwise. The group exposes the subset of the FredQueue interface used by the
+    runner loop; the items are acknowledged against the queue they were fetched from.
+    Attributes:
+        queues: list[FredQueue]: The queues to consume from.
+        weights: list[int]: The (positive) weight of each queue.
+        block_interval: float: Maximum time (in seconds) spent blocked on a single queue while every queue is empty.
+    """
+    queues: list[FredQueue]
+    weights: list[int]
+    block_interval: float = 0.1
+    _current: list[int] = field(default_factory=list, repr=False)
+    # Source queue of the claimed (not yet acknowledged) items, and of the last popped batch
+    _sources: dict[str, list[FredQueue]] = field(default_factory=dict, repr=False)
+    _last: Optional[FredQueue] = field(default=None, repr=False)
+
+    def __post_init__(self):
+        if not self.queues or len(self.queues) != len(self.weights):
+            raise ValueError("The queue group requires one weight per queue (and at least one queue).")
+        if any(weight <= 0 for weight in self.weights):
+            raise ValueError(f"The queue weights must be positive: {self.weights}")
+        self._current = [0 for _ in self.queues]
+
+    @classmethod
+    def from_weights(cls, queue: type[FredQueue], weights: dict[str, int], **kwargs) -> "WeightedQueueGroup":
+        """Creates the group from a mapping of queue names to weights using the (mounted) queue component."""
+        return cls(
+            queues=[queue(name=name, **kwargs) for name in weights],
+            weights=[int(weight) for weight in weights.values()],
+        )
+
+    @property
+    def name(self) -> str:
+        return ",".join(queue.name for queue in self.queues)
+
+    def _schedule(self) -> list[FredQueue]:
+        # Smooth weighted round-robin (i.e., the picks of each queue are evenly interleaved);
+        # the picked queue goes first followed by the others in descending current weight.
+        for index, weight in enumerate(self.weights):
+            self._current[index] += weight
+        order = sorted(range(len(self.queues)), key=lambda index: -self._current[index])
+        self._current[order[0]] -= sum(self.weights)
+        return [self.queues[index] for index in order]
+
+    def _fetch(self, take, timeout: Optional[float] = None) -> tuple[Optional[FredQueue], list[str]]:
+        # Every batch is fetched from a single queue
+        schedule = self._schedule()
+        for queue in schedule:
+            if (items := take(queue, None)):
+                return queue, items
+        if not timeout:
+            return None, []
+        # Every queue is empty; block on each queue for a short interval (in scheduling order) until the timeout
+        deadline = time.monotonic() + timeout
+        while (remaining := deadline - time.monotonic()) > 0:
+            for queue in schedule:
+                if (items := take(queue, min(remaining, self.block_interval))):
+                    return queue, items
+                if (remaining := deadline - time.monotonic()) <= 0:
+                    break
+        return None, []
+
+    def _source(self, item: str) -> FredQueue:
+        if not (sources := self._sources.get(item)):
+            # Items not fetched through the group (e.g., already settled) are handled by the first queue
+            return self.queues[0]
+        queue = sources.pop(0)
+        if not sources:
+            self._sources.pop(item, None)
+        return queue
+
+    def size(self) -> int:
+        return sum(queue.size() for queue in self.queues)
+
+    def add(self, item: str, priority: int = 0) -> None:
+        self.queues[0].add(item, priority=priority)
+
+    def add_many(self, items: Iterable[str], priority: int = 0, chunk_size: int = 1000) -> int:
+        return self.queues[0].add_many(items, priority=priority, chunk_size=chunk_size)
+
+    def pop_many(self, n: int, timeout: Optional[float] = None) -> list[str]:
+        queue, items = self._fetch(lambda queue, wait: queue.pop_many(n=n, timeout=wait), timeout=timeout)
+        if queue is not None:
+            self._last = queue
+        return items
+
+    def claim_many(self, consumer: str, n: int, timeout: Optional[float] = None, visibility: float = 300) -> list[str]:
+        queue, items = self._fetch(
+            lambda queue, wait: queue.claim_many(consumer=consumer, n=n, timeout=wait, visibility=visibility),
+            timeout=timeout,
+        )
+        for item in items:
+            self._sources.setdefault(item, []).append(queue)
+        return items
+
+    def requeue(self, items: list[str]) -> None:
+        # The runner only hands back the unprocessed tail of the last popped batch (i.e., a single source queue)
+        (self._last or self.queues[0]).requeue(items=items)
+
+    def ack(self, consumer: str, item: str) -> bool:
+        return self._source(item).ack(consumer=consumer, item=item)
+
+    def nack(self, consumer: str, item: str, front: bool = False) -> bool:
+        return self._source(item).nack(consumer=consumer, item=item, front=front)
+
+    def touch(self, consumer: str, visibility: float = 300) -> None:
+        for queue in self.queues:
+            queue.touch(consumer=consumer, visibility=visibility)
+
+    def reap(self) -> int:
+        return sum(queue.reap() for queue in self.queues)
@@ -6,6 +6,12 @@ FRD_RUNNER_BACKEND = get_environ_variable(
     default="STDLIB",
 ).upper()
 
+# Queue component used by the runners: 'QUEUE' (lists) or 'STREAM' (Redis Streams with consumer groups)
+FRD_RUNNER_QUEUE_COMPONENT = get_environ_variable(
+    name="FRD_RUNNER_QUEUE_COMPONENT",
+    default="QUEUE",
+).upper()
+
 FRD_RUNNER_REQUEST_QUEUE = get_environ_variable(
     name="FRD_RUNNER_REQUEST_QUEUE",
     default=None,
@@ -15,3 +21,47 @@ FRD_RUNNER_RESPONSE_QUEUE = get_environ_variable(
     name="FRD_RUNNER_RESPONSE_QUEUE",
     default=None,
 )
+
+# Number of request priority levels (i.e., priorities from 0 to 'levels - 1') used by the clients and the runners;
+# producers clamp the priorities into this range to never push requests into a list the runners do not consume
+FRD_RUNNER_PRIORITY_LEVELS = int(get_environ_variable(
+    name="FRD_RUNNER_PRIORITY_LEVELS",
+    default="1",
+))
+
+# Maximum time (in seconds) a runner blocks waiting for new requests before re-checking its lifespan/idle timeout
+FRD_RUNNER_POLL_TIMEOUT = float(get_environ_variable(
+    name="FRD_RUNNER_POLL_TIMEOUT",
+    default="1.0",
+))
+
+# Maximum number of requests fetched from the queue on each poll
+FRD_RUNNER_BATCH_SIZE = int(get_environ_variable(
+    name="FRD_RUNNER_BATCH_SIZE",
+    default="10",
+))
+
+# Lease duration (in seconds) of the requests claimed by reliable runners; the requests claimed by runners
+# that stop renewing their lease (e.g., crashed runners) are handed back into the queue after this timeout
+FRD_RUNNER_VISIBILITY_TIMEOUT = float(get_environ_variable(
+    name="FRD_RUNNER_VISIBILITY_TIMEOUT",
+    default="300",
+))
+
+# Number of requests dispatched per round-trip by the bulk APIs (e.g., 'send_many' and the '/execute_batch' endpoint)
+FRD_RUNNER_DISPATCH_CHUNK_SIZE = int(get_environ_variable(
+    name="FRD_RUNNER_DISPATCH_CHUNK_SIZE",
+    default="1000",
+))
+
+# Default maximum time (in seconds) the '/outputs' endpoint waits; the requests still pending are reported as timed out
+FRD_RUNNER_OUTPUTS_TIMEOUT = float(get_environ_variable(
+    name="FRD_RUNNER_OUTPUTS_TIMEOUT",
+    default="300",
+))
+
+# Polling interval (in seconds) of the response queue streams (e.g., the '/outputs/stream' endpoint given a queue slug)
+FRD_RUNNER_STREAM_POLL_INTERVAL = float(get_environ_variable(
+    name="FRD_RUNNER_STREAM_POLL_INTERVAL",
+    default="0.1",
+))
@@ -0,0 +1,64 @@
+"""Benchmark of the edag scheduler on large plans (inline nodes; i.e., the scheduling overhead only).
+
+Shapes:
+    * chain: a long linear pipeline built with 'Plan.__rshift__' (one node per layer).
+    * wide: a single source fanning out into many independent nodes joined by a sink.
+
+Usage (from the 'fred' directory):
+    PYTHONPATH=src/main python src/test/bench_fred/bench_edag_executor.py --nodes=10000
+"""
+import time
+from functools import reduce
+
+from fred.edag import node
+from fred.edag.comp.catalog import CompCatalog
+from fred.edag.executor import Executor
+
+
+def chain(nodes: int):
+    def step(value: int) -> int:
+        return value + 1
+
+    return reduce(
+        lambda plan, index: plan >> node(step, name=f"step{index}", key="value", inplace=True),
+        range(1, nodes),
+        node(step, name="step0", key="value", inplace=True),
+    )
+
+
+def wide(nodes: int):
+    def source(value: int) -> int:
+        return value
+
+    def branch(value: int) -> int:
+        return value + 1
+
+    def sink(**kwargs) -> int:
+        return len(kwargs)
+
+    branches = CompCatalog.GROUP.ref(nodes=[
+        node(branch, name=f"branch{index}", key=f"branch{index}", inplace=True)
+        for index in range(nodes - 2)
+    ])
+    return node(source, key="value", inplace=True) >> branches >> node(sink, inplace=True)
+
+
+def main(nodes: int = 10_000, unrestricted: bool = False):
+    print(f"{'shape':<8} {'nodes':>8} {'build (s)':>10} {'execute (s)':>12} {'nodes/s':>10}")
+    for shape, expected in ((chain, nodes), (wide, nodes - 2)):
+        start = time.perf_counter()
+        plan = shape(nodes)
+        executor = Executor.from_plan(plan)
+        build = time.perf_counter() - start
+        start = time.perf_counter()
+        result = executor.execute(start_with={"value": 0}, unrestricted=unrestricted)
+        elapsed = time.perf_counter() - start
+        output = result["results"]["step" + str(nodes - 1) if shape is chain else "sink"]
+        assert next(iter(output.values())) == expected
+        print(f"{shape.__name__:<8} {nodes:>8} {build:>10.3f} {elapsed:>12.3f} {nodes / elapsed:>10.0f}")
+
+
+if __name__ == "__main__":
+    import fire
+
+    fire.Fire(main)
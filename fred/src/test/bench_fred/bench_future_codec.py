@@ -0,0 +1,63 @@
+"""Benchmark of the FutureResult wire formats (COMPACT vs. the original DILL codec).
+
+Usage (from the 'fred' directory):
+    PYTHONPATH=src/main python src/test/bench_fred/bench_future_codec.py --rounds=2000
+"""
+import timeit
+from typing import Any
+
+from fred.future.result import FutureDefined, FutureUndefinedInProgress
+from fred.future.codec.catalog import FutureCodecCatalog
+from fred.monad.catalog import EitherMonad
+
+
+def detached(cls: type, **values):
+    # Builds the instance without the '__post_init__' hooks (i.e., without writing into the backend)
+    instance: Any = object.__new__(cls)
+    for name, value in values.items():
+        object.__setattr__(instance, name, value)
+    return instance
+
+
+def samples() -> dict:
+    def defined(name: str, value: EitherMonad.Either, ok: bool = True):
+        return detached(FutureDefined, future_id=f"bench-{name}", parent_id=None, broadcast=False, value=value, ok=ok)
+
+    return {
+        "in_progress": detached(
+            FutureUndefinedInProgress,
+            future_id="bench-in-progress",
+            parent_id=None,
+            broadcast=False,
+            started_at=0.0,
+            function_name="function",
+        ),
+        "small_json": defined("small", EitherMonad.Right(value={"status": "ok", "count": 42})),
+        "large_json": defined(
+            "large",
+            EitherMonad.Right(value=[{"idx": i, "text": f"item-{i:08d}-" * 4} for i in range(5_000)]),
+        ),
+        "large_bytes": defined("bytes", EitherMonad.Right(value=bytes(1_000_000))),
+        "failure": defined("failure", EitherMonad.Left(exception=ValueError("boom")), ok=False),
+    }
+
+
+def main(rounds: int = 1_000):
+    print(f"{'sample':<12} {'codec':<8} {'binary':<7} {'size':>10} {'encode(us)':>11} {'decode(us)':>11}")
+    for name, result in samples().items():
+        for codec in FutureCodecCatalog:
+            for binary in (False, True):
+                payload = codec.encode(result, binary=binary)
+                number = max(1, rounds // (100 if len(payload) > 100_000 else 1))
+                encode = timeit.timeit(lambda: codec.encode(result, binary=binary), number=number)
+                decode = timeit.timeit(lambda: FutureCodecCatalog.decode(payload), number=number)
+                print(
+                    f"{name:<12} {codec.name:<8} {str(binary):<7} {len(payload):>10} "
+                    f"{1e6 * encode / number:>11.1f} {1e6 * decode / number:>11.1f}"
+                )
+
+
+if __name__ == "__main__":
+    import fire
+
+    fire.Fire(main)
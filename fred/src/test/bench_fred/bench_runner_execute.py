@@ -0,0 +1,95 @@
+"""Benchmark of the runner dispatch endpoints: one '/execute' call per item vs. a single '/execute_batch' call.
+
+The requests are sent straight into the ASGI application (i.e., without a network stack); thus,
+the numbers measure the per-request overhead of the framework, the parsing, and the queue writes.
+
+Usage (from the 'fred' directory):
+    PYTHONPATH=src/main python src/test/bench_fred/bench_runner_execute.py --items=10000
+"""
+import json
+import time
+import asyncio
+from typing import Any, MutableMapping, Sequence
+
+from fastapi import FastAPI
+
+from fred.worker.runner.rest.router.catalog import RouterCatalog
+
+
+def application() -> tuple[FastAPI, Any]:
+    router = RouterCatalog.RUNNER.auto(service_name="STDLIB", disable_runner_reuse=True)
+    app = FastAPI()
+    app.include_router(router.router, prefix="/runner")
+    return app, router
+
+
+async def call(app: FastAPI, path: str, query: str = "", chunks: Sequence[bytes] = ()) -> bytes:
+    # Minimal ASGI client; the body is delivered in the given chunks (i.e., a streamed upload)
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.4"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "headers": [(b"content-type", b"application/json")],
+        "client": ("127.0.0.1", 0),
+        "server": ("127.0.0.1", 80),
+    }
+    messages = [
+        {"type": "http.request", "body": chunk, "more_body": index < len(chunks) - 1}
+        for index, chunk in enumerate(chunks or [b""])
+    ]
+    response = []
+
+    async def receive() -> dict:
+        return messages.pop(0) if messages else {"type": "http.disconnect"}
+
+    async def send(message: MutableMapping[str, Any]) -> None:
+        if message["type"] == "http.response.body":
+            response.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return b"".join(response)
+
+
+async def run(items: int, chunk_size: int, body_chunk_size: int) -> None:
+    app, router = application()
+    queue = router.runner_backend.queue("req:bench")
+    payloads = [{"value": index, "text": f"item-{index:08d}"} for index in range(items)]
+
+    queue.clear()
+    start = time.perf_counter()
+    for payload in payloads:
+        await call(app, "/runner/execute", chunks=[json.dumps({"queue_slug": "bench", **payload}).encode()])
+    single = time.perf_counter() - start
+    assert queue.size() == items
+
+    queue.clear()
+    body = "".join(json.dumps(payload) + "\n" for payload in payloads).encode()
+    start = time.perf_counter()
+    output = await call(
+        app,
+        "/runner/execute_batch",
+        query=f"queue_slug=bench&chunk_size={chunk_size}",
+        chunks=[body[i:i + body_chunk_size] for i in range(0, len(body), body_chunk_size)],
+    )
+    batch = time.perf_counter() - start
+    assert queue.size() == items and len(output.splitlines()) == items
+    queue.clear()
+
+    print(f"{'endpoint':<15} {'items':>8} {'seconds':>9} {'items/s':>10}")
+    print(f"{'/execute':<15} {items:>8} {single:>9.3f} {items / single:>10.0f}")
+    print(f"{'/execute_batch':<15} {items:>8} {batch:>9.3f} {items / batch:>10.0f}")
+
+
+def main(items: int = 10_000, chunk_size: int = 1_000, body_chunk_size: int = 65_536):
+    asyncio.run(run(items=items, chunk_size=chunk_size, body_chunk_size=body_chunk_size))
+
+
+if __name__ == "__main__":
+    import fire
+
+    fire.Fire(main)
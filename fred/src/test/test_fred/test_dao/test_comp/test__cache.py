@@ -0,0 +1,73 @@
+import time
+
+from fred.dao.comp._cache import FredKeyValCache
+from fred.dao.service.catalog import ServiceCatalog
+
+
+def test_keyval_cache_lru_ttl_and_metrics():
+    cache = FredKeyValCache(maxsize=2, ttl=0.2, cacheable=lambda key, value: not key.startswith("skip"))
+    assert cache.store("a", "1") and cache.store("b", "2")
+    assert not cache.store("skip:c", "3") and not cache.store("d", None)
+    assert cache.lookup("a") == (True, "1")
+    # The least recently used entry is evicted first
+    cache.store("e", "5")
+    assert cache.lookup("b") == (False, None)
+    assert cache.lookup("a") == (True, "1")
+    # Records are merged; partially cached records are a miss
+    cache.merge("r", {"status": "DEFINED", "obj": None})
+    assert cache.lookup("r", fields=("status", "obj")) == (False, None)
+    cache.merge("r", {"obj": "payload"})
+    assert cache.lookup("r", fields=("status", "obj")) == (True, {"status": "DEFINED", "obj": "payload"})
+    time.sleep(0.25)
+    assert cache.lookup("a") == (False, None)
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"], stats["expirations"]) == (3, 3, 2, 1)
+
+
+def test_keyval_with_cache_read_through_and_invalidation():
+    keyval = ServiceCatalog.STDLIB.component_catalog().KEYVAL.value
+    cached = keyval.with_cache(maxsize=100, ttl=None, invalidation_channel="test:cache:invalidate")
+    other = keyval.with_cache(maxsize=100, ttl=None, invalidation_channel="test:cache:invalidate")
+    memstore = keyval._srv.client._memstore_keyval
+    cached(key="test:cache:a").set("1")
+    assert cached(key="test:cache:a").get() == "1"
+    assert other.mget(["test:cache:a", "test:cache:missing"]) == ["1", None]
+    # Reads are served from the cache (i.e., direct backend changes are not observed)...
+    memstore["test:cache:a"] = "stale"
+    assert cached(key="test:cache:a").get() == "1"
+    assert cached._cache.stats()["hits"] == 1
+    # ... until a write through any cached component invalidates the key (locally or via pub/sub)
+    cached(key="test:cache:a").set("2")
+    assert cached(key="test:cache:a").get() == "2"
+    deadline = time.monotonic() + 5
+    while other.mget(["test:cache:a"]) != ["2"] and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert other.mget(["test:cache:a"]) == ["2"]
+    cached(key="test:cache:h").hset(mapping={"status": "DEFINED", "obj": "x"})
+    assert cached(key="test:cache:h").hmget("status", "obj") == ["DEFINED", "x"]
+    assert cached.hmget_many(["test:cache:h"], "status") == [["DEFINED"]]
+    assert keyval._cache is None
+
+
+def test_keyval_cache_invalidation_overflow(monkeypatch):
+    from fred.dao.comp import _pubsub
+
+    keyval = ServiceCatalog.STDLIB.component_catalog().KEYVAL.value
+    cached = keyval.with_cache(maxsize=100, ttl=None, invalidation_channel="test:cache:overflow")
+    monkeypatch.setattr(_pubsub, "FRD_PUBSUB_BUFFER_SIZE", 2)
+    other = keyval.with_cache(maxsize=100, ttl=None, invalidation_channel="test:cache:overflow")
+    cached(key="test:cache:overflow").set("1")
+    assert other(key="test:cache:overflow").get() == "1"
+    # More invalidations than the buffer holds; the dropped ones could concern any cached key
+    for index in range(5):
+        cached(key=f"test:cache:overflow:{index}").set(str(index))
+    deadline = time.monotonic() + 5
+    while not other._cache._subscription.dropped and time.monotonic() < deadline:
+        time.sleep(0.01)
+    keyval._srv.client._memstore_keyval["test:cache:overflow"] = "2"
+    assert other(key="test:cache:overflow").get() == "2"
+    # Closing the caches drops their subscriptions
+    for component in (cached, other):
+        subscription = component._cache._subscription
+        component._cache.close()
+        assert subscription.closed and component._cache.stats()["size"] == 0
@@ -17,3 +17,28 @@ def test__get_minio_elements_from_key():
     bucket, obj = _get_minio_elements_from_key("/mybucket/myobject/with/slashes")
     assert bucket == "mybucket"
     assert obj == "myobject/with/slashes"
+
+
+def test_keyval_set_many_stdlib():
+    from fred.dao.service.catalog import ServiceCatalog
+
+    keyval = ServiceCatalog.STDLIB.component_catalog().KEYVAL.value
+    keyval.set_many(mapping={"test:set_many:a": "1", "test:set_many:b": "2"})
+    assert keyval(key="test:set_many:a").get() == "1"
+    assert keyval(key="test:set_many:b").get() == "2"
+
+
+def test_keyval_expire_stdlib():
+    import time
+    from fred.dao.service.catalog import ServiceCatalog
+
+    keyval = ServiceCatalog.STDLIB.component_catalog().KEYVAL.value
+    keyval(key="test:expire:a").set(value="1", expire=1)
+    keyval.set_many(mapping={"test:expire:b": "2"}, expire=1)
+    keyval(key="test:expire:c").hset(mapping={"field": "3"}, expire=1)
+    keyval(key="test:expire:c").hset(mapping={"other": "4"})
+    assert all(0 < keyval(key=f"test:expire:{name}").ttl() <= 1 for name in "abc")
+    assert keyval.stats()["volatile"] >= 3
+    time.sleep(1.1)
+    assert keyval.mget(["test:expire:a", "test:expire:b"]) == [None, None]
+    assert keyval(key="test:expire:c").hgetall() == {}
@@ -0,0 +1,108 @@
+import threading
+import time
+
+from fred.dao.service.catalog import ServiceCatalog
+from fred.dao.service._stdlib_broker import StdLibBroker, StdLibOverflowPolicy
+
+
+def test_pubsub_stdlib_fan_out():
+    pubsub = ServiceCatalog.STDLIB.component_catalog().PUBSUB.value
+    channel = pubsub(name="test:pubsub:fan-out")
+    subscriptions = [channel.subscription(subscription_id=f"test-sub-{i}") for i in range(2)]
+    assert all(subscription.wait_ready(timeout=5) for subscription in subscriptions)
+    # Every subscription shares the same (multiplexed) connection
+    assert len({id(subscription.multiplexer) for subscription in subscriptions}) == 1
+    assert set(pubsub.subscribers()) >= {"test-sub-0", "test-sub-1"}
+    assert channel.publish(item="hello") == 1
+    assert [subscription.get(timeout=5)["data"] for subscription in subscriptions] == ["hello", "hello"]
+    for subscription in subscriptions:
+        pubsub.unsubscribe(subscription_id=subscription.subscription_id)
+    assert "test-sub-0" not in pubsub.subscribers()
+    assert "test:pubsub:fan-out" not in channel.multiplexer().channels()
+
+
+def test_pubsub_stdlib_subscribe_generator():
+    channel = ServiceCatalog.STDLIB.component_catalog().PUBSUB.value(name="test:pubsub:generator")
+    received = []
+
+    def consume():
+        for message in channel.subscribe(subscription_id="test-sub-generator"):
+            received.append(message["data"])
+            break
+
+    thread = threading.Thread(target=consume)
+    thread.start()
+    while "test:pubsub:generator" not in channel.multiplexer().channels():
+        pass
+    channel.multiplexer()._ready_event(channel="test:pubsub:generator").wait(timeout=5)
+    channel.publish(item="hello")
+    thread.join(timeout=5)
+    assert received == ["hello"]
+    # The subscription is released once the consumer stops iterating
+    assert "test-sub-generator" not in channel.subscribers()
+    # The UNSUBSCRIBE command is sent by the listener thread (i.e., shortly after)
+    deadline = time.monotonic() + 5
+    while channel.publish(item="nobody") and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert channel.publish(item="nobody") == 0
+
+
+def test_pubsub_stdlib_overflow_policies():
+    broker = StdLibBroker()
+    oldest = broker.pubsub(maxsize=2, policy=StdLibOverflowPolicy.DROP_OLDEST)
+    newest = broker.pubsub(maxsize=2, policy=StdLibOverflowPolicy.DROP_NEWEST)
+    blocking = broker.pubsub(maxsize=2, policy=StdLibOverflowPolicy.BLOCK, block_timeout=0.05)
+    for subscription in (oldest, newest, blocking):
+        subscription.subscribe("channel")
+    for item in ["a", "b", "c"]:
+        broker.publish("channel", item)
+    # The 'subscribe' confirmation takes a slot of the buffer as well
+    assert [oldest.get_message()["data"] for _ in range(2)] == ["b", "c"]
+    assert newest.get_message()["type"] == "subscribe"
+    assert [newest.get_message()["data"], newest.get_message()] == ["a", None]
+    assert blocking.dropped == 2
+    # A blocked publisher resumes as soon as the subscriber catches up
+    threading.Timer(0.01, blocking.get_message).start()
+    blocking.block_timeout = 5
+    assert broker.publish("channel", "d") == 3
+    assert broker.stats()["subscribers"] == 3
+
+
+def test_pubsub_redis_multiplexer_single_thread(monkeypatch):
+    import asyncio
+    import pytest
+    from fred.dao.comp.catalog import CompCatalog
+    from fred.dao.service._redis import RedisService
+
+    fakeredis = pytest.importorskip("fakeredis")
+    service = RedisService()
+    monkeypatch.setattr(service, "instance", fakeredis.FakeRedis(decode_responses=True), raising=False)
+    channel = CompCatalog.PUBSUB.mount(srv_ref=service)(name="test:pubsub:redis")
+    callers = set()
+    connect = service.client.pubsub
+
+    def recorded(method):
+        def wrapper(*args, **kwargs):
+            callers.add(threading.current_thread().name)
+            return method(*args, **kwargs)
+        return wrapper
+
+    def pubsub(**kwargs):
+        connection = connect(**kwargs)
+        for command in ("subscribe", "unsubscribe", "get_message"):
+            setattr(connection, command, recorded(getattr(connection, command)))
+        return connection
+
+    monkeypatch.setattr(service.client, "pubsub", pubsub)
+
+    async def receive() -> str:
+        subscription = channel.subscription(loop=asyncio.get_running_loop())
+        assert await subscription.await_ready(timeout=5)
+        channel.publish(item="hello")
+        message = await anext(subscription.alisten(timeout=5))
+        return message["data"]
+
+    assert asyncio.run(receive()) == "hello"
+    # The shared (not thread-safe) connection is only used by the listener thread
+    assert callers == {"frd-pubsub-multiplexer"}
+    channel.multiplexer().close()
@@ -0,0 +1,94 @@
+import threading
+import time
+
+from fred.dao.service.catalog import ServiceCatalog
+
+
+def get_queue(name: str, levels: int = 1):
+    return ServiceCatalog.STDLIB.component_catalog().QUEUE.value(name=name, levels=levels)
+
+
+def test_queue_blocking_pop():
+    queue = get_queue("test:queue:blocking")
+    start = time.perf_counter()
+    assert queue.pop(timeout=0.1) is None
+    assert time.perf_counter() - start >= 0.1
+    threading.Timer(0.05, lambda: queue.add("item")).start()
+    assert queue.pop(timeout=5) == "item"
+
+
+def test_queue_pop_many_and_requeue():
+    queue = get_queue("test:queue:batch")
+    for i in range(5):
+        queue.add(str(i))
+    assert queue.pop_many(n=3, timeout=1) == ["0", "1", "2"]
+    queue.requeue(items=["1", "2"])
+    assert queue.pop_many(n=10) == ["1", "2", "3", "4"]
+    assert queue.pop_many(n=10) == []
+
+
+def test_queue_reliable_consumption():
+    queue = get_queue("test:queue:reliable")
+    for i in range(3):
+        queue.add(str(i))
+    assert queue.claim_many(consumer="alive", n=2, timeout=1) == ["0", "1"]
+    assert queue.processing(consumer="alive") == ["0", "1"]
+    assert queue.ack(consumer="alive", item="0")
+    assert not queue.ack(consumer="alive", item="0")
+    assert queue.nack(consumer="alive", item="1", front=True)
+    assert queue.processing(consumer="alive") == []
+    # A consumer with an expired lease (e.g., crashed) gets its claimed items handed back
+    assert queue.claim_many(consumer="crashed", n=2, visibility=0) == ["1", "2"]
+    assert queue.claim(consumer="alive", visibility=60) is None
+    assert queue.reap() == 2
+    assert queue.processing(consumer="crashed") == []
+    assert queue.pop_many(n=10) == ["1", "2"]
+
+
+def test_queue_priorities():
+    queue = get_queue("test:queue:priorities", levels=3)
+    for item, priority in [("low-0", 0), ("high-0", 2), ("mid-0", 1), ("high-1", 2), ("low-1", 0)]:
+        queue.add(item, priority=priority)
+    assert queue.pop(timeout=1) == "high-0"
+    assert queue.pop_many(n=2) == ["high-1", "mid-0"]
+    # Requeued items precede every priority level
+    queue.requeue(items=["high-1", "mid-0"])
+    queue.add("high-2", priority=2)
+    assert queue.pop_many(n=10) == ["high-1", "mid-0", "high-2", "low-0", "low-1"]
+
+
+def test_queue_add_many():
+    queue = get_queue("test:queue:add_many", levels=2)
+    assert queue.add_many((str(i) for i in range(5)), chunk_size=2) == 5
+    queue.add("urgent", priority=1)
+    assert queue.pop_many(n=10) == ["urgent", "0", "1", "2", "3", "4"]
+
+
+def test_queue_priority_out_of_levels():
+    queue = get_queue("test:queue:levels", levels=2)
+    queue.add("low", priority=-1)
+    queue.add("mid", priority=1)
+    # Clamped into the highest level (i.e., never pushed into a level the consumers do not read)
+    queue.add_many(["high"], priority=5)
+    assert queue.size() == 3
+    assert queue.pop_many(n=10) == ["mid", "high", "low"]
+
+
+def test_queue_claim_many_redis(monkeypatch):
+    import pytest
+    from fred.dao.comp.catalog import CompCatalog
+    from fred.dao.service._redis import RedisService
+
+    fakeredis = pytest.importorskip("fakeredis")
+    service = RedisService()
+    monkeypatch.setattr(service, "instance", fakeredis.FakeRedis(decode_responses=True), raising=False)
+    queue = CompCatalog.QUEUE.mount(srv_ref=service)(name="test:queue:redis", levels=2)
+    for item, priority in [("low-0", 0), ("high-0", 1), ("low-1", 0)]:
+        queue.add(item, priority=priority)
+    assert queue.claim_many(consumer="alive", n=2, timeout=1) == ["high-0", "low-0"]
+    assert queue.claim_many(consumer="alive", n=5) == ["low-1"]
+    assert queue.claim_many(consumer="alive", n=5) == []
+    assert queue.processing(consumer="alive") == ["high-0", "low-0", "low-1"]
+    threading.Timer(0.05, lambda: queue.add("late", priority=1)).start()
+    assert queue.claim_many(consumer="alive", n=5, timeout=5) == ["late"]
+    assert queue.ack(consumer="alive", item="late")
@@ -0,0 +1,58 @@
+from fred.dao.comp.catalog import CompCatalog
+from fred.dao.comp._stream import FredStreamQueue
+from fred.worker.runner.backend import RunnerBackend
+
+
+def test_stream_queue_stdlib_fallback():
+    backend = RunnerBackend.auto(service_name="STDLIB", queue_component="STREAM")
+    queue = backend.queue(name="test:stream:fallback")
+    assert isinstance(queue, FredStreamQueue)
+    for i in range(3):
+        queue.add(str(i))
+    assert queue.size() == 3
+    assert queue.claim_many(consumer="consumer", n=2) == ["0", "1"]
+    assert queue.ack(consumer="consumer", item="0")
+    assert queue.pop_many(n=10) == ["2"]
+
+
+def test_stream_queue_catalog_entry():
+    assert CompCatalog.STREAM.value is FredStreamQueue
+    assert issubclass(CompCatalog.STREAM.value, CompCatalog.QUEUE.value)
+
+
+def test_stream_queue_redis(monkeypatch):
+    import pytest
+    from fred.dao.service._redis import RedisService
+
+    fakeredis = pytest.importorskip("fakeredis")
+    service = RedisService()
+    monkeypatch.setattr(service, "instance", fakeredis.FakeRedis(decode_responses=True), raising=False)
+    stream = CompCatalog.STREAM.mount(srv_ref=service)
+    queue = stream(name="test:stream:redis")
+    assert queue.add_many(["a", "b", "c", "a"]) == 4
+    assert queue.claim_many(consumer="consumer", n=2) == ["a", "b"]
+    assert (queue.size(), queue.pending()) == (2, 2)
+    assert queue.processing(consumer="consumer") == ["a", "b"]
+    # Acknowledged by value from another instance; the claimed entry IDs are shared within the process
+    assert stream(name="test:stream:redis").ack(consumer="consumer", item="b")
+    assert not queue.ack(consumer="consumer", item="b")
+    assert queue.processing(consumer="consumer") == ["a"]
+    # Stuck entries are taken over by the other consumers after the visibility timeout
+    assert queue.claim_many(consumer="other", n=10, visibility=0) == ["a"]
+    assert not queue.ack(consumer="consumer", item="a")
+    assert [info["pending"] for info in queue.consumers()] == [0, 1]
+    # Items claimed by another process (e.g., before a restart) are looked up in the stream itself
+    monkeypatch.setattr(FredStreamQueue, "_claimed", {})
+    queue.touch(consumer="other")
+    assert queue.ack(consumer="other", item="a")
+    assert queue.pending() == 0
+    # Lag without the 'lag' field (i.e., Redis < 7): the acknowledged entries are not part of the backlog
+    groups = service.client.xinfo_groups
+    monkeypatch.setattr(
+        service.client,
+        "xinfo_groups",
+        lambda name: [{key: value for key, value in group.items() if key != "lag"} for group in groups(name)],
+    )
+    assert queue.lag() == 2
+    assert queue.pop_many(n=10) == ["c", "a"]
+    assert (queue.lag(), queue.pending()) == (0, 0)
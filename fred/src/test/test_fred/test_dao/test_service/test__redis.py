@@ -0,0 +1,21 @@
+import asyncio
+
+from fred.dao.service._redis import AsyncRedisConnectionPool, RedisService
+
+
+def test_async_pools_per_event_loop():
+    service = RedisService(host="localhost", port=6379)
+
+    async def pool():
+        loop = asyncio.get_running_loop()
+        client = service.aclient
+        # The pool is reused within the same event loop
+        assert service.aclient.connection_pool is client.connection_pool
+        return loop, client.connection_pool
+
+    first_loop, first = asyncio.run(pool())
+    second_loop, second = asyncio.run(pool())
+    # Pools are never shared across event loops; the ones of closed loops are dropped
+    assert first is not second
+    assert first_loop not in AsyncRedisConnectionPool.loop_registry
+    assert second_loop in AsyncRedisConnectionPool.loop_registry
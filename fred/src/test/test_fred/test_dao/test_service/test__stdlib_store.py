@@ -0,0 +1,53 @@
+import time
+
+from fred.dao.service._stdlib_store import StdLibEvictionPolicy, StdLibKeyValStore
+
+
+def test_stdlib_store_expiration():
+    store = StdLibKeyValStore()
+    store.set("a", "1", expire=0.05)
+    store["b"] = "2"
+    assert store.get("a") == "1" and 0 < store.ttl("a") <= 0.05
+    assert store.ttl("b") is None
+    time.sleep(0.1)
+    # Lazy expiration on access
+    assert "a" not in store and store.get("a") is None
+    # Background sweeping (i.e., without accessing the key)
+    store.set("c", "3", expire=0.05)
+    time.sleep(0.2)
+    assert len(store) == 1 and list(store) == ["b"]
+    assert store.stats()["expired"] == 2
+    # Setting a value clears the previous expiration unless 'keepttl'
+    store.set("d", "4", expire=10)
+    store.set("d", "5", keepttl=True)
+    assert store.ttl("d") is not None
+    store["d"] = "6"
+    assert store.ttl("d") is None
+
+
+def test_stdlib_store_eviction(caplog):
+    store = StdLibKeyValStore(maxsize=3, policy=StdLibEvictionPolicy.VOLATILE_LRU)
+    store["persistent"] = []
+    for key in ["a", "b", "c"]:
+        store.set(key, key, expire=60)
+    # Keys without expiration are never evicted under the 'VOLATILE_LRU' policy
+    assert "persistent" in store and "a" not in store
+    store.get("b")
+    store.set("d", "d", expire=60)
+    assert sorted(store) == ["b", "d", "persistent"]
+    # Only the persistent keys are left (i.e., nothing to evict); the store warns once and grows
+    store.clear()
+    with caplog.at_level("WARNING"):
+        for key in ["e", "f", "g", "h", "i"]:
+            store[key] = key
+    assert len(store) == 5 and len(caplog.records) == 1
+    store.set("j", "j", expire=60)
+    assert "j" not in store and len(store) == 5
+
+    store = StdLibKeyValStore(maxsize=2, policy=StdLibEvictionPolicy.ALLKEYS_LRU)
+    store["a"], store["b"] = "1", "2"
+    store.get("a")
+    store["c"] = "3"
+    assert sorted(store) == ["a", "c"]
+    stats = store.stats()
+    assert stats["keys"] == 2 and stats["evicted"] == 1 and stats["memory_bytes"] > 0
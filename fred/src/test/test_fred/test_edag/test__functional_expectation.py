@@ -1,5 +1,6 @@
 from fred.edag import node
 from fred.edag.executor import Executor
+from fred.edag.plan import Plan
 
 
 def test_linear_dag_2n():
@@ -118,3 +119,106 @@ def test_linear_dag_with_iterator_mode():
     edag = Executor.from_plan(plan)
     result = edag.execute(start_with={"n": 3})
     assert result["results"]["addall"]["addall"] == 12
+
+
+def test_parallel_fan_out():
+    import time
+
+    @node
+    def source(start: int) -> int:
+        return start
+
+    def delayed(name: str, seconds: float):
+        def function(**kwargs) -> float:
+            time.sleep(seconds)
+            return seconds
+        return node(function, name=name)
+
+    slow = delayed("slow", 0.6)
+    fast0, fast1, fast2 = (delayed(f"fast{i}", 0.2) for i in range(3))
+    # Independent branches: the fast chain must not wait for the slow node to complete (i.e., per-node scheduling)
+    edag = Executor(predmap={source: set(), slow: {source}, fast0: {source}, fast1: {fast0}, fast2: {fast1}})
+    start = time.perf_counter()
+    result = edag.execute(start_with={"start": 1})
+    assert time.perf_counter() - start < 0.9
+    assert set(result["results"]) == {"source", "slow", "fast0", "fast1", "fast2"}
+    # Bounded parallelism: the nodes run one at a time
+    start = time.perf_counter()
+    edag.execute(start_with={"start": 1}, max_parallelism=1)
+    assert time.perf_counter() - start >= 1.2
+
+
+def test_iterator_mode_fan_out():
+    from fred.edag.fanout import FanOut
+    from fred.edag.policy import ExecutionPolicy
+
+    @node(inplace=True)
+    def elements(n: int):
+        # Generators are streamed into the map stage (i.e., not materialized upfront)
+        return (val for val in range(n))
+
+    @node
+    def incr(val: int, step: int = 1) -> int:
+        return val + step
+
+    plan = elements[...] >> incr.with_params(step=2)
+    edag = Executor.from_plan(plan)
+    for policy in (ExecutionPolicy.INLINE, ExecutionPolicy.THREAD):
+        result = edag.execute(start_with={"n": 10}, fanout=FanOut(policy=policy, parallelism=3, chunk_size=4))
+        assert result["results"]["incr"]["incr"] == [val + 2 for val in range(10)]
+    # Empty iterators produce an empty output (i.e., the node is not executed without items)
+    result = edag.execute(start_with={"n": 0})
+    assert result["results"]["incr"]["incr"] == []
+
+    @node(inplace=True, name="elements")
+    def nothing(n: int):
+        return None
+
+    result = Executor.from_plan(nothing[...] >> incr).execute(start_with={"n": 10})
+    assert result["results"]["incr"]["incr"] == []
+
+
+def test_iterator_mode_threaded_producer():
+    import pytest
+
+    @node
+    def elements(n: int):
+        return [val for val in range(n)]
+
+    @node(name="elements")
+    def generate(n: int):
+        return (val for val in range(n))
+
+    @node
+    def incr(val: int) -> int:
+        return val + 1
+
+    result = Executor.from_plan(elements[...] >> incr).execute(start_with={"n": 3})
+    assert result["results"]["incr"]["incr"] == [1, 2, 3]
+    # Generators are only streamed from inplace producers; the Future cannot persist them
+    with pytest.raises(RuntimeError):
+        Executor.from_plan(generate[...] >> incr).execute(start_with={"n": 3})
+
+
+def test_process_policy_shared_memory():
+    import base64
+    from fred.edag.transport import FRD_EDAG_SHARED_MEMORY_THRESHOLD
+
+    # Inputs and outputs above the threshold are transported through shared memory
+    data = bytes(range(256)) * (FRD_EDAG_SHARED_MEMORY_THRESHOLD // 128)
+    encode = node(base64.b64encode, name="encode", key="s", policy="process")
+    plan = encode >> node(base64.b64decode, name="decode", policy="process")
+    result = Executor.from_plan(plan).execute(start_with={"s": data})
+    assert result["results"]["encode"]["s"] == base64.b64encode(data)
+    assert result["results"]["decode"]["decode"] == data
+
+
+@node(policy="process")
+def scaled_square(value: int, scale: int = 3) -> int:
+    # Decorated at module level: the module attribute is the node itself (i.e., not the function)
+    return scale * value ** 2
+
+
+def test_process_policy_decorated_node():
+    result = Executor.from_plan(Plan.as_plan(scaled_square)).execute(start_with={"value": 4})
+    assert result["results"]["scaled_square"]["scaled_square"] == 48
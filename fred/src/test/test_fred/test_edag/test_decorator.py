@@ -35,3 +35,18 @@ def test_node_decorator_default():
     assert isinstance(sample_function, CompCatalog.NODE.ref)
     assert sample_function.name == "sample_function"
     assert sample_function.inplace().execute(z=10) == 7
+
+
+def test_node_decorator_policy():
+    from fred.edag.policy import ExecutionPolicy
+
+    @NodeDecorator(policy="process")
+    def sample_function(z: int) -> int:
+        return z - 3
+
+    assert sample_function.policy == ExecutionPolicy.PROCESS
+    assert sample_function.clone(policy=ExecutionPolicy.THREAD).policy == ExecutionPolicy.THREAD
+    assert sample_function.with_alias("alias").policy == ExecutionPolicy.PROCESS
+    # Requesting inplace execution drops the explicit policy
+    assert sample_function.inplace().policy == ExecutionPolicy.INLINE
+    assert sample_function.inplace().execute(z=10) == 7
@@ -0,0 +1,61 @@
+import time
+import random
+
+from fred.edag.fanout import FanOut
+from fred.edag.policy import ExecutionPolicy
+
+
+def test_fanout_ordered_and_bounded():
+    consumed = []
+
+    def items():
+        for item in range(20):
+            consumed.append(item)
+            yield item
+
+    def square(item: int) -> int:
+        time.sleep(random.random() / 100)
+        return item * item
+
+    fanout = FanOut(policy=ExecutionPolicy.THREAD, parallelism=2, chunk_size=3)
+    results = fanout.map(function=square, items=items())
+    # The input is consumed lazily: at most 'parallelism' chunks are in flight
+    assert next(results) == 0
+    assert len(consumed) <= 3 * 3
+    assert [0, *results] == [item * item for item in range(20)]
+    assert list(FanOut(policy=ExecutionPolicy.INLINE).map(function=square, items=range(5))) == [0, 1, 4, 9, 16]
+    # Non-positive parallelism values run one chunk at a time
+    assert list(FanOut(policy=ExecutionPolicy.THREAD, parallelism=0).map(function=square, items=range(3))) == [0, 1, 4]
+
+
+def test_fanout_process_pool():
+    fanout = FanOut(policy=ExecutionPolicy.PROCESS, parallelism=4, chunk_size=10)
+    assert list(fanout.map(function=abs, items=range(0, -100, -1))) == list(range(100))
+
+
+def test_fanout_failure():
+    def fail(item: int) -> int:
+        if item == 5:
+            raise ValueError("item")
+        return item
+
+    try:
+        list(FanOut(policy=ExecutionPolicy.THREAD, parallelism=4).map(function=fail, items=range(10)))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("The item failure must be raised.")
+
+
+def test_process_pool_replaced_when_broken():
+    import os
+    from concurrent.futures.process import BrokenProcessPool
+
+    # A worker exiting abruptly (e.g., killed by the OOM killer) breaks the whole pool
+    try:
+        ExecutionPolicy.PROCESS.submit(os._exit, 1).result(timeout=30)
+    except BrokenProcessPool:
+        pass
+    else:
+        raise AssertionError("The abrupt worker exit must break the pool.")
+    assert ExecutionPolicy.PROCESS.submit(abs, -3).result(timeout=30) == 3
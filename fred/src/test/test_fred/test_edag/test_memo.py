@@ -0,0 +1,72 @@
+import time
+
+from fred.edag import node
+from fred.edag.executor import Executor
+from fred.edag.memo import NodeMemo, digest
+from fred.edag.plan import Plan
+
+
+def test_digest_stable():
+    assert digest({"a": 1, "b": [1, 2.0, None]}) == digest({"b": [1, 2.0, None], "a": 1})
+    assert digest({1, 2, 3}) == digest({3, 2, 1})
+    assert digest((1, 2)) != digest([1, 2])
+
+    def factory(step: int):
+        return lambda value: value + step
+
+    # Closures over different values are different functions
+    assert digest(factory(1)) == digest(factory(1))
+    assert digest(factory(1)) != digest(factory(2))
+
+
+def test_memoized_nodes():
+    calls = []
+
+    @node(memoize=True, memoize_ttl=0.2)
+    def square(value: int) -> int:
+        calls.append(value)
+        return value * value
+
+    @node(inplace=True)
+    def incr(square: int) -> int:
+        return square + 1
+
+    edag = Executor.from_plan(square >> incr.memoize())
+    memo = NodeMemo.auto(backend="MEMORY")
+    result = edag.execute(start_with={"value": 3}, memo=memo)
+    assert result["results"]["incr"]["incr"] == 10
+    assert result["memo"] == {"hits": 0, "misses": 2, "cached": []}
+    result = edag.execute(start_with={"value": 3}, memo=memo)
+    assert result["results"]["incr"]["incr"] == 10
+    assert result["memo"] == {"hits": 2, "misses": 0, "cached": ["square", "incr"]}
+    assert calls == [3]
+    # Different inputs are different entries
+    assert edag.execute(start_with={"value": 4}, memo=memo)["memo"]["misses"] == 2
+    # Expired entries are computed again (per-node time-to-live)
+    time.sleep(0.3)
+    result = edag.execute(start_with={"value": 3}, memo=memo)
+    assert result["memo"]["cached"] == ["incr"]
+    assert calls == [3, 4, 3]
+
+
+def test_memoized_nodes_keyval():
+
+    @node(inplace=True, memoize=True)
+    def nothing(value: int) -> None:
+        return None
+
+    edag = Executor.from_plan(Plan.as_plan(nothing))
+    memo = NodeMemo.auto(backend="STDLIB", prefix="test:memo")
+    assert edag.execute(start_with={"value": 1}, memo=memo)["memo"]["misses"] == 1
+    result = edag.execute(start_with={"value": 1}, memo=memo)
+    assert result["memo"]["hits"] == 1 and result["results"]["nothing"]["nothing"] is None
+
+
+def test_memoized_results_are_copies():
+    memo = NodeMemo.auto(backend="MEMORY")
+    memo.store(key="test:memo:copy", value={"items": [1, 2]})
+    _, value = memo.lookup(key="test:memo:copy")
+    # Mutating a hit (e.g., a successor node updating its input in place) never alters the cached result
+    value["items"].append(3)
+    assert memo.lookup(key="test:memo:copy") == (True, {"items": [1, 2]})
+    assert memo.lookup(key="test:memo:copy")[1] is not memo.lookup(key="test:memo:copy")[1]
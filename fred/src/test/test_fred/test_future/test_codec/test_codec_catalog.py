@@ -0,0 +1,50 @@
+from fred.future.result import FutureResult, FutureDefined, FutureUndefinedInProgress
+from fred.future.codec.catalog import FutureCodecCatalog
+from fred.future.codec._compact import is_json_native
+from fred.monad.catalog import EitherMonad
+
+
+def test_compact_codec_json_fast_path():
+    value = EitherMonad.Right(value={"a": [1, 2.5, None]})
+    result = FutureDefined(future_id="codec-json", parent_id=None, broadcast=False, value=value, ok=True)
+    for binary in (False, True):
+        payload = FutureCodecCatalog.COMPACT.encode(result, binary=binary)
+        # JSON-native values do not require the pickled section
+        assert (b"\n" if binary else "\n") not in payload
+        decoded = FutureResult.from_string(payload)
+        assert isinstance(decoded, FutureDefined)
+        assert decoded.value.resolve() == {"a": [1, 2.5, None]}
+        assert decoded.ok and decoded.future_id == "codec-json"
+
+
+def test_compact_codec_pickled_section():
+    value = EitherMonad.Left(exception=ValueError("boom"))
+    result = FutureDefined(future_id="codec-exc", parent_id="parent", broadcast=False, value=value, ok=False)
+    for binary in (False, True):
+        decoded = FutureResult.from_string(FutureCodecCatalog.COMPACT.encode(result, binary=binary))
+        match decoded.value:
+            case EitherMonad.Left(exception=exception):
+                assert isinstance(exception, ValueError) and str(exception) == "boom"
+            case other:
+                raise AssertionError(f"Expected a Left value: {other}")
+        assert decoded.parent_id == "parent"
+
+
+def test_codec_reads_legacy_dill_payloads():
+    result = FutureUndefinedInProgress(
+        future_id="codec-legacy",
+        parent_id=None,
+        broadcast=False,
+        started_at=1.0,
+        function_name="fn",
+    )
+    for binary in (False, True):
+        decoded = FutureResult.from_string(FutureCodecCatalog.DILL.encode(result, binary=binary))
+        assert isinstance(decoded, FutureUndefinedInProgress)
+        assert decoded.function_name == "fn"
+
+
+def test_is_json_native():
+    assert is_json_native({"a": [1, "b", True, None]})
+    assert not is_json_native((1, 2))
+    assert not is_json_native({1: "a"})
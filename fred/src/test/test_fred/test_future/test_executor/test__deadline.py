@@ -0,0 +1,25 @@
+import threading
+
+from fred.future.executor._deadline import DeadlineScheduler
+
+
+def test_deadline_scheduler_runs_in_deadline_order():
+    scheduler = DeadlineScheduler(thread_name="frd-deadlines-test")
+    done = threading.Event()
+    calls = []
+    scheduler.call_later(0.2, lambda: (calls.append("late"), done.set()))
+    scheduler.call_later(0.05, lambda: calls.append("early"))
+    assert done.wait(timeout=5)
+    assert calls == ["early", "late"]
+    assert scheduler.pending() == 0
+
+
+def test_deadline_scheduler_cancel():
+    scheduler = DeadlineScheduler(thread_name="frd-deadlines-test")
+    done = threading.Event()
+    calls = []
+    scheduler.call_later(0.05, lambda: calls.append("cancelled")).cancel()
+    scheduler.call_later(0.1, done.set)
+    assert done.wait(timeout=5)
+    assert calls == []
+    assert scheduler.pending() == 0
@@ -0,0 +1,50 @@
+import threading
+
+from fred.future.executor._pool import PoolExecutor
+from fred.future.executor.catalog import ExecutorCatalog
+
+
+def test_pool_executor_bounded_workers():
+    executor = PoolExecutor(max_workers=2)
+    release = threading.Event()
+    tasks = [executor.submit(lambda: release.wait(5)) for _ in range(5)]
+    stats = executor.stats()
+    assert stats["workers"] <= 2
+    assert stats["submitted"] == 5
+    release.set()
+    assert all(task.result(timeout=5) for task in tasks)
+    stats = executor.stats()
+    assert stats["completed"] == 5
+    assert stats["queued"] == 0
+    assert stats["active"] == 0
+    executor.shutdown()
+
+
+def test_pool_executor_nested_submit_does_not_deadlock():
+    executor = PoolExecutor(max_workers=1)
+
+    def outer():
+        return executor.submit(lambda: 41).result(timeout=5) + 1
+
+    assert executor.submit(outer).result(timeout=5) == 42
+    assert executor.stats()["inline"] == 1
+    executor.shutdown()
+
+
+def test_pool_executor_propagates_exceptions():
+    executor = PoolExecutor(max_workers=1)
+
+    def fail():
+        raise ValueError("boom")
+
+    task = executor.submit(fail)
+    assert isinstance(task.exception(timeout=5), ValueError)
+    assert executor.stats()["failed"] == 1
+    executor.shutdown()
+
+
+def test_executor_catalog_resolve():
+    assert ExecutorCatalog.resolve("pool") is ExecutorCatalog.POOL.shared()
+    assert ExecutorCatalog.resolve(ExecutorCatalog.DAEMON) is ExecutorCatalog.DAEMON.shared()
+    executor = PoolExecutor(max_workers=1)
+    assert ExecutorCatalog.resolve(executor) is executor
@@ -0,0 +1,117 @@
+import threading
+
+from fred.future.impl import Future
+from fred.future.executor._pool import PoolExecutor
+from fred.monad.catalog import EitherMonad
+
+
+def test_future_map_chain_does_not_park_threads():
+    executor = PoolExecutor(max_workers=4)
+    release = threading.Event()
+    future = Future(lambda: release.wait(5) and 1, executor=executor)
+    for _ in range(10):
+        future = future.map(lambda value: value + 1)
+    # Only the root future is running; continuations are not scheduled until it completes
+    assert executor.stats()["submitted"] == 1
+    release.set()
+    assert future.wait_and_resolve(timeout=5) == 11
+    assert executor.stats()["submitted"] == 11
+    executor.shutdown()
+
+
+def test_future_map_propagates_failure():
+    future = Future(lambda: 1 / 0).map(lambda value: value + 1)
+    match future.wait(timeout=5):
+        case EitherMonad.Left(exception=exception):
+            assert isinstance(exception, ZeroDivisionError)
+        case other:
+            raise AssertionError(f"Expected a Left value: {other}")
+
+
+def test_future_flat_map():
+    future = Future(lambda: 3).flat_map(lambda value: Future(lambda: value * 10))
+    assert future.wait_and_resolve(timeout=5) == 30
+    # Functions returning a non-future value fail the chained future (i.e., instead of never settling)
+    match Future(lambda: 3).flat_map(lambda value: value * 10).wait(timeout=5):
+        case EitherMonad.Left(exception=exception):
+            assert isinstance(exception, TypeError)
+        case other:
+            raise AssertionError(f"Expected a Left value: {other}")
+
+
+def test_future_flat_map_timeout_shares_one_thread():
+    executor, blocked = PoolExecutor(max_workers=2), PoolExecutor(max_workers=2)
+    release = threading.Event()
+    threads = threading.active_count()
+    futures = [
+        Future(lambda: 3, executor=executor).flat_map(
+            lambda value: Future(lambda: release.wait(5) and value, executor=blocked),
+            timeout=0.2,
+        )
+        for _ in range(20)
+    ]
+    # The timeouts are tracked by the shared deadline scheduler (i.e., no timer thread per call)
+    assert threading.active_count() - threads < 10
+    for future in futures:
+        match future.wait(timeout=5):
+            case EitherMonad.Left(exception=exception):
+                assert isinstance(exception, TimeoutError)
+            case other:
+                raise AssertionError(f"Expected a Left value: {other}")
+    release.set()
+    executor.shutdown()
+    blocked.shutdown()
+
+
+def test_future_map_fused():
+    future = Future(lambda: 3)
+    assert future.map_fused(lambda v: v + 1, lambda v: v * 2).wait_and_resolve(timeout=5) == 8
+    fused = future.map_fused(lambda v: v + 1, lambda v: v * 2, persist_intermediate=True)
+    assert fused.wait_and_resolve(timeout=5) == 8
+
+
+def test_future_non_json_output():
+    future = Future(lambda: (1, b"bytes"))
+    assert future.wait_and_resolve(timeout=5) == (1, b"bytes")
+    assert future.state == "DEFINED:SUCCESS"
+
+
+def test_future_subscribe_stdlib_broadcast():
+    import time
+
+    future = Future(lambda: (time.sleep(0.3), 42)[1], broadcast=True)
+    time.sleep(0.05)
+    # The completion is pushed through the in-process pub/sub broker (i.e., no polling)
+    assert Future.subscribe(future_id=future.future_id).wait_and_resolve(timeout=5) == 42
+
+
+def test_future_subscribe_race_free(monkeypatch):
+    import time
+    from fred.future.result import FutureResult
+
+    future = Future(lambda: (time.sleep(0.1), 42)[1], broadcast=True)
+    stale = FutureResult.from_backend(future_id=future.future_id)
+    from_backend = FutureResult.from_backend
+
+    def delayed(future_id: str):
+        # The future completes (and broadcasts) between the subscription and the state check
+        future.wait(timeout=5)
+        return stale if future_id == future.future_id else from_backend(future_id=future_id)
+
+    monkeypatch.setattr(FutureResult, "from_backend", delayed)
+    start = time.perf_counter()
+    assert Future.subscribe(future_id=future.future_id).wait_and_resolve(timeout=5) == 42
+    # Resolved by the buffered broadcast message (i.e., not by the periodic state re-check)
+    assert time.perf_counter() - start < 2
+
+
+def test_future_subscribe_timeout():
+    import time
+
+    future = Future(lambda: (time.sleep(2), 42)[1], broadcast=True)
+    time.sleep(0.05)
+    match Future.subscribe(future_id=future.future_id, timeout=0.2).wait(timeout=5):
+        case EitherMonad.Left(exception):
+            assert isinstance(exception, TimeoutError)
+        case other:
+            raise AssertionError(f"Expected a Left value: {other}")
@@ -0,0 +1,59 @@
+import asyncio
+
+from fred.future.impl import Future
+from fred.future.impl_async import AsyncFuture
+
+
+def test_async_future_gather_and_map():
+    async def double(value: int) -> int:
+        await asyncio.sleep(0.01)
+        return value * 2
+
+    async def main():
+        futures = [AsyncFuture(double, value=i).map(lambda v: v + 1) for i in range(50)]
+        return await asyncio.gather(*futures)
+
+    assert asyncio.run(main()) == [i * 2 + 1 for i in range(50)]
+
+
+def test_async_future_failure_raises():
+    async def fail():
+        raise ZeroDivisionError("boom")
+
+    async def main():
+        return await AsyncFuture(fail)
+
+    try:
+        asyncio.run(main())
+    except ZeroDivisionError:
+        pass
+    else:
+        raise AssertionError("Expected ZeroDivisionError")
+
+
+def test_async_future_from_future_and_subscribe():
+    future = Future(lambda: 42)
+
+    async def main():
+        wrapped = await AsyncFuture.from_future(future)
+        subscribed = await AsyncFuture.subscribe(future_id=future.future_id).wait_and_resolve(timeout=5)
+        return wrapped, subscribed
+
+    assert asyncio.run(main()) == (42, 42)
+
+
+def test_async_future_subscribe_broadcast_and_timeout():
+    import time
+
+    async def main():
+        completed = Future(lambda: (time.sleep(0.2), "done")[1], broadcast=True)
+        stuck = Future(lambda: (time.sleep(2), "late")[1], broadcast=True)
+        await asyncio.sleep(0.05)
+        value = await AsyncFuture.subscribe(future_id=completed.future_id, timeout=5)
+        try:
+            await AsyncFuture.subscribe(future_id=stuck.future_id, timeout=0.2)
+        except TimeoutError:
+            return value
+        raise AssertionError("Expected a TimeoutError")
+
+    assert asyncio.run(main()) == "done"
@@ -0,0 +1,95 @@
+from fred.future.impl import Future
+from fred.future.result import FutureResult, FutureLayout
+
+
+def test_future_hash_layout(monkeypatch):
+    monkeypatch.setattr(FutureResult, "layout", FutureLayout.HASH)
+    future = Future(lambda: {"value": 1})
+    assert future.wait_and_resolve(timeout=5) == {"value": 1}
+    record = FutureResult._get_record_key(future_id=future.future_id).hgetall()
+    assert set(record) == {"status", "obj", "output"}
+    assert record["status"].startswith("DEFINED:SUCCESS")
+    assert future.state == "DEFINED:SUCCESS"
+    # No per-field keys are written with the HASH layout
+    assert FutureResult._get_status_key(future_id=future.future_id).get() is None
+
+
+def test_future_layout_fallback_reader(monkeypatch):
+    future = Future(lambda: 3)
+    assert future.wait_and_resolve(timeout=5) == 3
+    monkeypatch.setattr(FutureResult, "layout", FutureLayout.HASH)
+    # The other layout is only read while migrating (i.e., a single round-trip per read otherwise)
+    assert FutureResult.fetch_status(future_id=future.future_id) is None
+    # Records written with the KEYS layout remain readable after switching layouts
+    monkeypatch.setattr(FutureResult, "layout_fallback", True)
+    assert FutureResult.fetch_status(future_id=future.future_id).startswith("DEFINED:SUCCESS")
+    assert FutureResult.from_backend(future_id=future.future_id).value.resolve() == 3
+
+
+def test_future_read_many_and_wait_results(monkeypatch):
+    import time
+    from fred.future.utils import wait_future_results
+
+    done = Future(lambda: 1)
+    done.wait(timeout=5)
+    monkeypatch.setattr(FutureResult, "layout", FutureLayout.HASH)
+    monkeypatch.setattr(FutureResult, "layout_fallback", True)
+    slow = Future(lambda: (time.sleep(0.3), 2)[1], broadcast=True)
+    stuck = Future(lambda: (time.sleep(3), 3)[1], broadcast=True)
+    records = FutureResult.read_many([done.future_id, slow.future_id, "missing"], "status")
+    # Mixed layouts are read in bulk (the KEYS record through the fallback reader)
+    assert records[done.future_id][0].startswith("DEFINED:SUCCESS")
+    assert records[slow.future_id][0].startswith("UNDEFINED")
+    assert records["missing"] == [None]
+    start = time.perf_counter()
+    results = list(wait_future_results([stuck.future_id, slow.future_id, done.future_id], timeout=1))
+    # Results are yielded in completion order; the pending ones time out
+    assert [future_id for future_id, _ in results] == [done.future_id, slow.future_id, stuck.future_id]
+    assert [value.resolve() for _, value in results[:2]] == [1, 2]
+    assert isinstance(results[2][1].exception, TimeoutError)
+    assert time.perf_counter() - start < 2
+
+
+def test_future_wait_results_missing():
+    import time
+    import asyncio
+    from fred.future.utils import wait_future_results, await_future_results
+
+    done = Future(lambda: 1)
+    done.wait(timeout=5)
+
+    future_ids, kwargs = ["missing", done.future_id], {"recheck": 0.1, "missing_rechecks": 2}
+
+    async def collect() -> list:
+        return [item async for item in await_future_results(future_ids, **kwargs)]
+
+    # Unknown (or expired) IDs are reported after the re-reads instead of being awaited indefinitely
+    start = time.perf_counter()
+    for results in (list(wait_future_results(future_ids, **kwargs)), asyncio.run(collect())):
+        assert [future_id for future_id, _ in results] == [done.future_id, "missing"]
+        assert isinstance(results[1][1].exception, ValueError)
+    assert time.perf_counter() - start < 2
+
+
+def test_future_defined_records_cache(monkeypatch):
+    import time
+    from fred.dao.comp._cache import FredKeyValCache
+    from fred.future.result import _is_defined_record
+
+    cache = FredKeyValCache(maxsize=100, ttl=None)
+    cache.cacheable = lambda key, value: _is_defined_record(cache=cache, key=key, value=value)
+    monkeypatch.setattr(FutureResult, "keyval", FutureResult.keyval.with_cache(cache=cache))
+    for layout in FutureLayout:
+        monkeypatch.setattr(FutureResult, "layout", layout)
+        cache.clear()
+        pending = Future(lambda: (time.sleep(0.3), 1)[1])
+        # Undefined records are never cached
+        assert pending.state.startswith("UNDEFINED")
+        assert cache.stats()["size"] == 0
+        assert pending.wait_and_resolve(timeout=5) == 1
+        hits = cache.stats()["hits"]
+        # Hot reads of the defined record are served locally
+        assert pending.getwhatevernow().resolve() == 1
+        assert pending.state == "DEFINED:SUCCESS"
+        assert cache.stats()["hits"] > hits
+    assert FutureResult.cache_stats()["size"] > 0
@@ -0,0 +1,39 @@
+import json
+
+from fred.worker.runner.client import RunnerClient
+
+
+def test_runner_client_send_many(tmp_path):
+    client = RunnerClient.auto(queue_slug="test-send-many", service_name="STDLIB")
+    client.req_queue.clear()
+    items = ({"value": i} for i in range(5))
+    request_ids = list(client.send_many(items, chunk_size=2, req_uuid_hash=True, item_uuid_hash=True))
+    assert len(set(request_ids)) == 5
+    requests = [json.loads(request) for request in client.req_queue.pop_many(n=10)]
+    assert [request["request_id"] for request in requests] == request_ids
+    assert [request["value"] for request in requests] == list(range(5))
+    assert all(request["item_id"] and request["item_created_at"] for request in requests)
+    client.req_queue.clear()
+    # Items streamed from a JSONL file; explicit request IDs are preserved
+    path = tmp_path / "items.jsonl"
+    path.write_text("\n".join(json.dumps({"request_id": f"req-{i}", "value": i}) for i in range(3)) + "\n")
+    assert list(client.send_many(str(path))) == ["req-0", "req-1", "req-2"]
+    assert client.req_queue.size() == 3
+
+
+def test_runner_client_futures_layouts(monkeypatch):
+    from fred.future import Future
+    from fred.future.result import FutureResult, FutureLayout
+
+    client = RunnerClient.auto(queue_slug="test-futures", service_name="STDLIB")
+    keys = Future(lambda: 1)
+    keys.wait(timeout=5)
+    monkeypatch.setattr(FutureResult, "layout", FutureLayout.HASH)
+    record = Future(lambda: 2)
+    record.wait(timeout=5)
+    # Only the keys of the read layouts are scanned (i.e., both of them while migrating)
+    futures = client.futures()
+    assert futures[f"frd:future:{record.future_id}:status"].startswith("DEFINED:SUCCESS")
+    assert f"frd:future:{keys.future_id}:status" not in futures
+    monkeypatch.setattr(FutureResult, "layout_fallback", True)
+    assert f"frd:future:{keys.future_id}:status" in client.futures()
@@ -0,0 +1,157 @@
+import json
+
+import pytest
+
+from fred.dao.service.catalog import ServiceCatalog
+from fred.worker.interface import HandlerInterface
+from fred.worker.runner.handler import RunnerHandler
+
+
+def test_runner_loop_stop_signal_requeues_pending_items():
+    catalog = ServiceCatalog.STDLIB.component_catalog()
+    req_queue = catalog.QUEUE.value(name="test:runner:req")
+    res_queue = catalog.QUEUE.value(name="test:runner:res")
+    for message in [json.dumps({"request_id": "test-runner-loop", "value": 1}), "STOP", "PENDING"]:
+        req_queue.add(message)
+    meta = RunnerHandler()._runner_loop(
+        runner=HandlerInterface(),
+        req_queue=req_queue,
+        lifespan=10,
+        timeout=5,
+        res_queue=res_queue,
+    )
+    assert meta["total_elapsed_seconds"] < 5
+    assert res_queue.size() == 1
+    # The message sent after the STOP signal remains in the queue
+    assert req_queue.pop_many(n=10) == ["PENDING"]
+
+
+def test_runner_loop_idle_timeout():
+    req_queue = ServiceCatalog.STDLIB.component_catalog().QUEUE.value(name="test:runner:idle")
+    meta = RunnerHandler()._runner_loop(
+        runner=HandlerInterface(),
+        req_queue=req_queue,
+        lifespan=10,
+        timeout=0.3,
+    )
+    assert 0.3 <= meta["idle_seconds"] < 2
+
+
+class SleepyHandler(HandlerInterface):
+
+    def handler(self, payload: dict) -> dict:
+        import time
+        time.sleep(payload["sleep"])
+        return {"index": payload["index"]}
+
+
+def test_runner_loop_concurrency_ordered():
+    import time
+
+    catalog = ServiceCatalog.STDLIB.component_catalog()
+    req_queue = catalog.QUEUE.value(name="test:runner:concurrent:req")
+    res_queue = catalog.QUEUE.value(name="test:runner:concurrent:res")
+    for index, sleep in enumerate([0.4, 0.1, 0.3, 0.2]):
+        req_queue.add(json.dumps({"request_id": f"test-runner-concurrent-{index}", "index": index, "sleep": sleep}))
+    req_queue.add("STOP")
+    start = time.perf_counter()
+    RunnerHandler()._runner_loop(
+        runner=SleepyHandler(),
+        req_queue=req_queue,
+        lifespan=10,
+        timeout=5,
+        res_queue=res_queue,
+        concurrency=4,
+        ordered=True,
+    )
+    # Items are processed concurrently (sequential processing would take 1s)
+    assert time.perf_counter() - start < 0.9
+    outputs = [json.loads(item) for item in res_queue.pop_many(n=10)]
+    assert [output["response"]["index"] for output in outputs] == [0, 1, 2, 3]
+
+
+def test_runner_loop_ordered_does_not_spin():
+    import time
+
+    catalog = ServiceCatalog.STDLIB.component_catalog()
+    req_queue = catalog.QUEUE.value(name="test:runner:spin:req")
+    res_queue = catalog.QUEUE.value(name="test:runner:spin:res")
+    # The head item is still running while the later one is already done
+    for index, sleep in enumerate([0.8, 0.01]):
+        req_queue.add(json.dumps({"request_id": f"test-runner-spin-{index}", "index": index, "sleep": sleep}))
+    req_queue.add("STOP")
+    start = time.process_time()
+    RunnerHandler()._runner_loop(
+        runner=SleepyHandler(),
+        req_queue=req_queue,
+        lifespan=10,
+        timeout=5,
+        res_queue=res_queue,
+        concurrency=2,
+        ordered=True,
+    )
+    # Waiting on the head item only (i.e., no busy-spinning on the completed one)
+    assert time.process_time() - start < 0.4
+    assert res_queue.size() == 2
+
+
+def test_runner_loop_reliable_acknowledges_requests():
+    catalog = ServiceCatalog.STDLIB.component_catalog()
+    req_queue = catalog.QUEUE.value(name="test:runner:reliable:req")
+    for message in [json.dumps({"request_id": "test-runner-reliable", "value": 1}), "PING", "STOP", "PENDING"]:
+        req_queue.add(message)
+    RunnerHandler()._runner_loop(
+        runner=HandlerInterface(),
+        req_queue=req_queue,
+        lifespan=10,
+        timeout=5,
+        consumer="test-runner-reliable",
+    )
+    assert req_queue.processing(consumer="test-runner-reliable") == []
+    assert req_queue.pop_many(n=10) == ["PENDING"]
+
+
+def test_runner_loop_reliable_acknowledges_after_result():
+    class UnavailableQueue:
+
+        def add(self, item: str) -> None:
+            raise ConnectionError("Response queue unavailable")
+
+    req_queue = ServiceCatalog.STDLIB.component_catalog().QUEUE.value(name="test:runner:reliable:unacked")
+    message = json.dumps({"request_id": "test-runner-unacked", "value": 1})
+    req_queue.add(message)
+    with pytest.raises(ConnectionError):
+        RunnerHandler()._runner_loop(
+            runner=HandlerInterface(),
+            req_queue=req_queue,
+            lifespan=10,
+            timeout=5,
+            res_queue=UnavailableQueue(),
+            consumer="test-runner-unacked",
+        )
+    # The result was never pushed; the request remains claimed (i.e., redelivered after the visibility timeout)
+    assert req_queue.processing(consumer="test-runner-unacked") == [message]
+    req_queue.ack(consumer="test-runner-unacked", item=message)
+
+
+def test_weighted_queue_group_scheduling():
+    from fred.worker.runner.scheduler import WeightedQueueGroup
+
+    queue = ServiceCatalog.STDLIB.component_catalog().QUEUE.value
+    group = WeightedQueueGroup.from_weights(queue=queue, weights={"test:wrr:interactive": 3, "test:wrr:batch": 1})
+    interactive, batch = group.queues
+    for i in range(8):
+        interactive.add(f"i{i}")
+        batch.add(f"b{i}")
+    picks = [group.pop_many(n=1)[0][0] for _ in range(8)]
+    # Smooth weighted round-robin: 3 interactive fetches per batch fetch (evenly interleaved)
+    assert picks == ["i", "i", "b", "i", "i", "i", "b", "i"]
+    assert group.pop_many(n=10) == ["i6", "i7"]
+    # Work-conserving: the batch queue takes the whole capacity once the interactive one is drained
+    assert group.pop_many(n=10) == ["b2", "b3", "b4", "b5", "b6", "b7"]
+    # Claimed items are acknowledged against their source queue
+    batch.add("b8")
+    assert group.claim_many(consumer="test-wrr", n=5, timeout=1) == ["b8"]
+    assert batch.processing(consumer="test-wrr") == ["b8"]
+    assert group.ack(consumer="test-wrr", item="b8")
+    assert group.pop_many(n=1, timeout=0.2) == []
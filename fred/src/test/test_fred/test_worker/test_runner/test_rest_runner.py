@@ -0,0 +1,164 @@
+import json
+import asyncio
+
+import pytest
+
+from fred.worker.runner.rest.router._runner import _iter_json_items
+from fred.worker.runner.rest.router.catalog import RouterCatalog
+
+
+async def stream(body: bytes, size: int):
+    for start in range(0, len(body), size):
+        yield body[start:start + size]
+
+
+async def parse(body: bytes, size: int = 3) -> list:
+    return [item async for item in _iter_json_items(stream(body, size=size))]
+
+
+def test_iter_json_items_formats():
+    items = [{"value": i, "text": "ñandú"} for i in range(4)]
+    ndjson = "".join(json.dumps(item, ensure_ascii=False) + "\n" for item in items).encode()
+    array = json.dumps(items, ensure_ascii=False, indent=2).encode()
+    # Small chunks split the items (and the multi-byte characters) across reads
+    assert asyncio.run(parse(ndjson)) == items
+    assert asyncio.run(parse(array)) == items
+    assert asyncio.run(parse(b"  ")) == []
+    with pytest.raises(ValueError):
+        asyncio.run(parse(ndjson + b'{"value": '))
+    # Invalid items fail right away (i.e., not only at the end of the body) along with malformed arrays
+    for body in [b'{"value" 1}' + ndjson, b'[{"value": 1}]]{"value": 2}', b'[{"value": 1}', b'[{"value": 1},]']:
+        with pytest.raises(ValueError):
+            asyncio.run(parse(body))
+    assert asyncio.run(parse(b'[{"text": "a \\"quoted\\" text", "flag": true}, {"ratio": -1.5e3}]', size=1)) == [
+        {"text": 'a "quoted" text', "flag": True},
+        {"ratio": -1500.0},
+    ]
+
+
+def test_runner_execute_batch():
+    router = RouterCatalog.RUNNER.auto(service_name="STDLIB", disable_runner_reuse=True)
+    router_cls = type(router)
+    queue = router.runner_backend.queue("req:test-execute-batch")
+    queue.clear()
+
+    async def execute(body: bytes) -> list[dict]:
+        response = await router_cls.runner_execute_batch._og(
+            router_cls,
+            body=stream(body, size=7),
+            queue_slug="test-execute-batch",
+            chunk_size="2",
+        )
+        return [json.loads(line) async for block in response.body_iterator for line in block.splitlines()]
+
+    body = b"".join(json.dumps({"request_id": f"batch-{i}", "value": i}).encode() + b"\n" for i in range(5))
+    assert [line["request_id"] for line in asyncio.run(execute(body))] == [f"batch-{i}" for i in range(5)]
+    assert [json.loads(item)["value"] for item in queue.pop_many(n=10)] == list(range(5))
+    # Invalid items interrupt the dispatch; the requests dispatched before are reported along with the error
+    *dispatched, error = asyncio.run(execute(b'{"value": 1}\n{"value": 2}\n[1]\n{"value": 3}\n'))
+    assert len(dispatched) == 2 and error["dispatched"] == 2
+    assert queue.size() == 2
+    queue.clear()
+
+
+def test_runner_output_nonblocking_and_stream():
+    import time
+    from fred.future import Future
+
+    router = RouterCatalog.RUNNER.auto(service_name="STDLIB", disable_runner_reuse=True)
+    router_cls = type(router)
+    done = Future(lambda: {"value": 1})
+    done.wait(timeout=5)
+    slow = Future(lambda: (time.sleep(0.3), 2)[1], broadcast=True)
+    failed = Future(lambda: 1 / 0, broadcast=True)
+
+    async def output(request_id: str) -> dict:
+        return await router_cls.runner_output._og(router_cls, request_id=request_id, nonblocking="true")
+
+    finished, running = asyncio.run(output(done.future_id)), asyncio.run(output(slow.future_id))
+    assert finished["ready"] and finished["ok"] and finished["output"] == {"value": 1}
+    assert finished["status"] == "DEFINED:SUCCESS"
+    assert not running["ready"] and running["status"].startswith("UNDEFINED")
+    assert asyncio.run(output("missing"))["status"] is None
+
+    async def stream(**kwargs) -> str:
+        response = await router_cls.runner_outputs_stream._og(router_cls, **kwargs)
+        return "".join([block async for block in response.body_iterator])
+
+    lines = asyncio.run(stream(request_ids=f"{slow.future_id},{done.future_id},{failed.future_id}", timeout="5"))
+    results = {result["request_id"]: result for result in map(json.loads, lines.splitlines())}
+    assert results[done.future_id]["output"] == {"value": 1}
+    assert results[slow.future_id]["output"] == 2
+    assert not results[failed.future_id]["ok"] and "ZeroDivisionError" in results[failed.future_id]["error"]
+    # The non-streaming counterpart collects the same results
+    outputs = asyncio.run(router_cls.runner_outputs._og(router_cls, request_ids=[done.future_id, slow.future_id]))
+    assert [result["output"] for result in outputs["results"]] == [{"value": 1}, 2]
+    # Server-Sent Events (requested via the 'Accept' header); pending requests time out
+    stuck = Future(lambda: (time.sleep(3), 3)[1], broadcast=True)
+    events = asyncio.run(stream(request_ids=[stuck.future_id], timeout=0.3, accept="text/event-stream"))
+    assert events.startswith(f"event: result\nid: {stuck.future_id}\ndata: ") and "TimeoutError" in events
+    assert "event: end" in events
+    # Queue slug: the results pushed into the response queue are streamed until the timeout
+    res_queue = router.runner_backend.queue("res:test-stream")
+    res_queue.add(json.dumps({"ok": True, "id": "a"}))
+    lines = asyncio.run(stream(queue_slug="test-stream", timeout=0.3))
+    assert [json.loads(line)["output"]["id"] for line in lines.splitlines()] == ["a"]
+    assert res_queue.size() == 0
+
+    async def disconnect(**kwargs) -> str:
+        response = await router_cls.runner_outputs_stream._og(router_cls, **kwargs)
+        block = await anext(response.body_iterator)
+        # The client disconnects while the chunk is being sent (i.e., before the stream resumes)
+        await response.body_iterator.aclose()
+        return block
+
+    res_queue.add_many([json.dumps({"ok": True, "id": "b"}), json.dumps({"ok": True, "id": "c"})])
+    assert asyncio.run(disconnect(queue_slug="test-stream", timeout=5)).count("\n") == 2
+    # The results of the interrupted chunk are handed back in order
+    assert [json.loads(item)["id"] for item in res_queue.pop_many(n=10)] == ["b", "c"]
+
+
+def test_runner_execute_priority():
+    from fastapi import FastAPI
+
+    router = RouterCatalog.RUNNER.auto(service_name="STDLIB", disable_runner_reuse=True)
+    app = FastAPI()
+    app.include_router(router.router, prefix="/runner")
+    queue = router.runner_backend.queue("req:test-execute-priority")
+    queue.clear()
+
+    async def execute(query: str, headers: list[tuple[bytes, bytes]]) -> tuple[int, dict]:
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "POST",
+            "scheme": "http",
+            "path": "/runner/execute",
+            "raw_path": b"/runner/execute",
+            "query_string": query.encode(),
+            "headers": [(b"content-type", b"application/json"), *headers],
+        }
+        messages = [{"type": "http.request", "body": b'{"value": 1}', "more_body": False}]
+        response = {}
+
+        async def receive() -> dict:
+            return messages.pop(0) if messages else {"type": "http.disconnect"}
+
+        async def send(message: dict) -> None:
+            match message["type"]:
+                case "http.response.start":
+                    response["status"] = message["status"]
+                case "http.response.body":
+                    response["body"] = response.get("body", b"") + message.get("body", b"")
+
+        await app(scope, receive, send)
+        return response["status"], json.loads(response["body"])
+
+    # The standard 'Priority' header (RFC 9218) is not mistaken for the request priority
+    status, _ = asyncio.run(execute("queue_slug=test-execute-priority", headers=[(b"priority", b"u=1, i")]))
+    assert status == 200 and queue.size() == 1
+    status, output = asyncio.run(execute("queue_slug=test-execute-priority&priority=high", headers=[]))
+    assert status == 400 and "priority" in output["detail"]
+    assert queue.size() == 1
+    queue.clear()